@@ -27,7 +27,7 @@ def main():
 
         # Get database configuration
         logger.info("Loading PostgreSQL configuration...")
-        postgres_config = PostgresConfig()
+        postgres_config = PostgresConfig.instance()
 
         logger.info(
             f"Connecting to PostgreSQL at {postgres_config.host}:{postgres_config.port}"
@@ -40,6 +40,7 @@ def main():
             database_url=database_url,
             pool_size=postgres_config.pool_size,
             max_overflow=postgres_config.max_overflow,
+            pool_timeout=postgres_config.pool_timeout,
         )
 
         # Test connection
@@ -12,30 +12,69 @@ __version__ = "2.3.0"
 __author__ = "Sourav Singh"
 __license__ = "MIT"
 
-# Import core components
-from servers.base_client import (
-    BaseClient,
-    handle_errors,
-    validate_non_empty,
-    validate_positive_int,
-)
-from servers.config import (
-    BaseConfig,
-    CacheServerConfig,
-    ConfigurationError,
-    FrappeConfig,
-    GitHubConfig,
-    InternetConfig,
-    JiraConfig,
-    RedisConfig,
-    load_env_file,
-    validate_config,
-)
-from servers.logging_config import (
-    log_server_shutdown,
-    log_server_startup,
-    setup_logging,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from servers.base_client import (
+        BaseClient,
+        handle_errors,
+        validate_non_empty,
+        validate_positive_int,
+    )
+    from servers.config import (
+        BaseConfig,
+        CacheServerConfig,
+        ConfigurationError,
+        FrappeConfig,
+        GitHubConfig,
+        InternetConfig,
+        JiraConfig,
+        RedisConfig,
+        load_env_file,
+        validate_config,
+    )
+    from servers.logging_config import (
+        log_server_shutdown,
+        log_server_startup,
+        setup_logging,
+    )
+
+# Core components are imported on first access so that starting one server
+# (e.g. `python -m servers.bash_server`) doesn't pay for every submodule's
+# imports and config classes up front.
+_LAZY_EXPORTS = {
+    "BaseClient": "servers.base_client",
+    "handle_errors": "servers.base_client",
+    "validate_non_empty": "servers.base_client",
+    "validate_positive_int": "servers.base_client",
+    "BaseConfig": "servers.config",
+    "CacheServerConfig": "servers.config",
+    "ConfigurationError": "servers.config",
+    "FrappeConfig": "servers.config",
+    "GitHubConfig": "servers.config",
+    "InternetConfig": "servers.config",
+    "JiraConfig": "servers.config",
+    "RedisConfig": "servers.config",
+    "load_env_file": "servers.config",
+    "validate_config": "servers.config",
+    "log_server_shutdown": "servers.logging_config",
+    "log_server_startup": "servers.logging_config",
+    "setup_logging": "servers.logging_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve package-level exports lazily (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'servers' has no attribute '{name}'")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 # Package metadata
 __all__ = [
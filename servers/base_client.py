@@ -4,16 +4,23 @@ Base client class with retry logic, error handling, rate limiting, and connectio
 """
 import json
 import logging
+import time
 from functools import wraps
-from typing import Any, Callable, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, ParamSpec, TypeVar, Union
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+if TYPE_CHECKING:
+    import httpx
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Either transport's response; both expose status_code, headers, json() and text
+Response = Union[requests.Response, "httpx.Response"]
+
 
 class RetryStrategy:
     """Configurable retry strategy."""
@@ -27,9 +34,20 @@ class RetryStrategy:
         self.total = total
         self.backoff_factor = backoff_factor
         self.status_forcelist = status_forcelist
+        self._retry: Retry | None = None
+
+    def backoff(self, retry_number: int) -> float:
+        """Seconds to wait before the given retry (1-based), as urllib3 does."""
+        return self.backoff_factor * (2 ** (retry_number - 1))
 
     def get_retry(self) -> Retry:
-        """Get urllib3 Retry object."""
+        """Get urllib3 Retry object (built once; Retry is never mutated in place)."""
+        if self._retry is None:
+            self._retry = self._build_retry()
+        return self._retry
+
+    def _build_retry(self) -> Retry:
+        """Build urllib3 Retry object."""
         return Retry(
             total=self.total,
             backoff_factor=self.backoff_factor,
@@ -46,6 +64,9 @@ class RetryStrategy:
         )
 
 
+_DEFAULT_RETRY_STRATEGY = RetryStrategy()
+
+
 class BaseClient:
     """Base client with common functionality for all API integrations."""
 
@@ -57,24 +78,40 @@ class BaseClient:
         logger: logging.Logger | None = None,
         pool_connections: int = 10,
         pool_maxsize: int = 20,
+        transport: str = "requests",
     ) -> None:
+        if transport not in ("requests", "httpx"):
+            raise ValueError(
+                f"Unsupported transport '{transport}'. Use 'requests' or 'httpx'"
+            )
+
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
+        self.transport = transport
+        self.retry_strategy = (
+            _DEFAULT_RETRY_STRATEGY
+            if max_retries == _DEFAULT_RETRY_STRATEGY.total
+            else RetryStrategy(total=max_retries)
+        )
 
-        # Initialize session with retry strategy and connection pooling
-        self.session = self._create_session()
+        # Initialize session with retry strategy and connection pooling.
+        # The httpx client exposes the same headers/request/close surface.
+        self.session: Any = (
+            self._create_http2_client()
+            if transport == "httpx"
+            else self._create_session()
+        )
 
     def _create_session(self) -> requests.Session:
         """Create requests session with retry logic and connection pooling."""
         session = requests.Session()
 
-        retry_strategy = RetryStrategy(total=self.max_retries)
         adapter = HTTPAdapter(
-            max_retries=retry_strategy.get_retry(),
+            max_retries=self.retry_strategy.get_retry(),
             pool_connections=self.pool_connections,
             pool_maxsize=self.pool_maxsize,
         )
@@ -84,7 +121,37 @@ class BaseClient:
 
         return session
 
-    def _parse_error_response(self, response: requests.Response) -> str:
+    def _create_http2_client(self) -> "httpx.Client":
+        """
+        Create an httpx client that multiplexes requests over one HTTP/2 connection.
+
+        Redirects are followed like requests does; retries on 429/5xx responses
+        are done per request in _make_httpx_request.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "transport='httpx' requires httpx. Install: pip install 'httpx[http2]'"
+            ) from e
+
+        return httpx.Client(
+            timeout=self.timeout,
+            follow_redirects=True,
+            transport=self._create_httpx_transport(),
+        )
+
+    def _create_httpx_transport(self) -> "httpx.BaseTransport":
+        """Create the pooled HTTP/2 transport (retries failed connects only)."""
+        import httpx
+
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize,
+            max_keepalive_connections=self.pool_connections,
+        )
+        return httpx.HTTPTransport(http2=True, limits=limits, retries=self.max_retries)
+
+    def _parse_error_response(self, response: Response) -> str:
         """
         Parse error response. Override this method in subclasses for custom error parsing.
 
@@ -121,9 +188,7 @@ class BaseClient:
         except Exception:
             return response.text[:500]
 
-    def _make_request(
-        self, method: str, endpoint: str, **kwargs: Any
-    ) -> requests.Response:
+    def _make_request(self, method: str, endpoint: str, **kwargs: Any) -> Response:
         """
         Make HTTP request with error handling.
 
@@ -146,6 +211,9 @@ class BaseClient:
 
         self.logger.debug(f"{method} {url}")
 
+        if self.transport == "httpx":
+            return self._make_httpx_request(method, url, **kwargs)
+
         response: requests.Response | None = None
 
         try:
@@ -178,19 +246,68 @@ class BaseClient:
             self.logger.error(f"Unexpected error: {str(e)}")
             raise
 
-    def get(self, endpoint: str, **kwargs: Any) -> requests.Response:
+    def _make_httpx_request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> "httpx.Response":
+        """
+        Make HTTP request over the httpx client.
+
+        httpx exceptions are re-raised as their requests equivalents so callers
+        and handle_errors see the same error types for either transport.
+        Responses with a status in the retry strategy's status_forcelist are
+        retried with the same backoff (and Retry-After) as the requests path;
+        once retries run out the last response raises HTTPError.
+        """
+        import httpx
+
+        strategy = self.retry_strategy
+        for retry_number in range(strategy.total + 1):
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except httpx.TimeoutException as e:
+                self.logger.error(f"Request timeout: {url}")
+                raise requests.exceptions.Timeout(str(e)) from e
+            except httpx.TransportError as e:
+                self.logger.error(f"Connection error: {url}")
+                raise requests.exceptions.ConnectionError(str(e)) from e
+
+            if (
+                response.status_code not in strategy.status_forcelist
+                or retry_number == strategy.total
+            ):
+                break
+            delay = _retry_after(response)
+            if delay is None:
+                delay = strategy.backoff(retry_number + 1)
+            self.logger.debug(
+                f"Retrying {method} {url} after {response.status_code} in {delay}s"
+            )
+            response.close()
+            time.sleep(delay)
+
+        if response.is_error:
+            error_msg = self._parse_error_response(response)
+            self.logger.error(f"HTTP error {response.status_code}: {error_msg}")
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} - {error_msg}", response=response
+            )
+
+        self.logger.debug(f"Response: {response.status_code}")
+        return response
+
+    def get(self, endpoint: str, **kwargs: Any) -> Response:
         """Make GET request."""
         return self._make_request("GET", endpoint, **kwargs)
 
-    def post(self, endpoint: str, **kwargs: Any) -> requests.Response:
+    def post(self, endpoint: str, **kwargs: Any) -> Response:
         """Make POST request."""
         return self._make_request("POST", endpoint, **kwargs)
 
-    def put(self, endpoint: str, **kwargs: Any) -> requests.Response:
+    def put(self, endpoint: str, **kwargs: Any) -> Response:
         """Make PUT request."""
         return self._make_request("PUT", endpoint, **kwargs)
 
-    def delete(self, endpoint: str, **kwargs: Any) -> requests.Response:
+    def delete(self, endpoint: str, **kwargs: Any) -> Response:
         """Make DELETE request."""
         return self._make_request("DELETE", endpoint, **kwargs)
 
@@ -209,6 +326,14 @@ class BaseClient:
         self.close()
 
 
+def _retry_after(response: "httpx.Response") -> float | None:
+    """Seconds from a numeric Retry-After header on 429/503 responses, if any."""
+    if response.status_code not in (429, 503):
+        return None
+    value = response.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else None
+
+
 def handle_errors(
     logger: logging.Logger | None = None,
 ) -> Callable[[Callable[P, R]], Callable[P, str]]:
@@ -223,13 +348,17 @@ def handle_errors(
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, str]:
+        # Resolved once per decorated function rather than on every call
+        _logger = logger or logging.getLogger(func.__module__)
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> str:
-            _logger = logger or logging.getLogger(func.__module__)
-
             try:
                 result = func(*args, **kwargs)
-                return result if isinstance(result, str) else json.dumps(result)
+                # Tools normally return JSON strings already; only encode otherwise
+                if type(result) is str:
+                    return result
+                return json.dumps(result)
 
             except requests.exceptions.Timeout:
                 error_msg = f"Request timeout in {func.__name__}"
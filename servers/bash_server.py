@@ -9,6 +9,8 @@ Python >=3.10 compatible
 import asyncio
 import json
 import os
+import re
+import shlex
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +37,9 @@ logger = setup_logging("BashServer", log_file=log_file)
 load_env_file()
 mcp = FastMCP("Bash Execution Server")
 
+# Characters that need /bin/sh to interpret (pipes, redirects, quoting, globs, ...)
+_HAS_SHELL_META = re.compile(r"[|&;<>()$`\\\"'*?!#~{}\[\]=\n\r]")
+
 
 class BashExecutorClient:
     """Bash command execution client with security and error handling."""
@@ -50,6 +55,10 @@ class BashExecutorClient:
         self.logger = logger
         self.default_cwd = str(Path.home())
 
+        # Baseline environment used when a command supplies an env overlay
+        self._base_env: Dict[str, str] = {}
+        self.refresh_base_env()
+
         # Define restricted commands that should never be executed
         self.restricted_commands = [
             "rm -rf /",  # Dangerous deletion
@@ -71,6 +80,46 @@ class BashExecutorClient:
             "init 6",  # System reboot
         ]
 
+    def refresh_base_env(self) -> None:
+        """Re-snapshot os.environ as the baseline for per-command env overlays."""
+        self._base_env = dict(os.environ)
+
+    async def _spawn(
+        self, command: str, cwd: str, env: Optional[Dict[str, str]]
+    ) -> asyncio.subprocess.Process:
+        """
+        Start a command, bypassing /bin/sh when it has no shell syntax.
+
+        Args:
+            command: Command to start
+            cwd: Working directory
+            env: Full environment for the child (None = inherit)
+
+        Returns:
+            The started process
+        """
+        if not _HAS_SHELL_META.search(command):
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *shlex.split(command),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                    env=env,
+                )
+            except (FileNotFoundError, PermissionError):
+                # Shell builtins (cd, export, ...) and missing commands go
+                # through the shell so output matches the regular path
+                pass
+
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+
     def _validate_command(self, command: str) -> None:
         """
         Validate command for security and safety.
@@ -153,6 +202,7 @@ class BashExecutorClient:
         cwd: Optional[str] = None,
         timeout: int = 30,
         env: Optional[Dict[str, str]] = None,
+        timestamp: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Execute a bash command with proper error handling and security.
@@ -162,6 +212,7 @@ class BashExecutorClient:
             cwd: Working directory (optional)
             timeout: Command timeout in seconds
             env: Environment variables to set
+            timestamp: ISO timestamp to record (defaults to completion time)
 
         Returns:
             Dictionary with execution results
@@ -199,21 +250,13 @@ class BashExecutorClient:
                     "command": command,
                 }
 
-            # Prepare environment
-            exec_env = os.environ.copy()
-            if env:
-                exec_env.update(env)
+            # Prepare environment (None lets the child inherit os.environ directly)
+            exec_env = {**self._base_env, **env} if env else None
 
             self.logger.info(f"Executing command: '{command}' in '{working_path}'")
 
             # Execute command
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(working_path),
-                env=exec_env,
-            )
+            process = await self._spawn(command, str(working_path), exec_env)
 
             try:
                 stdout, stderr = await asyncio.wait_for(
@@ -241,7 +284,7 @@ class BashExecutorClient:
                 "stderr": stderr_text,
                 "command": command,
                 "cwd": str(working_path),
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now().isoformat(),
             }
 
             # Add helpful suggestions for common errors
@@ -307,6 +350,7 @@ class BashExecutorClient:
         """
         results = []
         working_dir = cwd or self.default_cwd
+        batch_ts = datetime.now().isoformat()
 
         for i, cmd in enumerate(commands):
             if isinstance(cmd, dict):
@@ -318,7 +362,9 @@ class BashExecutorClient:
                 cmd_cwd = working_dir
                 timeout = 30
 
-            result = await self.execute_command(command, cmd_cwd, timeout)
+            result = await self.execute_command(
+                command, cmd_cwd, timeout, timestamp=batch_ts
+            )
             result["index"] = i
             results.append(result)
 
@@ -334,7 +380,7 @@ class BashExecutorClient:
             "successful": success_count,
             "failed": len(commands) - success_count,
             "results": results,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": batch_ts,
         }
 
     async def check_directory(self, path: str) -> Dict[str, Any]:
@@ -4,278 +4,417 @@ Configuration management for MCP servers.
 Handles environment variables, validation, and defaults.
 """
 
+import ipaddress
 import os
-import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, ClassVar, Mapping, TypeVar
+from urllib.parse import urlsplit
+
+_DEFAULT_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+_ENV_LOADED = False
 
 
 def load_env_file(env_path: Path | None = None) -> None:
-    """Load environment variables from .env file."""
+    """Load environment variables from .env file (the default file only once)."""
+    global _ENV_LOADED
+
+    if env_path is None:
+        if _ENV_LOADED:
+            return
+        env_path = _DEFAULT_ENV_PATH
+
     try:
         from dotenv import load_dotenv
+    except ImportError:
+        return
 
-        if env_path is None:
-            project_root = Path(__file__).parent.parent
-            env_path = project_root / ".env"
+    if env_path.exists():
+        load_dotenv(env_path)
 
-        if env_path.exists():
-            load_dotenv(env_path)
-            return
+    if env_path == _DEFAULT_ENV_PATH:
+        _ENV_LOADED = True
 
-    except ImportError:
-        pass
 
+# Live view of the process environment (not a copy, so values loaded from
+# .env after import are still seen); .get skips the os.getenv call layer.
+_ENV: Mapping[str, str] = os.environ
 
-def is_valid_url(url: str) -> bool:
-    """Validate URL format."""
-    url_pattern = re.compile(
-        r"^https?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
-        r"localhost|"  # localhost
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # or IP
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
+# GitHub personal access token prefixes (classic and fine-grained)
+_GITHUB_CLASSIC_PREFIX = "ghp_"
+_GITHUB_FINE_GRAINED_PREFIX = "github_pat_"
+
+
+def _env_str(name: str, default: str | None) -> str | None:
+    """Read a string environment variable."""
+    return _ENV.get(name, default)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable."""
+    value = _ENV.get(name)
+    return default if value is None else int(value)
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float environment variable."""
+    value = _ENV.get(name)
+    return default if value is None else float(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable (only "true", any case, is truthy)."""
+    value = _ENV.get(name)
+    return default if value is None else value.lower() == "true"
+
+
+_ENV_READERS: dict[str, Callable[[str, Any], Any]] = {
+    "str": _env_str,
+    "int": _env_int,
+    "float": _env_float,
+    "bool": _env_bool,
+}
+
+_MISSING = object()
+
+T = TypeVar("T")
+
+
+def _env_field(env_var: str, default: Any, kind: str = "str") -> Any:
+    """Declare a config field populated from an environment variable."""
+    reader = _ENV_READERS[kind]
+    return field(
+        default_factory=lambda: reader(env_var, default),
+        metadata={"env": (env_var, default, kind)},
     )
-    return url_pattern.match(url) is not None
 
 
-@dataclass
+def _env_init(cls: type[T]) -> type[T]:
+    """
+    Replace a config dataclass __init__ with one that defers env reads.
+
+    The dataclass-generated __init__ calls every default_factory up front; the
+    generated replacement only stores arguments passed explicitly, and
+    BaseConfig.__getattr__ reads each remaining field from the environment on
+    first access. __post_init__ still runs, so fields it validates are read
+    at construction as before.
+    """
+    cls._ENV_FIELDS = {  # type: ignore[attr-defined]
+        f.name: f.metadata["env"] for f in fields(cls)  # type: ignore[arg-type]
+    }
+    params = []
+    body = []
+    for name in cls._ENV_FIELDS:  # type: ignore[attr-defined]
+        params.append(f"{name}=_MISSING")
+        body.append(f"    if {name} is not _MISSING: _setattr(self, {name!r}, {name})")
+    if hasattr(cls, "__post_init__"):
+        body.append("    self.__post_init__()")
+
+    source = f"def __init__(self, {', '.join(params)}):\n" + "\n".join(
+        body or ["    pass"]
+    )
+    namespace: dict[str, Any] = {}
+    exec(
+        source,
+        {
+            "_MISSING": _MISSING,
+            # Configs are frozen, so bypass the raising __setattr__ like dataclass does
+            "_setattr": object.__setattr__,
+        },
+        namespace,
+    )
+
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__doc__ = f"Initialize {cls.__name__} from environment variables."
+    cls.__init__ = init  # type: ignore[misc]
+    return cls
+
+
+def _strip_trailing_slash(url: str) -> str:
+    """Remove trailing slashes, leaving the common no-slash case untouched."""
+    return url.rstrip("/") if url.endswith("/") else url
+
+
+@lru_cache(maxsize=256)
+def _url_scheme(url: str) -> str | None:
+    """
+    Parse a URL once and return its scheme if it is a valid http/https URL.
+
+    Valid URLs have a domain, localhost or IP host and an optional numeric port.
+    """
+    try:
+        parts = urlsplit(url)
+        parts.port  # raises ValueError for a malformed port
+    except ValueError:
+        return None
+
+    host = parts.hostname
+    if parts.scheme not in ("http", "https") or not host or " " in url:
+        return None
+    if host == "localhost" or "." in host:
+        return parts.scheme
+
+    try:
+        ipaddress.ip_address(host)
+        return parts.scheme
+    except ValueError:
+        return None
+
+
+def is_valid_url(url: str) -> bool:
+    """Validate URL format (http/https with a domain, localhost or IP host)."""
+    return _url_scheme(url) is not None
+
+
+@dataclass(frozen=True, slots=True)
 class BaseConfig:
     """Base configuration class."""
 
+    # Required field names, shared by all instances of a config class
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ()
+    _PUBLIC_FIELDS: ClassVar[tuple[str, ...] | None] = None
+    # Field name -> (env var, default, kind), filled in by _env_init
+    _ENV_FIELDS: ClassVar[dict[str, tuple[str, Any, str]]] = {}
+
+    @classmethod
+    @cache
+    def instance(cls: type[T]) -> T:
+        """
+        Return the process-wide config built from the environment.
+
+        Configs are frozen and env vars don't change over a server's lifetime,
+        so each class is constructed (and validated for URL/token format) once.
+        """
+        return cls()
+
+    def __getattr__(self, name: str) -> Any:
+        """Read an env-backed field on first access and keep it on the instance."""
+        spec = self._ENV_FIELDS.get(name)
+        if spec is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        env_var, default, kind = spec
+        value = _ENV_READERS[kind](env_var, default)
+        object.__setattr__(self, name, value)
+        return value
+
     def validate(self) -> tuple[bool, list[str]]:
         """Validate configuration. Returns (is_valid, errors)."""
         errors: list[str] = []
-        required_fields = self.get_required_fields()
 
-        for field_name in required_fields:
+        for field_name in self.get_required_fields():
             value = getattr(self, field_name, None)
             if not value:
                 errors.append(f"Missing required field: {field_name}")
 
         return len(errors) == 0, errors
 
-    def get_required_fields(self) -> list[str]:
-        """Override in subclasses to specify required fields."""
-        return []
+    def get_required_fields(self) -> tuple[str, ...]:
+        """Set _REQUIRED_FIELDS or override in subclasses to specify required fields."""
+        return self._REQUIRED_FIELDS
+
+    @classmethod
+    def _public_fields(cls) -> tuple[str, ...]:
+        """Public dataclass field names, computed once per class."""
+        names: tuple[str, ...] | None = cls.__dict__.get("_PUBLIC_FIELDS")
+        if names is None:
+            names = tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+            cls._PUBLIC_FIELDS = names
+        return names
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary."""
-        return {
-            key: value
-            for key, value in self.__dict__.items()
-            if not key.startswith("_")
-        }
+        return {key: getattr(self, key) for key in self._public_fields()}
 
 
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class FrappeConfig(BaseConfig):
     """Frappe server configuration."""
 
-    site_url: str = field(default_factory=lambda: os.getenv("FRAPPE_SITE_URL", ""))
-    api_key: str = field(default_factory=lambda: os.getenv("FRAPPE_API_KEY", ""))
-    api_secret: str = field(default_factory=lambda: os.getenv("FRAPPE_API_SECRET", ""))
-    timeout: int = field(default_factory=lambda: int(os.getenv("FRAPPE_TIMEOUT", "30")))
-    max_retries: int = field(
-        default_factory=lambda: int(os.getenv("FRAPPE_MAX_RETRIES", "3"))
-    )
-    pool_connections: int = field(
-        default_factory=lambda: int(os.getenv("FRAPPE_POOL_CONNECTIONS", "5"))
-    )
-    pool_maxsize: int = field(
-        default_factory=lambda: int(os.getenv("FRAPPE_POOL_MAXSIZE", "10"))
-    )
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("site_url", "api_key", "api_secret")
 
-    def __post_init__(self) -> None:
-        self.site_url = self.site_url.rstrip("/")
-        if self.site_url and not is_valid_url(self.site_url):
-            raise ValueError(f"Invalid FRAPPE_SITE_URL: {self.site_url}")
+    site_url: str = _env_field("FRAPPE_SITE_URL", "")
+    api_key: str = _env_field("FRAPPE_API_KEY", "")
+    api_secret: str = _env_field("FRAPPE_API_SECRET", "")
+    timeout: int = _env_field("FRAPPE_TIMEOUT", 30, "int")
+    max_retries: int = _env_field("FRAPPE_MAX_RETRIES", 3, "int")
+    pool_connections: int = _env_field("FRAPPE_POOL_CONNECTIONS", 5, "int")
+    pool_maxsize: int = _env_field("FRAPPE_POOL_MAXSIZE", 10, "int")
 
-    def get_required_fields(self) -> list[str]:
-        return ["site_url", "api_key", "api_secret"]
+    def __post_init__(self) -> None:
+        site_url = _strip_trailing_slash(self.site_url)
+        if site_url and _url_scheme(site_url) is None:
+            raise ValueError(f"Invalid FRAPPE_SITE_URL: {site_url}")
+        object.__setattr__(self, "site_url", site_url)
 
 
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class GoalAgentConfig(BaseConfig):
     """Goal agent configuration."""
 
-    max_workers: int = field(
-        default_factory=lambda: int(os.getenv("GOAL_AGENT_MAX_WORKERS", "5"))
-    )
-    timeout: int = field(
-        default_factory=lambda: int(os.getenv("GOAL_AGENT_TIMEOUT", "30"))
-    )
-    cache_enabled: bool = field(
-        default_factory=lambda: os.getenv("CACHE_ENABLED", "true").lower() == "true"
-    )
-
-    def get_required_fields(self) -> list[str]:
-        return []
+    max_workers: int = _env_field("GOAL_AGENT_MAX_WORKERS", 5, "int")
+    timeout: int = _env_field("GOAL_AGENT_TIMEOUT", 30, "int")
+    cache_enabled: bool = _env_field("CACHE_ENABLED", True, "bool")
 
 
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class GitHubConfig(BaseConfig):
     """GitHub server configuration."""
 
-    token: str = field(
-        default_factory=lambda: os.getenv("GITHUB_PERSONAL_ACCESS_TOKEN", "")
-    )
-    timeout: int = field(default_factory=lambda: int(os.getenv("GITHUB_TIMEOUT", "30")))
-    max_retries: int = field(
-        default_factory=lambda: int(os.getenv("GITHUB_MAX_RETRIES", "3"))
-    )
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("token",)
+
+    token: str = _env_field("GITHUB_PERSONAL_ACCESS_TOKEN", "")
+    timeout: int = _env_field("GITHUB_TIMEOUT", 30, "int")
+    max_retries: int = _env_field("GITHUB_MAX_RETRIES", 3, "int")
     # ADD THIS FIELD:
-    default_branch: str = field(
-        default_factory=lambda: os.getenv("GITHUB_DEFAULT_BRANCH", "main")
-    )
+    default_branch: str = _env_field("GITHUB_DEFAULT_BRANCH", "main")
 
     def __post_init__(self) -> None:
-        if self.token and not self.token.startswith(("ghp_", "github_pat_")):
+        token = self.token
+        if (
+            token
+            and not token.startswith(_GITHUB_CLASSIC_PREFIX)
+            and not token.startswith(_GITHUB_FINE_GRAINED_PREFIX)
+        ):
             raise ValueError(
                 "Invalid GitHub token format (should start with 'ghp_' or 'github_pat_')"
             )
 
-    def get_required_fields(self) -> list[str]:
-        return ["token"]
 
-
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class JiraConfig(BaseConfig):
     """Jira server configuration."""
 
-    base_url: str = field(default_factory=lambda: os.getenv("JIRA_BASE_URL", ""))
-    email: str = field(default_factory=lambda: os.getenv("JIRA_EMAIL", ""))
-    api_token: str = field(default_factory=lambda: os.getenv("JIRA_API_TOKEN", ""))
-    project_key: str = field(default_factory=lambda: os.getenv("JIRA_PROJECT_KEY", ""))
-    timeout: int = field(default_factory=lambda: int(os.getenv("JIRA_TIMEOUT", "30")))
-    max_retries: int = field(
-        default_factory=lambda: int(os.getenv("JIRA_MAX_RETRIES", "3"))
-    )
-    rate_limit_delay: float = field(
-        default_factory=lambda: float(os.getenv("JIRA_RATE_LIMIT_DELAY", "0.5"))
-    )
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("base_url", "email", "api_token")
+
+    base_url: str = _env_field("JIRA_BASE_URL", "")
+    email: str = _env_field("JIRA_EMAIL", "")
+    api_token: str = _env_field("JIRA_API_TOKEN", "")
+    project_key: str = _env_field("JIRA_PROJECT_KEY", "")
+    timeout: int = _env_field("JIRA_TIMEOUT", 30, "int")
+    max_retries: int = _env_field("JIRA_MAX_RETRIES", 3, "int")
+    rate_limit_delay: float = _env_field("JIRA_RATE_LIMIT_DELAY", 0.5, "float")
 
     def __post_init__(self) -> None:
-        self.base_url = self.base_url.rstrip("/")
-        if self.base_url and not is_valid_url(self.base_url):
-            raise ValueError(f"Invalid JIRA_BASE_URL: {self.base_url}")
-        if self.base_url and not self.base_url.startswith("https://"):
-            raise ValueError("JIRA_BASE_URL must use HTTPS")
+        base_url = _strip_trailing_slash(self.base_url)
+        if base_url:
+            # One (cached) parse yields both validity and the scheme
+            scheme = _url_scheme(base_url)
+            if scheme is None:
+                raise ValueError(f"Invalid JIRA_BASE_URL: {base_url}")
+            if scheme != "https":
+                raise ValueError("JIRA_BASE_URL must use HTTPS")
+        object.__setattr__(self, "base_url", base_url)
+
         if self.email and "@" not in self.email:
             raise ValueError(f"Invalid JIRA_EMAIL format: {self.email}")
 
-    def get_required_fields(self) -> list[str]:
-        return ["base_url", "email", "api_token"]
 
-
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class InternetConfig(BaseConfig):
     """Internet/search server configuration."""
 
-    google_api_key: str = field(default_factory=lambda: os.getenv("GOOGLE_API_KEY", ""))
-    search_engine_id: str = field(
-        default_factory=lambda: os.getenv("GOOGLE_SEARCH_ENGINE_ID", "")
-    )
-    timeout: int = field(default_factory=lambda: int(os.getenv("GOOGLE_TIMEOUT", "15")))
-    max_retries: int = field(
-        default_factory=lambda: int(os.getenv("GOOGLE_MAX_RETRIES", "3"))
-    )
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("google_api_key", "search_engine_id")
 
-    def get_required_fields(self) -> list[str]:
-        return ["google_api_key", "search_engine_id"]
+    google_api_key: str = _env_field("GOOGLE_API_KEY", "")
+    search_engine_id: str = _env_field("GOOGLE_SEARCH_ENGINE_ID", "")
+    timeout: int = _env_field("GOOGLE_TIMEOUT", 15, "int")
+    max_retries: int = _env_field("GOOGLE_MAX_RETRIES", 3, "int")
 
 
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class RedisConfig(BaseConfig):
     """Redis server configuration."""
 
-    host: str = field(default_factory=lambda: os.getenv("REDIS_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("REDIS_PORT", "6379")))
-    db: int = field(default_factory=lambda: int(os.getenv("REDIS_DB", "0")))
-    password: str | None = field(default_factory=lambda: os.getenv("REDIS_PASSWORD"))
-    decode_responses: bool = field(
-        default_factory=lambda: os.getenv("REDIS_DECODE_RESPONSES", "true").lower()
-        == "true"
-    )
-    socket_timeout: int = field(
-        default_factory=lambda: int(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
-    )
-    socket_connect_timeout: int = field(
-        default_factory=lambda: int(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))
-    )
-    max_connections: int = field(
-        default_factory=lambda: int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
-    )
-    retry_on_timeout: bool = field(
-        default_factory=lambda: os.getenv("REDIS_RETRY_ON_TIMEOUT", "true").lower()
-        == "true"
-    )
-    health_check_interval: int = field(
-        default_factory=lambda: int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
-    )
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("host", "port")
 
-    def get_required_fields(self) -> list[str]:
-        return ["host", "port"]
+    host: str = _env_field("REDIS_HOST", "localhost")
+    port: int = _env_field("REDIS_PORT", 6379, "int")
+    db: int = _env_field("REDIS_DB", 0, "int")
+    password: str | None = _env_field("REDIS_PASSWORD", None)
+    decode_responses: bool = _env_field("REDIS_DECODE_RESPONSES", True, "bool")
+    socket_timeout: int = _env_field("REDIS_SOCKET_TIMEOUT", 5, "int")
+    socket_connect_timeout: int = _env_field("REDIS_SOCKET_CONNECT_TIMEOUT", 5, "int")
+    max_connections: int = _env_field("REDIS_MAX_CONNECTIONS", 50, "int")
+    retry_on_timeout: bool = _env_field("REDIS_RETRY_ON_TIMEOUT", True, "bool")
+    health_check_interval: int = _env_field("REDIS_HEALTH_CHECK_INTERVAL", 30, "int")
 
 
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class PostgresConfig(BaseConfig):
     """PostgreSQL database configuration."""
 
-    host: str = field(default_factory=lambda: os.getenv("POSTGRES_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("POSTGRES_PORT", "5432")))
-    database: str = field(default_factory=lambda: os.getenv("POSTGRES_DB", "mcp_goals"))
-    user: str = field(default_factory=lambda: os.getenv("POSTGRES_USER", "postgres"))
-    password: str = field(default_factory=lambda: os.getenv("POSTGRES_PASSWORD", ""))
-    pool_size: int = field(
-        default_factory=lambda: int(os.getenv("POSTGRES_POOL_SIZE", "10"))
-    )
-    max_overflow: int = field(
-        default_factory=lambda: int(os.getenv("POSTGRES_MAX_OVERFLOW", "20"))
-    )
-    ssl_mode: str = field(
-        default_factory=lambda: os.getenv("POSTGRES_SSL_MODE", "prefer")
-    )
+    _REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("host", "port", "database", "user")
+
+    host: str = _env_field("POSTGRES_HOST", "localhost")
+    port: int = _env_field("POSTGRES_PORT", 5432, "int")
+    database: str = _env_field("POSTGRES_DB", "mcp_goals")
+    user: str = _env_field("POSTGRES_USER", "postgres")
+    password: str = _env_field("POSTGRES_PASSWORD", "")
+    pool_size: int = _env_field("POSTGRES_POOL_SIZE", 20, "int")
+    max_overflow: int = _env_field("POSTGRES_MAX_OVERFLOW", 10, "int")
+    pool_timeout: int = _env_field("POSTGRES_POOL_TIMEOUT", 30, "int")
+    ssl_mode: str = _env_field("POSTGRES_SSL_MODE", "prefer")
+    prewarm: bool = _env_field("POSTGRES_PREWARM", False, "bool")
 
     def get_connection_string(self) -> str:
         """Get PostgreSQL connection string."""
         password_part = f":{self.password}" if self.password else ""
         return f"postgresql://{self.user}{password_part}@{self.host}:{self.port}/{self.database}?sslmode={self.ssl_mode}"
 
-    def get_required_fields(self) -> list[str]:
-        return ["host", "port", "database", "user"]
-
 
-@dataclass
+@_env_init
+@dataclass(frozen=True, slots=True)
 class CacheServerConfig(BaseConfig):
     """Cache server configuration for goal agent."""
 
-    url: str = field(
-        default_factory=lambda: os.getenv("CACHE_SERVER_URL", "http://localhost:8001")
-    )
-    timeout: int = field(
-        default_factory=lambda: int(os.getenv("CACHE_SERVER_TIMEOUT", "5"))
-    )
-    enabled: bool = field(
-        default_factory=lambda: os.getenv("CACHE_ENABLED", "true").lower() == "true"
-    )
+    url: str = _env_field("CACHE_SERVER_URL", "http://localhost:8001")
+    timeout: int = _env_field("CACHE_SERVER_TIMEOUT", 5, "int")
+    enabled: bool = _env_field("CACHE_ENABLED", True, "bool")
 
     def __post_init__(self) -> None:
-        self.url = self.url.rstrip("/")
-        if self.url and not is_valid_url(self.url):
-            raise ValueError(f"Invalid CACHE_SERVER_URL: {self.url}")
+        url = _strip_trailing_slash(self.url)
+        if url and _url_scheme(url) is None:
+            raise ValueError(f"Invalid CACHE_SERVER_URL: {url}")
+        object.__setattr__(self, "url", url)
 
-    def get_required_fields(self) -> list[str]:
-        return [] if not self.enabled else ["url"]
+    def get_required_fields(self) -> tuple[str, ...]:
+        return ("url",) if self.enabled else ()
 
 
 class ConfigurationError(Exception):
-    """Raised when configuration is invalid."""
+    """
+    Raised when configuration is invalid.
 
-    pass
+    Accepts either a ready-made message or the list of validation errors; in
+    the latter case the message is only formatted when the error is rendered.
+    """
+
+    def __init__(self, errors: list[str] | str) -> None:
+        super().__init__(errors)
+        if isinstance(errors, str):
+            self.errors: list[str] = []
+            self._message: str | None = errors
+        else:
+            self.errors = list(errors)
+            self._message = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = "Configuration validation failed:\n" + "\n".join(
+                [f"  - {err}" for err in self.errors]
+            )
+        return self._message
 
 
 def validate_config(config: BaseConfig, logger: Any = None) -> None:
@@ -292,9 +431,7 @@ def validate_config(config: BaseConfig, logger: Any = None) -> None:
     is_valid, errors = config.validate()
 
     if not is_valid:
-        error_msg = "Configuration validation failed:\n" + "\n".join(
-            f"  - {err}" for err in errors
-        )
+        error = ConfigurationError(errors)
         if logger:
-            logger.error(error_msg)
-        raise ConfigurationError(error_msg)
+            logger.error(str(error))
+        raise error
@@ -5,30 +5,88 @@ Provides a web interface for monitoring MCP servers, Redis cache, goals, and log
 """
 
 import asyncio
+import hashlib
+import importlib.util
 import json
-import logging
 import os
+import re
+import signal
+import subprocess
 import sys
 import time
+from collections import defaultdict, deque
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Set
 
 import psutil
-import redis
+import redis.asyncio as aioredis
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None  # type: ignore[assignment]
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from servers.config import PostgresConfig, RedisConfig, load_env_file
-from servers.database import DatabaseManager
+from servers.database import (
+    CHANGE_NOTIFY_CHANNEL,
+    DEFAULT_PAGE_SIZE,
+    AsyncDatabaseManager,
+    DatabaseManager,
+    decode_cursor,
+    encode_cursor,
+)
+from servers.logging_config import setup_logging
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode datetimes the way orjson does for the stdlib fallback."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, using orjson when available.
+
+    datetime values are encoded natively as ISO 8601 strings.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    )
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 # Pydantic models for request validation
@@ -57,31 +115,63 @@ STATIC_DIR = SERVERS_DIR / "static"
 
 # Load environment
 load_env_file()
+logger = setup_logging("DashboardServer", console_level="INFO")
+
+
+class ThreadedDatabase:
+    """Async facade over the sync DatabaseManager, used when asyncpg is missing.
+
+    Every method of the wrapped manager becomes a coroutine that runs it in a
+    worker thread, so handlers can await the same API either way.
+    """
+
+    def __init__(self, db: DatabaseManager) -> None:
+        self._db = db
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._db, name)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return call
+
 
 # Initialize database manager for goal/task access
-_db_manager: Optional[DatabaseManager] = None
+_db_manager: Optional[AsyncDatabaseManager | ThreadedDatabase] = None
 
 
-def get_db_manager() -> Optional[DatabaseManager]:
-    """Get or create database manager for accessing goals/tasks."""
+def get_db_manager() -> Optional[AsyncDatabaseManager | ThreadedDatabase]:
+    """Get or create the async database manager for accessing goals/tasks."""
     global _db_manager
     if _db_manager is None:
         try:
-            postgres_config = PostgresConfig()
+            postgres_config = PostgresConfig.instance()
             database_url = postgres_config.get_connection_string()
-            _db_manager = DatabaseManager(
-                database_url=database_url,
-                pool_size=5,  # Smaller pool for dashboard
-                max_overflow=10,
-            )
+            pool_options = {
+                "pool_size": postgres_config.pool_size,
+                "max_overflow": postgres_config.max_overflow,
+                "pool_timeout": postgres_config.pool_timeout,
+            }
+            if importlib.util.find_spec("asyncpg"):
+                _db_manager = AsyncDatabaseManager(database_url, **pool_options)
+            else:
+                _db_manager = ThreadedDatabase(
+                    DatabaseManager(
+                        database_url, application_name="mcp-dashboard", **pool_options
+                    )
+                )
         except Exception as e:
-            print(f"Warning: Could not initialize database manager: {e}")
+            logger.warning(f"Could not initialize database manager: {e}")
             return None
     return _db_manager
 
 
-# Background task reference
+# Background task references
 broadcast_task = None
+log_watch_task = None
+system_stats_task = None
+db_listen_task = None
 
 # Server definitions (from mcpctl.py)
 SERVERS = {
@@ -123,27 +213,94 @@ SERVERS = {
     },
 }
 
+# String form of each log path, computed once for payloads and path lookups
+for _srv in SERVERS.values():
+    _srv["log_str"] = str(_srv["log"])
+
+# Environment snapshot for the SERVERS env vars; rebuilt via /api/env/refresh
+# or SIGHUP
+ENV_STATE: Dict[str, str] = {}
+ENV_ALL_SET: Dict[str, bool] = {}
+
+
+def refresh_env_snapshot() -> None:
+    """Snapshot the SERVERS env vars so handlers don't re-read os.environ."""
+    ENV_STATE.clear()
+    ENV_STATE.update(
+        {
+            var: os.environ.get(var) or ""
+            for srv in SERVERS.values()
+            for var in srv["env_vars"]
+        }
+    )
+    ENV_ALL_SET.clear()
+    ENV_ALL_SET.update(
+        {
+            key: all(ENV_STATE[var] for var in srv["env_vars"])
+            for key, srv in SERVERS.items()
+        }
+    )
+
+
+refresh_env_snapshot()
+
+
+def _reload_env_snapshot() -> None:
+    """SIGHUP handler: re-read the env var snapshot and push it to clients."""
+    logger.info("SIGHUP received, refreshing environment snapshot")
+    refresh_env_snapshot()
+    notify_dashboard_change()
+
+
+def _set_sighup_handler(loop: asyncio.AbstractEventLoop, install: bool) -> None:
+    """Install or remove the SIGHUP env reload handler where supported."""
+    if not hasattr(signal, "SIGHUP"):
+        return  # Windows
+    try:
+        if install:
+            loop.add_signal_handler(signal.SIGHUP, _reload_env_snapshot)
+        else:
+            loop.remove_signal_handler(signal.SIGHUP)
+    except (NotImplementedError, RuntimeError, ValueError):
+        pass  # Not the main thread or loop has no signal support
+
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan - startup and shutdown."""
-    global broadcast_task
+    global broadcast_task, log_watch_task, system_stats_task, db_listen_task
 
     # Startup
-    print("Starting background tasks...")
+    # Prime cpu_percent (host and per server process) so later non-blocking
+    # calls measure a real interval
+    psutil.cpu_percent(interval=None)
+    find_server_processes()
+    get_db_manager()
+    _set_sighup_handler(asyncio.get_running_loop(), install=True)
+    logger.info("Starting background tasks...")
+    system_stats_task = asyncio.create_task(sample_system_stats())
     broadcast_task = asyncio.create_task(broadcast_updates())
+    db_listen_task = asyncio.create_task(listen_for_db_changes())
+    if awatch is not None:
+        log_watch_task = asyncio.create_task(watch_logs())
 
     yield
 
     # Shutdown
-    print("Stopping background tasks...")
-    if broadcast_task:
-        broadcast_task.cancel()
-        try:
-            await broadcast_task
-        except asyncio.CancelledError:
-            pass
+    logger.info("Stopping background tasks...")
+    _set_sighup_handler(asyncio.get_running_loop(), install=False)
+    for task in (broadcast_task, log_watch_task, system_stats_task, db_listen_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    if _redis_client is not None:
+        await _redis_client.aclose()
+    if _db_manager is not None:
+        await _db_manager.close()
 
 
 # Initialize FastAPI
@@ -152,6 +309,7 @@ app = FastAPI(
     description="Real-time monitoring for MCP servers, Redis cache, and goal tracking",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS middleware
@@ -164,55 +322,170 @@ app.add_middleware(
 )
 
 # Redis client cache
-_redis_client: Optional[redis.Redis] = None
+_redis_client: Optional[aioredis.Redis] = None
+
+# WebSocket broadcast limits
+BROADCAST_SEND_TIMEOUT = 5.0  # seconds per client
+CLIENT_SEND_QUEUE_SIZE = 4  # pending messages per client; oldest dropped
+# Sections of a dashboard update; clients may subscribe to a subset
+DASHBOARD_SECTIONS = ("status", "servers", "goals", "logs")
+BROADCAST_POLL_INTERVAL = 1.0  # seconds between refreshes without change events
+BROADCAST_MIN_INTERVAL = 0.1  # seconds; coalesces bursts of change events
+
+
+def epoch_ms() -> int:
+    """Current time as integer milliseconds since the epoch (JS Date value)."""
+    return time.time_ns() // 1_000_000
+
+
+def _digest(text: str) -> bytes:
+    """Return a short blake2b fingerprint of serialized JSON."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
 
 
 # WebSocket Connection Manager
 class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
+    """Manages WebSocket connections for real-time updates.
+
+    Each connection gets a bounded send queue drained by its own writer task,
+    so a slow client only delays (and drops) its own messages.
+    """
 
     def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self.subscriptions: Dict[WebSocket, Set[str]] = {}
+        # Digest, text and sections of the last "update" broadcast, for
+        # deduplication and for greeting new clients without a fresh collect
+        self.last_hash: Optional[bytes] = None
+        self.last_payload: Optional[str] = None
+        self.last_sections: Set[str] = set()
+        self.last_has_system_stats = False
 
     async def connect(self, websocket: WebSocket):
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.add(websocket)
-        print(f"✓ New WebSocket connection. Total: {len(self.active_connections)}")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_SEND_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self.subscriptions[websocket] = set(DASHBOARD_SECTIONS)
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        logger.info(f"New WebSocket connection. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        """Remove a WebSocket connection."""
-        self.active_connections.discard(websocket)
-        print(f"✗ WebSocket disconnected. Total: {len(self.active_connections)}")
+        """Remove a WebSocket connection and stop its writer."""
+        if self.active_connections.pop(websocket, None) is None:
+            return
+        self.subscriptions.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
+
+    def subscribe(self, websocket: WebSocket, sections: Any) -> None:
+        """Limit a client's updates to the given sections (unknown ones ignored)."""
+        if websocket in self.subscriptions and isinstance(sections, list):
+            self.subscriptions[websocket] = set(DASHBOARD_SECTIONS).intersection(
+                sections
+            )
+
+    def needed_sections(self) -> Set[str]:
+        """Sections wanted by at least one connected client."""
+        return set().union(*self.subscriptions.values())
+
+    def send(self, websocket: WebSocket, text: str) -> None:
+        """Queue pre-serialized text for one client."""
+        queue = self.active_connections.get(websocket)
+        if queue is not None:
+            self._enqueue(queue, text)
 
     async def broadcast(self, message: dict):
         """Send a message to all connected clients."""
         if not self.active_connections:
             return
 
-        disconnected = set()
-        for connection in self.active_connections:
+        # Serialize once for all clients; sent as a text frame for JSON.parse
+        self._send_all(json_dumps(message))
+
+    async def broadcast_update(
+        self,
+        data_text: str,
+        sections: Optional[Set[str]] = None,
+        has_system_stats: bool = False,
+    ) -> bool:
+        """Broadcast an "update" message unless data matches the last one sent.
+
+        Args:
+            data_text: Dashboard data already serialized to JSON.
+            sections: Dashboard sections included in data_text.
+            has_system_stats: Whether the status section carries host stats.
+
+        Returns True if the update was queued for the clients.
+        """
+        digest = _digest(data_text)
+        if digest == self.last_hash:
+            return False
+
+        text = f'{{"type":"update","data":{data_text},"timestamp":{epoch_ms()}}}'
+        self.last_hash = digest
+        self.last_payload = text
+        self.last_sections = set(sections or ())
+        self.last_has_system_stats = has_system_stats
+        self._send_all(text)
+        return True
+
+    def reset_last_update(self) -> None:
+        """Forget the last broadcast so the next update is always sent."""
+        self.last_hash = None
+        self.last_payload = None
+        self.last_sections = set()
+        self.last_has_system_stats = False
+
+    def _send_all(self, text: str) -> None:
+        """Queue pre-serialized text for every connection."""
+        for queue in self.active_connections.values():
+            self._enqueue(queue, text)
+
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue, text: str) -> None:
+        """Add a message, dropping the oldest one if the client is behind."""
+        if queue.full():
+            # Dashboard messages supersede each other; stale ones can go
+            queue.get_nowait()
+        queue.put_nowait(text)
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Send queued messages to one client until it fails or disconnects."""
+        while True:
+            text = await queue.get()
             try:
-                await connection.send_json(message)
+                await asyncio.wait_for(
+                    websocket.send_text(text), timeout=BROADCAST_SEND_TIMEOUT
+                )
             except Exception as e:
-                print(f"Error sending to WebSocket: {e}")
-                disconnected.add(connection)
-
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.active_connections.discard(conn)
+                logger.warning(f"Error sending to WebSocket: {e}")
+                self.disconnect(websocket)
+                return
 
 
 manager = ConnectionManager()
 
+# Set when something the dashboard shows has changed, to wake the broadcast loop
+_dashboard_changed = asyncio.Event()
+
+
+def notify_dashboard_change() -> None:
+    """Ask the broadcast loop to refresh now instead of at its next poll."""
+    _dashboard_changed.set()
+
 
-def get_redis_client() -> Optional[redis.Redis]:
-    """Get or create Redis client."""
+async def get_redis_client() -> Optional[aioredis.Redis]:
+    """Get or create the async Redis client."""
     global _redis_client
     if _redis_client is None:
+        client = None
         try:
-            config = RedisConfig()
-            _redis_client = redis.Redis(
+            config = RedisConfig.instance()
+            client = aioredis.Redis(
                 host=config.host,
                 port=config.port,
                 db=config.db,
@@ -220,93 +493,374 @@ def get_redis_client() -> Optional[redis.Redis]:
                 decode_responses=True,
                 socket_connect_timeout=2,
             )
-            _redis_client.ping()
+            await client.ping()
         except Exception:
+            if client is not None:
+                await client.aclose()
             return None
+        _redis_client = client
     return _redis_client
 
 
-def find_server_processes() -> List[Dict[str, Any]]:
-    """Find all running MCP server processes."""
+# Redis INFO snapshot shared by /api/status, /api/redis/stats and broadcasts
+REDIS_INFO_TTL = 1.0  # seconds
+_info_cache: Dict[str, Any] = {"ts": 0.0, "info": None, "dbsize": 0}
+
+
+async def get_redis_info(
+    client: aioredis.Redis, ttl: float = REDIS_INFO_TTL
+) -> tuple[Dict[str, Any], int]:
+    """Get (INFO, DBSIZE), refreshing both in one round trip when stale."""
+    now = time.time()
+    if _info_cache["info"] is None or now - _info_cache["ts"] >= ttl:
+        pipe = client.pipeline(transaction=False)
+        pipe.info()
+        pipe.dbsize()
+        info, dbsize = await pipe.execute()
+        _info_cache.update(ts=now, info=info, dbsize=dbsize)
+    return _info_cache["info"], _info_cache["dbsize"]
+
+
+# Process discovery cache (shared by the status endpoints and broadcast loop)
+PROCESS_CACHE_TTL = 1.5  # seconds
+_proc_cache: Dict[str, Any] = {"ts": 0.0, "data": []}
+
+
+def find_server_processes(ttl: float = PROCESS_CACHE_TTL) -> List[Dict[str, Any]]:
+    """Find all running MCP server processes, reusing a scan younger than ttl."""
+    now = time.time()
+    if now - _proc_cache["ts"] < ttl:
+        return _proc_cache["data"]
+
+    server_processes = _scan_server_processes()
+    _proc_cache["ts"] = now
+    _proc_cache["data"] = server_processes
+    return server_processes
+
+
+def invalidate_process_cache() -> None:
+    """Force the next find_server_processes() call to rescan."""
+    _proc_cache["ts"] = 0.0
+    _snapshot_cache["ts"] = 0.0
+
+
+# psutil handles kept across scans so cpu_percent() reports a real delta
+_proc_handles: Dict[int, psutil.Process] = {}
+
+
+def _match_server_key(cmdline: List[str]) -> Optional[str]:
+    """Return the SERVERS key a python command line runs, if any."""
+    if len(cmdline) < 2 or "python" not in cmdline[0].lower():
+        return None
+    for arg in cmdline:
+        if "_server.py" in arg:
+            server_key = Path(arg).stem.replace("_server", "").replace("_", "-")
+            return server_key if server_key in SERVERS else None
+    return None
+
+
+def _pgrep_server_candidates() -> Optional[List[tuple[int, List[str]]]]:
+    """List (pid, cmdline) for *_server.py processes via one pgrep call.
+
+    Returns None when pgrep is unavailable, or off Linux where ``-a`` means
+    "include ancestors" and prints bare PIDs, so callers can fall back to psutil.
+    """
+    if sys.platform != "linux":
+        return None
+    try:
+        out = subprocess.run(
+            ["pgrep", "-af", r"_server\.py"], capture_output=True, text=True
+        ).stdout
+    except OSError:
+        return None
+
+    candidates = []
+    for line in out.splitlines():
+        pid, _, cmdline = line.partition(" ")
+        if not pid.isdigit():
+            continue
+        if not cmdline:
+            # Not the "pid cmdline" format we asked for
+            return None
+        candidates.append((int(pid), cmdline.split()))
+    return candidates
+
+
+def _scan_server_processes() -> List[Dict[str, Any]]:
+    """Scan for running MCP server processes.
+
+    Uses pgrep to narrow the search to matching command lines, then asks psutil
+    for details on the hits only.
+    """
+    candidates = _pgrep_server_candidates()
+    if candidates is None:
+        candidates = [
+            (proc.info["pid"], proc.info["cmdline"] or [])
+            for proc in psutil.process_iter(["pid", "cmdline"])
+        ]
+
     server_processes = []
-    server_names = [s.replace("-", "_") + "_server" for s in SERVERS.keys()]
+    seen_pids = set()
+    for pid, cmdline in candidates:
+        server_key = _match_server_key(cmdline)
+        if server_key is None:
+            continue
 
-    for proc in psutil.process_iter(
-        ["pid", "name", "cmdline", "create_time", "memory_info", "cpu_percent"]
-    ):
         try:
-            if proc.info["cmdline"] and len(proc.info["cmdline"]) >= 2:
-                if "python" in proc.info["cmdline"][0].lower():
-                    for arg in proc.info["cmdline"]:
-                        if "_server.py" in arg:
-                            server_name = Path(arg).stem
-                            if server_name in server_names:
-                                server_key = server_name.replace("_server", "").replace(
-                                    "_", "-"
-                                )
-
-                                # Get memory info
-                                memory_mb = (
-                                    proc.info["memory_info"].rss / (1024 * 1024)
-                                    if proc.info.get("memory_info")
-                                    else 0
-                                )
-
-                                server_processes.append(
-                                    {
-                                        "key": server_key,
-                                        "name": SERVERS[server_key]["name"],
-                                        "pid": proc.info["pid"],
-                                        "uptime": time.time()
-                                        - proc.info["create_time"],
-                                        "memory_mb": round(memory_mb, 2),
-                                        "cpu_percent": proc.info.get("cpu_percent", 0),
-                                    }
-                                )
-                            break
+            proc = _proc_handles.get(pid)
+            if proc is None or not proc.is_running():
+                proc = _proc_handles[pid] = psutil.Process(pid)
+            # Read all attributes from a single /proc snapshot
+            with proc.oneshot():
+                memory_info = proc.memory_info()
+                create_time = proc.create_time()
+                cpu_percent = proc.cpu_percent(None)
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
+            continue
+
+        seen_pids.add(pid)
+        memory_mb = memory_info.rss / (1024 * 1024)
+        server_processes.append(
+            {
+                "key": server_key,
+                "name": SERVERS[server_key]["name"],
+                "pid": pid,
+                "uptime": time.time() - create_time,
+                "memory_mb": round(memory_mb, 2),
+                "cpu_percent": cpu_percent,
+            }
+        )
+
+    # Drop handles for processes that have gone away
+    for pid in _proc_handles.keys() - seen_pids:
+        del _proc_handles[pid]
 
     return server_processes
 
 
+# System stats cache (cpu_percent is sampled non-blocking since the last call)
+SYSTEM_STATS_TTL = 1.0  # seconds
+_system_stats_cache: Dict[str, Any] = {"ts": 0.0, "data": {}}
+
+
+def get_system_stats(ttl: float = SYSTEM_STATS_TTL) -> Dict[str, float]:
+    """Get host CPU/memory/disk usage without blocking the event loop."""
+    now = time.time()
+    if now - _system_stats_cache["ts"] < ttl:
+        return _system_stats_cache["data"]
+
+    stats = {
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "memory_percent": psutil.virtual_memory().percent,
+        "disk_percent": psutil.disk_usage("/").percent,
+    }
+    _system_stats_cache["ts"] = now
+    _system_stats_cache["data"] = stats
+    return stats
+
+
+async def sample_system_stats() -> None:
+    """Refresh host stats in the background so readers never wait on psutil."""
+    while True:
+        try:
+            await asyncio.to_thread(get_system_stats, 0)
+        except Exception as e:
+            logger.warning(f"Error sampling system stats: {e}")
+        await asyncio.sleep(SYSTEM_STATS_TTL)
+
+
+async def _current_system_stats() -> Dict[str, float]:
+    """Read the sampler's latest host stats, sampling inline if it isn't running."""
+    sampler_running = system_stats_task is not None and not system_stats_task.done()
+    if sampler_running and _system_stats_cache["data"]:
+        return _system_stats_cache["data"]
+    return await asyncio.to_thread(get_system_stats)
+
+
+LOG_TAIL_CHUNK_SIZE = 64 * 1024
+
+# Log level detection: first level token in the line wins
+LOG_LEVEL_RE = re.compile(r"(CRITICAL|ERROR|WARN(?:ING)?|DEBUG)", re.IGNORECASE)
+LOG_LEVEL_MAP = {
+    "CRITICAL": "error",
+    "ERROR": "error",
+    "WARNING": "warning",
+    "WARN": "warning",
+    "DEBUG": "debug",
+}
+
+
+def _read_last_lines(log_file: Path, lines: int) -> List[str]:
+    """Read the last N lines of a file by seeking backwards from the end."""
+    if lines <= 0:
+        return []
+
+    with open(log_file, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b""
+        # One extra newline is needed to know the first kept line is complete
+        while pos > 0 and data.count(b"\n") <= lines:
+            read_size = min(LOG_TAIL_CHUNK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+
+    tail = data.split(b"\n")
+    if not tail[-1]:
+        tail.pop()
+    return [line.decode("utf-8", errors="replace") for line in tail[-lines:]]
+
+
 def get_log_tail(log_file: Path, lines: int = 50) -> List[Dict[str, Any]]:
     """Get last N lines from a log file with error detection."""
     if not log_file.exists():
         return []
 
     try:
-        with open(log_file, "r") as f:
-            log_lines = f.readlines()[-lines:]
-
-        parsed_logs = []
-        for line in log_lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Detect log level
-            level = "info"
-            if "ERROR" in line.upper() or "CRITICAL" in line.upper():
-                level = "error"
-            elif "WARNING" in line.upper() or "WARN" in line.upper():
-                level = "warning"
-            elif "DEBUG" in line.upper():
-                level = "debug"
-
-            parsed_logs.append(
-                {
-                    "text": line,
-                    "level": level,
-                    "timestamp": datetime.now().isoformat(),
-                }
-            )
+        log_lines = _read_last_lines(log_file, lines)
 
-        return parsed_logs
+        return _parse_log_lines(log_lines)
     except Exception:
         return []
 
 
+def _parse_log_lines(log_lines: List[str]) -> List[Dict[str, Any]]:
+    """Parse raw log lines into dashboard entries, skipping blank lines."""
+    parsed_logs = []
+    # One timestamp per batch; the lines were all read at the same moment
+    now = datetime.now().isoformat()
+    for line in log_lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        # Detect log level
+        match = LOG_LEVEL_RE.search(line)
+        level = LOG_LEVEL_MAP[match.group(1).upper()] if match else "info"
+
+        parsed_logs.append(
+            {
+                "text": line,
+                "level": level,
+                "timestamp": now,
+            }
+        )
+
+    return parsed_logs
+
+
+# Streamed log tails, kept up to date from appended bytes only; by
+# watch_logs() when watchfiles is available, else polled by poll_log_tails()
+LOG_STREAM_LINES = 30
+_log_tails: Dict[str, Deque[Dict[str, Any]]] = {}
+_log_offsets: Dict[str, int] = {}
+_log_inodes: Dict[str, int] = {}
+_log_handles: Dict[str, BinaryIO] = {}  # kept open; reopened on rotation
+_log_watch_active = False
+
+
+def _close_log_handles(server_key: Optional[str] = None) -> None:
+    """Close the kept-open log file for one server, or for all of them."""
+    keys = [server_key] if server_key is not None else list(_log_handles)
+    for key in keys:
+        handle = _log_handles.pop(key, None)
+        if handle is not None:
+            handle.close()
+
+
+def _load_log_tail(server_key: str) -> None:
+    """(Re)load a server's streamed tail from the end of its log file."""
+    log_file = SERVERS[server_key]["log"]
+    _close_log_handles(server_key)
+    try:
+        handle = open(log_file, "rb")
+    except OSError:
+        size, inode = 0, 0
+    else:
+        # fstat the opened file so size/inode match the handle we keep
+        st = os.fstat(handle.fileno())
+        size, inode = st.st_size, st.st_ino
+        _log_handles[server_key] = handle
+    _log_tails[server_key] = deque(
+        get_log_tail(log_file, LOG_STREAM_LINES), maxlen=LOG_STREAM_LINES
+    )
+    _log_offsets[server_key] = size
+    _log_inodes[server_key] = inode
+
+
+def _read_appended_log_lines(server_key: str) -> None:
+    """Append lines written to a server's log since the last read."""
+    log_file = SERVERS[server_key]["log"]
+    offset = _log_offsets.get(server_key, 0)
+    try:
+        st = log_file.stat()
+        size, inode = st.st_size, st.st_ino
+    except OSError:
+        size, inode = 0, 0
+
+    # Truncated, rotated or cleared: start over from the new contents
+    if (
+        size < offset
+        or inode != _log_inodes.get(server_key)
+        or server_key not in _log_tails
+    ):
+        _load_log_tail(server_key)
+        return
+    if size == offset:
+        return
+
+    handle = _log_handles[server_key]
+    handle.seek(offset)
+    data = handle.read(size - offset)
+
+    # Leave a trailing partial line for the next read
+    complete = data.rfind(b"\n") + 1
+    if not complete:
+        return
+    _log_offsets[server_key] = offset + complete
+    lines = data[:complete].decode("utf-8", errors="replace").split("\n")
+    _log_tails[server_key].extend(_parse_log_lines(lines))
+
+
+async def watch_logs() -> None:
+    """Keep the streamed log tails current using filesystem notifications."""
+    global _log_watch_active
+    log_keys = {srv["log_str"]: key for key, srv in SERVERS.items()}
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    for key in SERVERS:
+        _load_log_tail(key)
+
+    _log_watch_active = True
+    try:
+        async for changes in awatch(LOGS_DIR):
+            for key in {log_keys.get(path) for _, path in changes} - {None}:
+                _read_appended_log_lines(key)
+            notify_dashboard_change()
+    finally:
+        _log_watch_active = False
+        _log_tails.clear()
+        _log_offsets.clear()
+        _log_inodes.clear()
+        _close_log_handles()
+
+
+async def poll_log_tails() -> None:
+    """Pick up appended log lines for all servers when no watcher is running."""
+    if _log_watch_active:
+        return
+    await asyncio.gather(
+        *(asyncio.to_thread(_read_appended_log_lines, key) for key in SERVERS)
+    )
+
+
+def get_streamed_log_tail(server_key: str, lines: int) -> List[Dict[str, Any]]:
+    """Get the last N lines for a server, from the stream when it is active."""
+    tail = _log_tails.get(server_key)
+    if tail is None or lines > LOG_STREAM_LINES:
+        return get_log_tail(SERVERS[server_key]["log"], lines)
+    return list(tail)[-lines:]
+
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main dashboard HTML."""
@@ -318,29 +872,76 @@ async def read_root():
     )
 
 
+# Status snapshot: processes, Redis and host stats probed together
+STATUS_SNAPSHOT_TTL = 1.0  # seconds
+_snapshot_cache: Dict[str, Any] = {"ts": 0.0, "data": None}
+_snapshot_lock = asyncio.Lock()
+
+
+async def _probe_redis() -> Dict[str, Any]:
+    """Get Redis connection state plus the shared INFO/DBSIZE snapshot."""
+    client = await get_redis_client()
+    if client is None:
+        return {"connected": False}
+    try:
+        info, total_keys = await get_redis_info(client)
+    except Exception as e:
+        return {"connected": False, "error": str(e)}
+    return {"connected": True, "info": info, "total_keys": total_keys}
+
+
+async def get_status_snapshot(ttl: float = STATUS_SNAPSHOT_TTL) -> Dict[str, Any]:
+    """Probe server processes, Redis and host stats concurrently.
+
+    Results are cached for ttl seconds and shared by the status endpoints and
+    the broadcast loop, so latency is the slowest probe rather than the sum.
+    """
+    async with _snapshot_lock:
+        if (
+            _snapshot_cache["data"] is None
+            or time.time() - _snapshot_cache["ts"] >= ttl
+        ):
+            processes, redis_state, system = await asyncio.gather(
+                asyncio.to_thread(find_server_processes),
+                _probe_redis(),
+                _current_system_stats(),
+            )
+            _snapshot_cache["data"] = {
+                "processes": processes,
+                "redis": redis_state,
+                "system": system,
+            }
+            _snapshot_cache["ts"] = time.time()
+        return _snapshot_cache["data"]
+
+
+def _redis_summary(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Pick the dashboard's Redis summary fields out of an INFO reply."""
+    return {
+        "version": info.get("redis_version", "unknown"),
+        "uptime_days": info.get("uptime_in_days", 0),
+        "used_memory_mb": round(info.get("used_memory", 0) / (1024 * 1024), 2),
+        "connected_clients": info.get("connected_clients", 0),
+        "ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
+    }
+
+
 @app.get("/api/status")
 async def get_status():
     """Get overall system status."""
-    running_servers = find_server_processes()
-    redis_client = get_redis_client()
-    redis_connected = redis_client is not None
+    snapshot = await get_status_snapshot()
+    running_servers = snapshot["processes"]
+    redis_state = snapshot["redis"]
 
     # Check Redis stats
-    redis_stats = {}
-    if redis_connected and redis_client:
-        try:
-            info = redis_client.info()
-            redis_stats = {
-                "connected": True,
-                "version": info.get("redis_version", "unknown"),
-                "uptime_days": info.get("uptime_in_days", 0),
-                "used_memory_mb": round(info.get("used_memory", 0) / (1024 * 1024), 2),
-                "total_keys": redis_client.dbsize(),
-                "connected_clients": info.get("connected_clients", 0),
-                "ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
-            }
-        except Exception:
-            redis_stats = {"connected": False, "error": "Failed to get Redis info"}
+    if redis_state.get("info") is not None:
+        redis_stats = {
+            "connected": True,
+            "total_keys": redis_state["total_keys"],
+            **_redis_summary(redis_state["info"]),
+        }
+    elif "error" in redis_state:
+        redis_stats = {"connected": False, "error": "Failed to get Redis info"}
     else:
         redis_stats = {"connected": False}
 
@@ -352,18 +953,14 @@ async def get_status():
             "stopped": len(SERVERS) - len(running_servers),
         },
         "redis": redis_stats,
-        "system": {
-            "cpu_percent": psutil.cpu_percent(interval=0.1),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_percent": psutil.disk_usage("/").percent,
-        },
+        "system": snapshot["system"],
     }
 
 
 @app.get("/api/servers")
 async def get_servers():
     """Get detailed server status."""
-    running_processes = find_server_processes()
+    running_processes = (await get_status_snapshot())["processes"]
     running_keys = {p["key"]: p for p in running_processes}
 
     servers_status = []
@@ -382,11 +979,7 @@ async def get_servers():
             }
 
         # Check environment variables
-        env_configured = (
-            all(os.getenv(var) for var in server["env_vars"])
-            if server["env_vars"]
-            else True
-        )
+        env_configured = ENV_ALL_SET[key]
 
         servers_status.append(
             {
@@ -395,7 +988,7 @@ async def get_servers():
                 "status": status,
                 "env_configured": env_configured,
                 "required_env_vars": server["env_vars"],
-                "log_file": str(server["log"]),
+                "log_file": server["log_str"],
                 "details": details,
             }
         )
@@ -406,13 +999,18 @@ async def get_servers():
 @app.get("/api/redis/stats")
 async def get_redis_stats():
     """Get detailed Redis statistics."""
-    redis_client = get_redis_client()
+    redis_state = (await get_status_snapshot())["redis"]
 
-    if not redis_client:
+    if "error" in redis_state:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get Redis stats: {redis_state['error']}",
+        )
+    if not redis_state["connected"]:
         raise HTTPException(status_code=503, detail="Redis not connected")
 
     try:
-        info = redis_client.info()
+        info, total_keys = redis_state["info"], redis_state["total_keys"]
 
         # Get keyspace info
         keyspace = {}
@@ -445,7 +1043,7 @@ async def get_redis_stats():
                 "keyspace_misses": info.get("keyspace_misses", 0),
             },
             "keyspace": keyspace,
-            "total_keys": redis_client.dbsize(),
+            "total_keys": total_keys,
         }
     except Exception as e:
         raise HTTPException(
@@ -481,51 +1079,32 @@ async def get_goals():
                 "error": "Database not available",
             }
 
-        # Get all goals and tasks from database
-        goals = db.list_goals()
-        tasks = db.list_tasks()
-
-        # Convert to dicts
-        goals_data = {g.id: g.to_dict() for g in goals}
-        tasks_data = {t.id: t.to_dict() for t in tasks}
+        # Aggregate in SQL; only the rows the UI shows are fetched
+        goal_counts, task_counts, recent_goals, active_tasks = await asyncio.gather(
+            db.count_goals_by_status(),
+            db.count_tasks_by_status(),
+            db.list_recent_goals(5),
+            db.list_active_tasks(10),
+        )
 
-        # Aggregate stats
-        total_goals = len(goals_data)
-        total_tasks = len(tasks_data)
+        total_goals = sum(goal_counts.values())
+        total_tasks = sum(task_counts.values())
 
         goals_by_status = {
             "pending": 0,
             "in_progress": 0,
             "completed": 0,
             "cancelled": 0,
+            **goal_counts,
         }
         tasks_by_status = {
             "pending": 0,
             "in_progress": 0,
             "completed": 0,
             "cancelled": 0,
+            **task_counts,
         }
 
-        for goal in goals_data.values():
-            status = goal.get("status", "pending")
-            goals_by_status[status] = goals_by_status.get(status, 0) + 1
-
-        for task in tasks_data.values():
-            status = task.get("status", "pending")
-            tasks_by_status[status] = tasks_by_status.get(status, 0) + 1
-
-        # Get recent goals
-        recent_goals = sorted(
-            goals_data.values(), key=lambda x: x.get("updated_at", ""), reverse=True
-        )[:5]
-
-        # Get active tasks
-        active_tasks = [
-            task
-            for task in tasks_data.values()
-            if task.get("status") in ["in_progress", "pending"]
-        ][:10]
-
         return {
             "summary": {
                 "total_goals": total_goals,
@@ -606,12 +1185,71 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+def _find_script_processes() -> Dict[str, List[psutil.Process]]:
+    """Map each server script file name to the processes running it."""
+    script_names = {server["script"].name for server in SERVERS.values()}
+    name_to_procs: Dict[str, List[psutil.Process]] = defaultdict(list)
+
+    for proc in psutil.process_iter(["pid", "cmdline"]):
+        for arg in proc.info["cmdline"] or []:
+            name = Path(arg).name
+            if name in script_names:
+                name_to_procs[name].append(proc)
+                break
+
+    return name_to_procs
+
+
+def _kill_processes(procs: List[psutil.Process], timeout: float = 3.0) -> int:
+    """SIGKILL the given processes and wait for them to exit."""
+    killed = []
+    for proc in procs:
+        try:
+            proc.kill()
+            killed.append(proc)
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(killed, timeout=timeout)
+    return len(killed)
+
+
+def _launch_server(server_info: Dict[str, Any]) -> subprocess.Popen:
+    """Start a server script detached, appending its output to its log file."""
+    python_path = PROJECT_ROOT / "mcp-env" / "bin" / "python"
+    log_file = server_info["log"]
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(log_file, "ab") as log_fh:
+        return subprocess.Popen(
+            [str(python_path), str(server_info["script"])],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=log_fh,
+            stderr=log_fh,
+            start_new_session=True,
+            env=os.environ.copy(),
+        )
+
+
+async def wait_for_start(
+    proc: subprocess.Popen, settle: float = 0.5, interval: float = 0.05
+) -> bool:
+    """Wait until a launched server has stayed up for `settle` seconds.
+
+    Returns False as soon as the process exits, so failed starts report
+    immediately instead of after a fixed sleep.
+    """
+    deadline = time.monotonic() + settle
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            return False
+        await asyncio.sleep(interval)
+    return proc.poll() is None
+
+
 @app.post("/api/servers/control-all")
 async def control_all_servers(request: dict):
     """Control all MCP servers (start/stop/restart)."""
-    import os
-    import subprocess
-
     action = request.get("action", "").lower()
     if action not in ["start", "stop", "restart"]:
         raise HTTPException(
@@ -620,132 +1258,44 @@ async def control_all_servers(request: dict):
 
     try:
         results = {}
+        running = await asyncio.to_thread(_find_script_processes)
 
-        if action == "stop":
+        if action in ("stop", "restart"):
             # Stop all MCP server processes
             for server_name, server_info in SERVERS.items():
-                script_name = server_info["script"].name
+                procs = running.pop(server_info["script"].name, [])
                 try:
-                    # Find processes
-                    result = subprocess.run(
-                        ["pgrep", "-f", script_name], capture_output=True, text=True
-                    )
-
-                    if result.returncode == 0 and result.stdout.strip():
-                        pids = result.stdout.strip().split("\n")
-                        for pid in pids:
-                            subprocess.run(["kill", "-9", pid], check=False)
-                        results[server_name] = f"✓ Stopped {len(pids)} process(es)"
+                    if procs:
+                        count = await asyncio.to_thread(_kill_processes, procs)
+                        results[server_name] = f"✓ Stopped {count} process(es)"
                     else:
                         results[server_name] = "Already stopped"
                 except Exception as e:
                     results[server_name] = f"Error: {str(e)}"
 
-        elif action == "start":
-            # Start servers via Claude Desktop's stdio mechanism
-            # We'll use the start script that checks Claude Desktop config
-            python_path = PROJECT_ROOT / "mcp-env" / "bin" / "python"
-
+        if action in ("start", "restart"):
+            # Start servers directly (no shell); stdio servers exit without a client
+            launched = {}
             for server_name, server_info in SERVERS.items():
-                script_path = server_info["script"]
-                log_file = server_info["log"]
-
+                if running.get(server_info["script"].name):
+                    results[server_name] = "⚠️ Already running"
+                    continue
                 try:
-                    # Check if already running
-                    check = subprocess.run(
-                        ["pgrep", "-f", script_path.name],
-                        capture_output=True,
-                        text=True,
-                    )
-
-                    if check.returncode == 0 and check.stdout.strip():
-                        results[server_name] = "⚠️ Already running"
-                        continue
-
-                    # Start the server in background with nohup
-                    cmd = f"cd {PROJECT_ROOT} && nohup {python_path} {script_path} > {log_file} 2>&1 &"
-
-                    subprocess.Popen(
-                        cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        start_new_session=True,
-                        env=os.environ.copy(),
-                    )
-
-                    # Give it a moment to start
-                    import time
-
-                    time.sleep(0.5)
-
-                    # Check if it started successfully
-                    verify = subprocess.run(
-                        ["pgrep", "-f", script_path.name],
-                        capture_output=True,
-                        text=True,
-                    )
-
-                    if verify.returncode == 0 and verify.stdout.strip():
-                        pid = verify.stdout.strip().split("\n")[0]
-                        results[server_name] = f"✓ Started (PID: {pid})"
-                    else:
-                        results[server_name] = "❌ Failed to start - check logs"
-
+                    launched[server_name] = _launch_server(server_info)
                 except Exception as e:
                     results[server_name] = f"❌ Error: {str(e)}"
 
-        elif action == "restart":
-            # Stop then start
-            for server_name, server_info in SERVERS.items():
-                script_name = server_info["script"].name
-                script_path = server_info["script"]
-                log_file = server_info["log"]
-                python_path = PROJECT_ROOT / "mcp-env" / "bin" / "python"
-
-                try:
-                    # Stop first
-                    result = subprocess.run(
-                        ["pgrep", "-f", script_name], capture_output=True, text=True
-                    )
-
-                    if result.returncode == 0 and result.stdout.strip():
-                        pids = result.stdout.strip().split("\n")
-                        for pid in pids:
-                            subprocess.run(["kill", "-9", pid], check=False)
-
-                    # Wait a moment
-                    import time
-
-                    time.sleep(0.5)
-
-                    # Start
-                    cmd = f"cd {PROJECT_ROOT} && nohup {python_path} {script_path} > {log_file} 2>&1 &"
-
-                    subprocess.Popen(
-                        cmd,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        start_new_session=True,
-                        env=os.environ.copy(),
-                    )
-
-                    time.sleep(0.5)
-
-                    # Verify
-                    verify = subprocess.run(
-                        ["pgrep", "-f", script_name], capture_output=True, text=True
-                    )
-
-                    if verify.returncode == 0 and verify.stdout.strip():
-                        pid = verify.stdout.strip().split("\n")[0]
-                        results[server_name] = f"✓ Restarted (PID: {pid})"
-                    else:
-                        results[server_name] = "❌ Failed to restart - check logs"
+            # Verify all launches concurrently
+            started = await asyncio.gather(
+                *(wait_for_start(proc) for proc in launched.values())
+            )
 
-                except Exception as e:
-                    results[server_name] = f"❌ Error: {str(e)}"
+            verb = "Restarted" if action == "restart" else "Started"
+            for (server_name, proc), ok in zip(launched.items(), started):
+                if ok:
+                    results[server_name] = f"✓ {verb} (PID: {proc.pid})"
+                else:
+                    results[server_name] = f"❌ Failed to {action} - check logs"
 
         # Add explanatory note based on action
         if action == "start":
@@ -755,6 +1305,10 @@ async def control_all_servers(request: dict):
         else:
             note = "Servers stopped successfully."
 
+        # Process set changed; don't serve a pre-action scan
+        invalidate_process_cache()
+        notify_dashboard_change()
+
         return {
             "status": "success" if action == "stop" else "warning",
             "action": action,
@@ -770,31 +1324,33 @@ async def control_all_servers(request: dict):
 async def get_redis_keys(pattern: str = "*", limit: int = 100):
     """Get Redis keys matching pattern with metadata."""
     try:
-        client = get_redis_client()
+        client = await get_redis_client()
         if not client:
             return {"error": "Redis not connected", "keys": [], "count": 0}
 
-        keys = client.scan_iter(match=pattern, count=limit)
-        keys_list = []
-
-        for i, key in enumerate(keys):
-            if i >= limit:
+        keys = []
+        async for key in client.scan_iter(match=pattern, count=limit):
+            if len(keys) >= limit:
                 break
+            keys.append(key)
+
+        # Fetch type and TTL for every key in a single round trip
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.type(key)
+            pipe.ttl(key)
+        results = await pipe.execute(raise_on_error=False) if keys else []
 
+        keys_list = []
+        for key, key_type, ttl in zip(keys, results[::2], results[1::2]):
             # Decode key if bytes
             key_str = key.decode("utf-8") if isinstance(key, bytes) else key
 
-            # Get key type and TTL
-            try:
-                key_type = (
-                    client.type(key).decode("utf-8")
-                    if isinstance(client.type(key), bytes)
-                    else client.type(key)
-                )
-                ttl = client.ttl(key)
-            except Exception:
+            if isinstance(key_type, Exception) or isinstance(ttl, Exception):
                 key_type = "unknown"
                 ttl = -1
+            elif isinstance(key_type, bytes):
+                key_type = key_type.decode("utf-8")
 
             keys_list.append({"key": key_str, "type": key_type, "ttl": ttl})
 
@@ -812,41 +1368,40 @@ async def get_redis_keys(pattern: str = "*", limit: int = 100):
 async def get_redis_key(key_name: str):
     """Get a specific Redis key's value and metadata."""
     try:
-        client = get_redis_client()
+        client = await get_redis_client()
         if not client:
             raise HTTPException(status_code=503, detail="Redis not connected")
 
-        # Check if key exists
-        if not client.exists(key_name):
-            raise HTTPException(status_code=404, detail=f"Key '{key_name}' not found")
-
-        # Get key type
-        key_type = client.type(key_name)
+        # Get key type and TTL in one round trip (TYPE is "none" if missing)
+        pipe = client.pipeline(transaction=False)
+        pipe.type(key_name)
+        pipe.ttl(key_name)
+        key_type, ttl = await pipe.execute()
         if isinstance(key_type, bytes):
             key_type = key_type.decode("utf-8")
 
-        # Get TTL
-        ttl = client.ttl(key_name)
+        if key_type == "none":
+            raise HTTPException(status_code=404, detail=f"Key '{key_name}' not found")
 
         # Get value based on type
         value = None
         if key_type == "string":
-            value = client.get(key_name)
+            value = await client.get(key_name)
             if isinstance(value, bytes):
                 value = value.decode("utf-8")
             # Try to parse as JSON
             try:
-                value = json.loads(value)
-            except (json.JSONDecodeError, TypeError):
+                value = json_loads(value)
+            except (ValueError, TypeError):
                 pass
         elif key_type == "list":
-            value = client.lrange(key_name, 0, -1)
+            value = await client.lrange(key_name, 0, -1)
             value = [v.decode("utf-8") if isinstance(v, bytes) else v for v in value]
         elif key_type == "set":
-            value = list(client.smembers(key_name))
+            value = list(await client.smembers(key_name))
             value = [v.decode("utf-8") if isinstance(v, bytes) else v for v in value]
         elif key_type == "hash":
-            value = client.hgetall(key_name)
+            value = await client.hgetall(key_name)
             value = {
                 k.decode("utf-8") if isinstance(k, bytes) else k: (
                     v.decode("utf-8") if isinstance(v, bytes) else v
@@ -854,7 +1409,7 @@ async def get_redis_key(key_name: str):
                 for k, v in value.items()
             }
         elif key_type == "zset":
-            value = client.zrange(key_name, 0, -1, withscores=True)
+            value = await client.zrange(key_name, 0, -1, withscores=True)
             value = [
                 {"member": m.decode("utf-8") if isinstance(m, bytes) else m, "score": s}
                 for m, s in value
@@ -884,8 +1439,8 @@ async def get_environment():
         server_env = {}
 
         for var in env_vars:
-            value = os.getenv(var)
-            is_set = value is not None and value != ""
+            value = ENV_STATE[var]
+            is_set = value != ""
 
             # Mask the value for security (show first 4 chars + ***)
             masked_value = None
@@ -904,7 +1459,7 @@ async def get_environment():
         env_status[server_name] = {
             "name": server_info["name"],
             "env_vars": server_env,
-            "all_set": all(os.getenv(var) for var in env_vars) if env_vars else True,
+            "all_set": ENV_ALL_SET[server_name],
         }
 
     return {
@@ -913,21 +1468,30 @@ async def get_environment():
     }
 
 
+@app.post("/api/env/refresh")
+async def refresh_environment():
+    """Re-read the server environment variables into the snapshot."""
+    refresh_env_snapshot()
+    notify_dashboard_change()
+    return await get_environment()
+
+
 @app.get("/api/tasks/list")
-async def list_tasks():
-    """Get list of all tasks from PostgreSQL database."""
+async def list_tasks(limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None):
+    """Get one page of tasks (newest first) from PostgreSQL database."""
     try:
         db = get_db_manager()
         if not db:
             return {"error": "Database not available", "tasks": [], "count": 0}
 
-        # Get all tasks from database
-        tasks = db.list_tasks()
-        tasks_list = [task.to_dict() for task in tasks]
+        tasks_list, next_cursor = await db.list_tasks_page(
+            limit=limit, cursor=decode_cursor(cursor)
+        )
 
         return {
             "tasks": tasks_list,
             "count": len(tasks_list),
+            "next_cursor": encode_cursor(next_cursor),
             "source": "PostgreSQL",
         }
     except Exception as e:
@@ -935,24 +1499,25 @@ async def list_tasks():
 
 
 @app.get("/api/goals/list")
-async def list_goals():
-    """Get list of all goals with full details from PostgreSQL database."""
+async def list_goals(limit: int = DEFAULT_PAGE_SIZE, cursor: str | None = None):
+    """Get one page of goals (newest first) with full details from PostgreSQL."""
     try:
         db = get_db_manager()
         if not db:
             return {"error": "Database not available", "goals": [], "count": 0}
 
-        # Get all goals from database
-        goals = db.list_goals()
-        goals_list = [goal.to_dict() for goal in goals]
+        goals_list, next_cursor = await db.list_goals_page(
+            limit=limit, cursor=decode_cursor(cursor)
+        )
 
         return {
             "goals": goals_list,
             "count": len(goals_list),
+            "next_cursor": encode_cursor(next_cursor),
             "source": "PostgreSQL",
         }
     except Exception as e:
-        logging.error("Exception in list_goals: %s", e, exc_info=True)
+        logger.error("Exception in list_goals: %s", e, exc_info=True)
         return {"error": "An internal server error occurred", "goals": [], "count": 0}
 
 
@@ -965,33 +1530,33 @@ async def get_goal_details(goal_id: str):
             raise HTTPException(status_code=503, detail="Database not available")
 
         # Get goal from database
-        goal = db.get_goal(goal_id)
+        goal = await db.get_goal(goal_id)
         if not goal:
             raise HTTPException(status_code=404, detail=f"Goal {goal_id} not found")
 
         # Get all tasks for this goal
-        tasks = db.list_tasks(goal_id=goal_id)
-        goal_tasks = [task.to_dict() for task in tasks]
+        goal_tasks = await db.list_tasks(goal_id=goal_id)
 
         # Sort tasks by created_at
         goal_tasks.sort(key=lambda x: x.get("created_at", ""), reverse=False)
 
+        # Count statuses in one pass over the tasks already fetched
+        tasks_by_status = {
+            "pending": 0,
+            "in_progress": 0,
+            "completed": 0,
+            "cancelled": 0,
+        }
+        for task in goal_tasks:
+            status = task.get("status")
+            if status in tasks_by_status:
+                tasks_by_status[status] += 1
+
         return {
-            "goal": goal.to_dict(),
+            "goal": goal,
             "tasks": goal_tasks,
             "task_count": len(goal_tasks),
-            "tasks_by_status": {
-                "pending": sum(1 for t in goal_tasks if t.get("status") == "pending"),
-                "in_progress": sum(
-                    1 for t in goal_tasks if t.get("status") == "in_progress"
-                ),
-                "completed": sum(
-                    1 for t in goal_tasks if t.get("status") == "completed"
-                ),
-                "cancelled": sum(
-                    1 for t in goal_tasks if t.get("status") == "cancelled"
-                ),
-            },
+            "tasks_by_status": tasks_by_status,
             "source": "PostgreSQL",
         }
     except HTTPException:
@@ -1008,22 +1573,11 @@ async def delete_goal(goal_id: str):
         if not db:
             raise HTTPException(status_code=503, detail="Database not available")
 
-        # Get goal info before deletion
-        goal = db.get_goal(goal_id)
-        if not goal:
+        # Delete tasks and goal in one transaction; None means no such goal
+        task_count = await db.delete_goal_and_count(goal_id)
+        if task_count is None:
             raise HTTPException(status_code=404, detail=f"Goal {goal_id} not found")
-
-        # Get tasks count before deletion
-        tasks = db.list_tasks(goal_id=goal_id)
-        task_count = len(tasks)
-
-        # Delete goal (cascades to tasks)
-        success = db.delete_goal(goal_id)
-
-        if not success:
-            raise HTTPException(
-                status_code=500, detail=f"Failed to delete goal {goal_id}"
-            )
+        notify_dashboard_change()
 
         return {
             "success": True,
@@ -1046,19 +1600,20 @@ async def delete_task(task_id: str):
             raise HTTPException(status_code=503, detail="Database not available")
 
         # Get task info before deletion
-        task = db.get_task(task_id)
+        task = await db.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
-        goal_id = task.goal_id
+        goal_id = task["goal_id"]
 
         # Delete task
-        success = db.delete_task(task_id)
+        success = await db.delete_task(task_id)
 
         if not success:
             raise HTTPException(
                 status_code=500, detail=f"Failed to delete task {task_id}"
             )
+        notify_dashboard_change()
 
         return {
             "success": True,
@@ -1089,12 +1644,14 @@ async def create_goal(goal_data: CreateGoalRequest):
         # Initialize goal agent to use its create_goal logic
         from servers.goal_agent_server import agent
 
-        new_goal = agent.create_goal(
+        new_goal = await asyncio.to_thread(
+            agent.create_goal,
             description=goal_data.description,
             priority=goal_data.priority,
             repos=goal_data.repos,
             metadata=goal_data.metadata,
         )
+        notify_dashboard_change()
 
         return {
             "success": True,
@@ -1116,7 +1673,7 @@ async def add_tasks_to_goal(goal_id: str, tasks_data: AddTasksRequest):
             raise HTTPException(status_code=503, detail="Database not available")
 
         # Verify goal exists
-        goal = db.get_goal(goal_id)
+        goal = await db.get_goal(goal_id)
         if not goal:
             raise HTTPException(status_code=404, detail=f"Goal {goal_id} not found")
 
@@ -1127,7 +1684,10 @@ async def add_tasks_to_goal(goal_id: str, tasks_data: AddTasksRequest):
         # Use goal agent to break down goal
         from servers.goal_agent_server import agent
 
-        result = agent.break_down_goal(goal_id, tasks_data.subtasks)
+        result = await asyncio.to_thread(
+            agent.break_down_goal, goal_id, tasks_data.subtasks
+        )
+        notify_dashboard_change()
 
         return {
             "success": True,
@@ -1161,16 +1721,17 @@ async def update_task_status(task_id: str, status_data: UpdateTaskStatusRequest)
             raise HTTPException(status_code=400, detail="Invalid status")
 
         # Get task to verify it exists
-        task = db.get_task(task_id)
+        task = await db.get_task(task_id)
         if not task:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
         # Update task
         from servers.goal_agent_server import agent
 
-        updated_task = agent.update_task_status(
-            task_id, status_data.status, status_data.result
+        updated_task = await asyncio.to_thread(
+            agent.update_task_status, task_id, status_data.status, status_data.result
         )
+        notify_dashboard_change()
 
         return {
             "success": True,
@@ -1190,15 +1751,29 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
 
     try:
-        # Send initial data
-        initial_data = await collect_dashboard_data()
-        await websocket.send_json(
-            {
-                "type": "initial",
-                "data": initial_data,
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+        # Send initial data (all sends go through the client's writer queue).
+        # Reuse the latest broadcast when it has every section and host stats
+        # (fast cycles leave them out), so reconnects don't each trigger a
+        # full collect.
+        cached = manager.last_payload
+        if (
+            cached is not None
+            and manager.last_has_system_stats
+            and manager.last_sections >= set(DASHBOARD_SECTIONS)
+        ):
+            manager.send(websocket, cached)
+        else:
+            initial_data = await collect_dashboard_data()
+            manager.send(
+                websocket,
+                json_dumps(
+                    {
+                        "type": "initial",
+                        "data": initial_data,
+                        "timestamp": epoch_ms(),
+                    }
+                ),
+            )
 
         # Keep connection alive and listen for client messages
         while True:
@@ -1206,296 +1781,348 @@ async def websocket_endpoint(websocket: WebSocket):
                 # Wait for messages from client (e.g., manual refresh request)
                 message = await asyncio.wait_for(websocket.receive_json(), timeout=30.0)
 
-                if message.get("type") == "refresh":
+                if message.get("type") == "subscribe":
+                    # Client wants only some sections, e.g. a status ticker
+                    manager.subscribe(websocket, message.get("sections"))
+                    notify_dashboard_change()
+                elif message.get("type") == "refresh":
                     # Client requested a refresh
-                    data = await collect_dashboard_data()
-                    await websocket.send_json(
-                        {
-                            "type": "update",
-                            "data": data,
-                            "timestamp": datetime.now().isoformat(),
-                        }
+                    data = await collect_dashboard_data(
+                        sections=manager.subscriptions.get(websocket)
+                    )
+                    manager.send(
+                        websocket,
+                        json_dumps(
+                            {
+                                "type": "update",
+                                "data": data,
+                                "timestamp": epoch_ms(),
+                            }
+                        ),
                     )
             except asyncio.TimeoutError:
                 # Send ping to keep connection alive
-                await websocket.send_json({"type": "ping"})
+                manager.send(websocket, json_dumps({"type": "ping"}))
             except WebSocketDisconnect:
                 break
 
     except Exception as e:
-        print(f"WebSocket error: {e}")
+        logger.error(f"WebSocket error: {e}")
     finally:
         manager.disconnect(websocket)
 
 
-async def collect_dashboard_data(include_system_stats: bool = True) -> dict:
-    """Collect all dashboard data for broadcasting.
-
-    Args:
-        include_system_stats: If True, includes CPU/memory/disk stats (expensive).
-                             Should be False for fast updates (100ms), True for slow updates (1000ms).
-    """
-    try:
-        # Collect status
-        running_servers = find_server_processes()
-        redis_client = get_redis_client()
-        redis_connected = redis_client is not None
-
-        # Check Redis stats
-        redis_stats = {}
-        if redis_connected and redis_client:
-            try:
-                # Always get key count (fast operation)
-                total_keys = redis_client.dbsize()
-                redis_stats = {
-                    "connected": True,
-                    "total_keys": total_keys,
-                }
-
-                # Only get expensive stats (INFO command) on slow cycles
-                if include_system_stats:
-                    info = redis_client.info()
-                    redis_stats.update(
-                        {
-                            "version": info.get("redis_version", "unknown"),
-                            "uptime_days": info.get("uptime_in_days", 0),
-                            "used_memory_mb": round(
-                                info.get("used_memory", 0) / (1024 * 1024), 2
-                            ),
-                            "connected_clients": info.get("connected_clients", 0),
-                            "ops_per_sec": info.get("instantaneous_ops_per_sec", 0),
-                        }
-                    )
-            except Exception:
-                redis_stats = {"connected": False, "error": "Failed to get Redis info"}
-        else:
-            redis_stats = {"connected": False}
-
-        # Build status data (no timestamp here - added during broadcast)
-        status_data = {
-            "servers": {
-                "total": len(SERVERS),
-                "running": len(running_servers),
-                "stopped": len(SERVERS) - len(running_servers),
-            },
-            "redis": redis_stats,
-        }
+async def _collect_status(snapshot: Dict[str, Any], include_system_stats: bool) -> dict:
+    """Build the "status" section: server counts, Redis and host stats."""
+    running_servers = snapshot["processes"]
+    redis_client = await get_redis_client()
+    redis_connected = redis_client is not None
 
-        # Only include expensive system stats every 1000ms
-        if include_system_stats:
-            status_data["system"] = {
-                "cpu_percent": psutil.cpu_percent(interval=0.1),
-                "memory_percent": psutil.virtual_memory().percent,
-                "disk_percent": psutil.disk_usage("/").percent,
+    # Check Redis stats
+    redis_stats = {}
+    if redis_connected and redis_client:
+        try:
+            # Always get key count (fast operation)
+            total_keys = await redis_client.dbsize()
+            redis_stats = {
+                "connected": True,
+                "total_keys": total_keys,
             }
 
-        # Collect server details
-        running_processes = find_server_processes()
-        running_keys = {p["key"]: p for p in running_processes}
-
-        servers_status = []
-        for key, server in SERVERS.items():
-            status = "stopped"
-            details = {}
-
-            if key in running_keys:
-                status = "running"
-                proc = running_keys[key]
-                details = {
-                    "pid": proc["pid"],
-                    "uptime": proc["uptime"],
-                    "memory_mb": proc["memory_mb"],
-                    "cpu_percent": proc["cpu_percent"],
-                }
-
-            # Check environment variables
-            env_configured = (
-                all(os.getenv(var) for var in server["env_vars"])
-                if server["env_vars"]
-                else True
-            )
+            # Only include expensive stats (INFO command) on slow cycles
+            if include_system_stats:
+                info = snapshot["redis"].get("info")
+                if info is None:
+                    info, _ = await get_redis_info(redis_client)
+                redis_stats.update(_redis_summary(info))
+        except Exception:
+            redis_stats = {"connected": False, "error": "Failed to get Redis info"}
+    else:
+        redis_stats = {"connected": False}
 
-            servers_status.append(
-                {
-                    "key": key,
-                    "name": server["name"],
-                    "status": status,
-                    "env_configured": env_configured,
-                    "required_env_vars": server["env_vars"],
-                    "log_file": str(server["log"]),
-                    "details": details,
-                }
-            )
+    # Build status data (no timestamp here - added during broadcast)
+    status_data = {
+        "servers": {
+            "total": len(SERVERS),
+            "running": len(running_servers),
+            "stopped": len(SERVERS) - len(running_servers),
+        },
+        "redis": redis_stats,
+    }
 
-        # Collect goals summary from PostgreSQL
-        goals_data = {}
-        tasks_data = {}
+    # Only include expensive system stats every 1000ms
+    if include_system_stats:
+        status_data["system"] = snapshot["system"]
 
-        try:
-            db = get_db_manager()
-            if db:
-                # Get from database
-                goals = db.list_goals()
-                tasks = db.list_tasks()
-                goals_data = {g.id: g.to_dict() for g in goals}
-                tasks_data = {t.id: t.to_dict() for t in tasks}
-        except Exception:
-            pass  # Silent fail - will show empty goals/tasks
+    return status_data
 
-        total_goals = len(goals_data)
-        total_tasks = len(tasks_data)
 
-        goals_by_status = {
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "cancelled": 0,
-        }
-        tasks_by_status = {
-            "pending": 0,
-            "in_progress": 0,
-            "completed": 0,
-            "cancelled": 0,
-        }
+def _collect_servers(snapshot: Dict[str, Any]) -> dict:
+    """Build the "servers" section from the process snapshot."""
+    running_keys = {p["key"]: p for p in snapshot["processes"]}
 
-        for goal in goals_data.values():
-            status = goal.get("status", "pending")
-            goals_by_status[status] = goals_by_status.get(status, 0) + 1
+    servers_status = []
+    for key, server in SERVERS.items():
+        status = "stopped"
+        details = {}
 
-        for task in tasks_data.values():
-            status = task.get("status", "pending")
-            tasks_by_status[status] = tasks_by_status.get(status, 0) + 1
+        if key in running_keys:
+            status = "running"
+            proc = running_keys[key]
+            details = {
+                "pid": proc["pid"],
+                "uptime": proc["uptime"],
+                "memory_mb": proc["memory_mb"],
+                "cpu_percent": proc["cpu_percent"],
+            }
 
-        goals_summary = {
-            "summary": {
-                "total_goals": total_goals,
-                "total_tasks": total_tasks,
-                "goals_by_status": goals_by_status,
-                "tasks_by_status": tasks_by_status,
+        # Check environment variables
+        env_configured = ENV_ALL_SET[key]
+
+        servers_status.append(
+            {
+                "key": key,
+                "name": server["name"],
+                "status": status,
+                "env_configured": env_configured,
+                "required_env_vars": server["env_vars"],
+                "log_file": server["log_str"],
+                "details": details,
             }
-        }
+        )
 
-        # Collect recent logs
-        all_logs = {}
-        error_count = 0
-        warning_count = 0
+    return {"servers": servers_status}
 
-        for key, srv in SERVERS.items():
-            logs = get_log_tail(srv["log"], 30)  # Reduced from 50 for efficiency
-            all_logs[key] = logs
 
-            for log in logs:
-                if log["level"] == "error":
-                    error_count += 1
-                elif log["level"] == "warning":
-                    warning_count += 1
+async def _collect_goals() -> dict:
+    """Build the "goals" section from status counts done by the database."""
+    goal_counts: Dict[str, int] = {}
+    task_counts: Dict[str, int] = {}
 
-        logs_data = {
-            "all_servers": all_logs,
-            "summary": {
-                "total_errors": error_count,
-                "total_warnings": warning_count,
-            },
-        }
+    try:
+        db = get_db_manager()
+        if db:
+            goal_counts, task_counts = await asyncio.gather(
+                db.count_goals_by_status(),
+                db.count_tasks_by_status(),
+            )
+    except Exception:
+        pass  # Silent fail - will show empty goals/tasks
 
-        return {
-            "status": status_data,
-            "servers": {"servers": servers_status},
-            "goals": goals_summary,
-            "logs": logs_data,
+    total_goals = sum(goal_counts.values())
+    total_tasks = sum(task_counts.values())
+
+    goals_by_status = {
+        "pending": 0,
+        "in_progress": 0,
+        "completed": 0,
+        "cancelled": 0,
+        **goal_counts,
+    }
+    tasks_by_status = {
+        "pending": 0,
+        "in_progress": 0,
+        "completed": 0,
+        "cancelled": 0,
+        **task_counts,
+    }
+
+    return {
+        "summary": {
+            "total_goals": total_goals,
+            "total_tasks": total_tasks,
+            "goals_by_status": goals_by_status,
+            "tasks_by_status": tasks_by_status,
         }
+    }
+
+
+async def _collect_logs() -> dict:
+    """Build the "logs" section from the streamed log tails."""
+    all_logs = {}
+    error_count = 0
+    warning_count = 0
+
+    await poll_log_tails()
+    for key, srv in SERVERS.items():
+        logs = get_streamed_log_tail(key, LOG_STREAM_LINES)
+        all_logs[key] = logs
+
+        for log in logs:
+            if log["level"] == "error":
+                error_count += 1
+            elif log["level"] == "warning":
+                warning_count += 1
+
+    return {
+        "all_servers": all_logs,
+        "summary": {
+            "total_errors": error_count,
+            "total_warnings": warning_count,
+        },
+    }
+
+
+async def collect_dashboard_data(
+    include_system_stats: bool = True, sections: Optional[Set[str]] = None
+) -> dict:
+    """Collect all dashboard data for broadcasting.
+
+    Args:
+        include_system_stats: If True, includes CPU/memory/disk stats (expensive).
+                             Should be False for fast updates (100ms), True for slow updates (1000ms).
+        sections: Sections to build (see DASHBOARD_SECTIONS); all by default.
+                  Skipped sections cost nothing and are left out of the result.
+    """
+    if sections is None:
+        sections = set(DASHBOARD_SECTIONS)
+
+    try:
+        data: Dict[str, Any] = {}
+        snapshot = None
+        if "status" in sections or "servers" in sections:
+            snapshot = await get_status_snapshot()
+
+        if "status" in sections:
+            data["status"] = await _collect_status(snapshot, include_system_stats)
+        if "servers" in sections:
+            data["servers"] = _collect_servers(snapshot)
+        if "goals" in sections:
+            data["goals"] = await _collect_goals()
+        if "logs" in sections:
+            data["logs"] = await _collect_logs()
+
+        return data
     except Exception as e:
-        print(f"Error collecting dashboard data: {e}")
+        logger.error(f"Error collecting dashboard data: {e}")
         return {}
 
 
+def encode_dashboard_data(data: dict) -> tuple[str, Dict[str, Any]]:
+    """Serialize dashboard data once and compute a change key per section.
+
+    Returns the JSON text of the whole payload and a dict of change keys:
+    a digest of each section's JSON, except for status, which is keyed on
+    the plain tuple of fields that should trigger a push (server counts,
+    Redis connectivity and key count), and system stats, keyed on values
+    rounded to one decimal so small fluctuations are ignored.
+    """
+    parts = []
+    keys: Dict[str, Any] = {}
+    for name, section in data.items():
+        section_text = json_dumps(section)
+        parts.append(f"{json_dumps(name)}:{section_text}")
+        if name != "status":
+            keys[name] = _digest(section_text)
+            continue
+
+        servers = section.get("servers") or {}
+        redis_stats = section.get("redis") or {}
+        keys["status"] = (
+            servers.get("running"),
+            servers.get("total"),
+            redis_stats.get("connected"),
+            redis_stats.get("total_keys"),
+        )
+        system = section.get("system")
+        if system:
+            keys["system"] = (
+                round(system.get("cpu_percent", 0), 1),
+                round(system.get("memory_percent", 0), 1),
+                round(system.get("disk_percent", 0), 1),
+            )
+
+    return "{" + ",".join(parts) + "}", keys
+
+
+async def listen_for_db_changes() -> None:
+    """Wake the broadcast loop on PostgreSQL NOTIFYs from goal/task writes."""
+    db = get_db_manager()
+    if not isinstance(db, AsyncDatabaseManager):
+        return  # No LISTEN support; goal changes show up on the next poll
+
+    try:
+        conn = await db.listen(
+            CHANGE_NOTIFY_CHANNEL, lambda *_: notify_dashboard_change()
+        )
+    except Exception as e:
+        logger.warning(f"Could not listen for database changes: {e}")
+        return
+    if conn is None:
+        return
+
+    try:
+        await asyncio.Future()  # Keep the connection open until cancelled
+    finally:
+        await conn.close()
+
+
+async def wait_for_dashboard_change(timeout: float) -> bool:
+    """Wait until notify_dashboard_change() is called or timeout passes.
+
+    Returns True if woken by a change notification.
+    """
+    try:
+        await asyncio.wait_for(_dashboard_changed.wait(), timeout=timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        _dashboard_changed.clear()
+
+
 # Background task for broadcasting updates
 async def broadcast_updates():
-    """Background task that broadcasts updates to all connected clients."""
-    previous_data = {}
-    cycle_count = 0
+    """Background task that broadcasts updates to all connected clients.
+
+    Refreshes as soon as a change is notified (database NOTIFY, log writes,
+    dashboard actions), and otherwise polls every BROADCAST_POLL_INTERVAL
+    for process, Redis and host stats changes.
+    """
+    previous_keys: Dict[str, Any] = {}
+    last_stats_at = 0.0
 
     while True:
         try:
-            await asyncio.sleep(0.1)  # Check every 100ms for near-instant updates
+            await wait_for_dashboard_change(BROADCAST_POLL_INTERVAL)
 
             if not manager.active_connections:
-                cycle_count = 0  # Reset counter when no clients
-                previous_data = {}
+                last_stats_at = 0.0  # Reset when no clients
+                previous_keys = {}
+                manager.reset_last_update()
                 continue  # No clients connected, skip
 
-            cycle_count += 1
-            update_system_stats = cycle_count % 10 == 0  # Every 1000ms (10 cycles)
+            now = time.monotonic()
+            update_system_stats = now - last_stats_at >= SYSTEM_STATS_TTL
+            if update_system_stats:
+                last_stats_at = now
 
-            # Collect current data (with optional system stats)
+            # Collect current data (with optional system stats), limited to
+            # the sections some client is subscribed to
             current_data = await collect_dashboard_data(
-                include_system_stats=update_system_stats
+                include_system_stats=update_system_stats,
+                sections=manager.needed_sections(),
             )
 
-            # Smart comparison: only broadcast if meaningful changes occurred
-            has_changes = False
-
-            # Check if data structure is different or has meaningful changes
-            if not previous_data:
-                has_changes = True
-            else:
-                # Check servers count
-                if current_data.get("status", {}).get("servers") != previous_data.get(
-                    "status", {}
-                ).get("servers"):
-                    has_changes = True
-
-                # Check Redis connection or key count
-                curr_redis = current_data.get("status", {}).get("redis", {})
-                prev_redis = previous_data.get("status", {}).get("redis", {})
-                if curr_redis.get("connected") != prev_redis.get(
-                    "connected"
-                ) or curr_redis.get("total_keys") != prev_redis.get("total_keys"):
-                    has_changes = True
-
-                # Check system stats (only if included, with rounding to prevent minor fluctuations)
-                if update_system_stats:
-                    curr_sys = current_data.get("status", {}).get("system")
-                    prev_sys = previous_data.get("status", {}).get("system")
-                    if curr_sys and prev_sys:
-                        # Round to 1 decimal to prevent 2.1% vs 2.2% triggering updates
-                        if (
-                            round(curr_sys.get("cpu_percent", 0), 1)
-                            != round(prev_sys.get("cpu_percent", 0), 1)
-                            or round(curr_sys.get("memory_percent", 0), 1)
-                            != round(prev_sys.get("memory_percent", 0), 1)
-                            or round(curr_sys.get("disk_percent", 0), 1)
-                            != round(prev_sys.get("disk_percent", 0), 1)
-                        ):
-                            has_changes = True
-                    elif curr_sys != prev_sys:
-                        has_changes = True
-
-                # Check server details (running status, PIDs, etc.)
-                if current_data.get("servers") != previous_data.get("servers"):
-                    has_changes = True
-
-                # Check goals
-                if current_data.get("goals") != previous_data.get("goals"):
-                    has_changes = True
-
-                # Check logs (new entries)
-                if current_data.get("logs") != previous_data.get("logs"):
-                    has_changes = True
+            # Compare per-section change keys instead of walking the dicts
+            data_text, current_keys = encode_dashboard_data(current_data)
+            if not update_system_stats and "system" in previous_keys:
+                # System stats are only sampled on slow cycles
+                current_keys["system"] = previous_keys["system"]
 
             # Only broadcast if there are actual changes
-            if has_changes:
-                await manager.broadcast(
-                    {
-                        "type": "update",
-                        "data": current_data,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
-                previous_data = current_data
+            if current_keys != previous_keys and await manager.broadcast_update(
+                data_text,
+                set(current_data),
+                has_system_stats=update_system_stats and "status" in current_data,
+            ):
+                previous_keys = current_keys
+
+            # Let bursts of change notifications collapse into one refresh
+            await asyncio.sleep(BROADCAST_MIN_INTERVAL)
 
         except Exception as e:
-            print(f"Error in broadcast task: {e}")
+            logger.error(f"Error in broadcast task: {e}")
             await asyncio.sleep(1)  # Brief pause on error before retrying
 
 
@@ -1504,6 +2131,11 @@ if STATIC_DIR.exists():
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 
 
+def _pick_uvicorn_impl(preferred: str, fallback: str) -> str:
+    """Select a uvicorn loop/HTTP implementation, preferring the fast one."""
+    return preferred if importlib.util.find_spec(preferred) else fallback
+
+
 def main():
     """Run the dashboard server."""
     # Create static directory if it doesn't exist
@@ -1525,6 +2157,8 @@ def main():
         app,
         host="0.0.0.0",
         port=8000,
+        loop=_pick_uvicorn_impl("uvloop", "asyncio"),
+        http=_pick_uvicorn_impl("httptools", "h11"),
         log_level="info",
         access_log=True,
     )
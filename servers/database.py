@@ -4,9 +4,15 @@ Database models and manager for PostgreSQL persistence.
 Provides SQLAlchemy models for Goals and Tasks with relationship management.
 """
 
+import copy
 import json
-from contextlib import contextmanager
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Optional
 
 from sqlalchemy import (
@@ -16,18 +22,112 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    Select,
     String,
     Text,
+    bindparam,
+    case,
     create_engine,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
     text,
+    tuple_,
+    type_coerce,
+    update,
 )
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Row, make_url
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, relationship, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.sql import functions
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 Base = declarative_base()
 
+# Compiled SQL cache entries per engine (SQLAlchemy's default is 500)
+QUERY_CACHE_SIZE = 1200
+
+# Session settings for every PostgreSQL connection: stuck queries and idle
+# transactions cannot pin pooled connections, and the short CRUD queries here
+# skip JIT compilation, which costs more than it saves on them
+POSTGRES_SESSION_SETTINGS = {
+    "statement_timeout": "5s",
+    "idle_in_transaction_session_timeout": "30s",
+    "jit": "off",
+}
+
+# Seconds a get_goal/get_task result may be served from memory. Writes through
+# the same DatabaseManager invalidate immediately. Writes made elsewhere (the
+# dashboard's AsyncDatabaseManager, other processes) are not seen by this cache
+# and may be served stale, or after deletion, for up to this long; callers that
+# read-modify-write pass fresh=True to go to the database instead.
+ENTITY_CACHE_TTL = 5.0
+
+
+def json_serializer(value: Any) -> str:
+    """Encode JSON/JSONB column values, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value)
+
+
+def json_deserializer(data: str | bytes) -> Any:
+    """Decode JSON/JSONB column values, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# JSON columns are binary, indexable JSONB on PostgreSQL and plain JSON elsewhere.
+# Index convention: filters using ->> (a single extracted key compared by
+# equality/range) get a BTREE expression index on that key; filters using @>
+# (containment) get a GIN index with jsonb_path_ops. GIN does not serve ->>.
+JSONColumn = JSON().with_variant(JSONB(), "postgresql")
+
+
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element: Any, compiler: Any, **kw: Any) -> str:
+    """
+    Render now() on SQLite in the text format SQLAlchemy stores datetimes in.
+
+    SQLite's CURRENT_TIMESTAMP is 'YYYY-MM-DD HH:MM:SS', which sorts before a
+    bound 'YYYY-MM-DD HH:MM:SS.000000' for the same instant, so keyset cursors
+    built from server-default timestamps would match their own page again.
+    """
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+# Task statuses that make up the live work queue. Queries meant to use the
+# partial idx_task_active* indexes must filter on (a subset of) these, since
+# PostgreSQL only picks a partial index when the WHERE clause implies its own.
+ACTIVE_TASK_STATUSES = ("pending", "in_progress")
+
+# Queue order for claiming tasks; priorities are strings, so rank them explicitly
+TASK_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+
+# Keyset pagination: pages are ordered by (created_at, id) descending and the
+# cursor is the (created_at, id) of the last row handed out
+DEFAULT_PAGE_SIZE = 200
+PageCursor = tuple[datetime, str]
+
 
 class GoalModel(Base):
     """SQLAlchemy model for Goals."""
@@ -38,40 +138,55 @@ class GoalModel(Base):
     description = Column(Text, nullable=False)
     priority = Column(String(10), nullable=False, index=True)
     status = Column(String(20), nullable=False, index=True)
-    repos = Column(JSON, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    repos = Column(JSONColumn, default=list)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
-    meta_data = Column("metadata", JSON, default=dict)
+    meta_data = Column("metadata", JSONColumn, default=dict)
 
-    # Relationship to tasks
+    # Relationship to tasks. Never loaded implicitly: callers only need task
+    # IDs, which the managers fetch with one narrow query (see load_task_ids).
+    # Deletes are plain DELETE statements; the FK's ON DELETE CASCADE (and the
+    # explicit task delete in _delete_goal_and_count) remove children, so the
+    # ORM never loads the collection to cascade or orphan it.
     tasks = relationship(
         "TaskModel",
         back_populates="goal",
-        cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise",
     )
 
+    # Fetch server-generated timestamps via RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     # Indexes for common queries
     __table_args__ = (
         Index("idx_goal_status_priority", "status", "priority"),
-        Index("idx_goal_created_at", "created_at"),
+        Index("idx_goal_created_at_id", "created_at", "id"),  # Keyset pages
+        # GIN for @> containment filters on the JSONB metadata
+        Index(
+            "idx_goal_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # BTREE for list_goals(owner=...), which filters on metadata->>'owner'
+        Index("idx_goal_meta_owner", text("(metadata->>'owner')")).ddl_if(
+            dialect="postgresql"
+        ),
     )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "description": self.description,
-            "priority": self.priority,
-            "status": self.status,
-            "repos": self.repos or [],
-            "tasks": [task.id for task in self.tasks],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "metadata": self.meta_data or {},
-        }
+    def to_dict(self, task_ids: Optional[list[str]] = None) -> dict[str, Any]:
+        """Convert model to dictionary (task IDs default to the loaded tasks)."""
+        if task_ids is None:
+            task_ids = [task.id for task in self.tasks]
+        return _goal_to_dict(self, task_ids)
 
 
 class TaskModel(Base):
@@ -90,56 +205,281 @@ class TaskModel(Base):
     type = Column(String(50), nullable=False)
     status = Column(String(20), nullable=False, index=True)
     priority = Column(String(10), nullable=False, index=True)
-    dependencies = Column(JSON, default=list)
+    dependencies = Column(JSONColumn, default=list)
     repo = Column(String(255), nullable=True)
     jira_ticket = Column(String(50), nullable=True)
     estimated_effort = Column(String(50), nullable=True)
-    assigned_tools = Column(JSON, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    assigned_tools = Column(JSONColumn, default=list)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
-    completed_at = Column(DateTime, nullable=True)
-    result = Column(JSON, nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    result = Column(JSONColumn, nullable=True)
 
     # Relationship to goal
     goal = relationship("GoalModel", back_populates="tasks")
 
+    # Fetch server-generated timestamps via RETURNING instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     # Indexes for common queries
     __table_args__ = (
         Index("idx_task_status_priority", "status", "priority"),
         Index("idx_task_goal_status", "goal_id", "status"),
-        Index("idx_task_created_at", "created_at"),
+        Index("idx_task_created_at_id", "created_at", "id"),  # Keyset pages
+        # Partial indexes over the small active queue: get_next_tasks
+        # (goal_id + status) and list_active_tasks (newest first)
+        Index(
+            "idx_task_active",
+            "goal_id",
+            "priority",
+            postgresql_where=status.in_(ACTIVE_TASK_STATUSES),
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_task_active_created_at",
+            "created_at",
+            postgresql_where=status.in_(ACTIVE_TASK_STATUSES),
+        ).ddl_if(dialect="postgresql"),
+        # GIN for @> containment filters on the JSONB lists
+        Index(
+            "idx_task_dependencies_gin",
+            "dependencies",
+            postgresql_using="gin",
+            postgresql_ops={"dependencies": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "idx_task_assigned_tools_gin",
+            "assigned_tools",
+            postgresql_using="gin",
+            postgresql_ops={"assigned_tools": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert model to dictionary."""
-        return {
-            "id": self.id,
-            "goal_id": self.goal_id,
-            "description": self.description,
-            "type": self.type,
-            "status": self.status,
-            "priority": self.priority,
-            "dependencies": self.dependencies or [],
-            "repo": self.repo,
-            "jira_ticket": self.jira_ticket,
-            "estimated_effort": self.estimated_effort,
-            "assigned_tools": self.assigned_tools or [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
-            "result": self.result,
-        }
+        return _task_to_dict(self)
+
+
+# Every mapped column, for reads that return plain rows rather than ORM objects
+# (no identity map, no per-instance state, nothing to expunge). The order is
+# the one the serializers below unpack.
+GOAL_FIELDS = (
+    "id",
+    "description",
+    "priority",
+    "status",
+    "repos",
+    "created_at",
+    "updated_at",
+    "meta_data",
+)
+TASK_FIELDS = (
+    "id",
+    "goal_id",
+    "description",
+    "type",
+    "status",
+    "priority",
+    "dependencies",
+    "repo",
+    "jira_ticket",
+    "estimated_effort",
+    "assigned_tools",
+    "created_at",
+    "updated_at",
+    "completed_at",
+    "result",
+)
+GOAL_COLUMNS = tuple(getattr(GoalModel, name) for name in GOAL_FIELDS)
+TASK_COLUMNS = tuple(getattr(TaskModel, name) for name in TASK_FIELDS)
+
+# Model instances read as the same tuples as rows, in one C-level call
+_goal_fields = attrgetter(*GOAL_FIELDS)
+_task_fields = attrgetter(*TASK_FIELDS)
+
+
+def _goal_to_dict(goal: Any, task_ids: list[str]) -> dict[str, Any]:
+    """Serialize a goal model or a row selected from GOAL_COLUMNS."""
+    # Unpacking a Row by position is several times cheaper than attribute access
+    (
+        goal_id,
+        description,
+        priority,
+        status,
+        repos,
+        created_at,
+        updated_at,
+        metadata,
+    ) = (
+        goal if isinstance(goal, Row) else _goal_fields(goal)
+    )
+    return {
+        "id": goal_id,
+        "description": description,
+        "priority": priority,
+        "status": status,
+        "repos": repos or [],
+        "tasks": task_ids,
+        "created_at": created_at.isoformat() if created_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "metadata": metadata or {},
+    }
+
+
+def _task_to_dict(task: Any) -> dict[str, Any]:
+    """Serialize a task model or a row selected from TASK_COLUMNS."""
+    (
+        task_id,
+        goal_id,
+        description,
+        task_type,
+        status,
+        priority,
+        dependencies,
+        repo,
+        jira_ticket,
+        estimated_effort,
+        assigned_tools,
+        created_at,
+        updated_at,
+        completed_at,
+        result,
+    ) = (
+        task if isinstance(task, Row) else _task_fields(task)
+    )
+    return {
+        "id": task_id,
+        "goal_id": goal_id,
+        "description": description,
+        "type": task_type,
+        "status": status,
+        "priority": priority,
+        "dependencies": dependencies or [],
+        "repo": repo,
+        "jira_ticket": jira_ticket,
+        "estimated_effort": estimated_effort,
+        "assigned_tools": assigned_tools or [],
+        "created_at": created_at.isoformat() if created_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+        "completed_at": completed_at.isoformat() if completed_at else None,
+        "result": result,
+    }
+
+
+# In-place upgrade for databases created while the JSON columns were plain
+# json: convert them to jsonb (only if still json)
+JSONB_COLUMNS = {
+    "goals": ("repos", "metadata"),
+    "tasks": ("dependencies", "assigned_tools", "result"),
+}
+# Timestamps were naive UTC values filled in by Python; they are now
+# timestamptz columns, and created/updated default to now() on the server
+TIMESTAMP_DEFAULT_COLUMNS = {
+    "goals": ("created_at", "updated_at"),
+    "tasks": ("created_at", "updated_at"),
+}
+TIMESTAMP_COLUMNS = {
+    "goals": TIMESTAMP_DEFAULT_COLUMNS["goals"],
+    "tasks": (*TIMESTAMP_DEFAULT_COLUMNS["tasks"], "completed_at"),
+}
+JSONB_UPGRADE_DDL = [
+    *(
+        f"""
+        DO $$
+        BEGIN
+            IF (
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = '{table}' AND column_name = '{column}'
+            ) = 'json' THEN
+                ALTER TABLE {table} ALTER COLUMN "{column}" TYPE jsonb
+                    USING "{column}"::jsonb;
+            END IF;
+        END
+        $$
+        """
+        for table, columns in JSONB_COLUMNS.items()
+        for column in columns
+    ),
+]
+TIMESTAMP_UPGRADE_DDL = [
+    *(
+        f"""
+        DO $$
+        BEGIN
+            IF (
+                SELECT data_type FROM information_schema.columns
+                WHERE table_name = '{table}' AND column_name = '{column}'
+            ) = 'timestamp without time zone' THEN
+                ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamptz
+                    USING {column} AT TIME ZONE 'UTC';
+            END IF;
+        END
+        $$
+        """
+        for table, columns in TIMESTAMP_COLUMNS.items()
+        for column in columns
+    ),
+    *(
+        f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now()"
+        for table, columns in TIMESTAMP_DEFAULT_COLUMNS.items()
+        for column in columns
+    ),
+]
+
+# Single-column created_at indexes superseded by the (created_at, id) ones
+SUPERSEDED_INDEX_DDL = [
+    "DROP INDEX IF EXISTS idx_goal_created_at",
+    "DROP INDEX IF EXISTS idx_task_created_at",
+]
+
+# Indexes read by the task queue, loaded into shared buffers by prewarm()
+PREWARM_RELATIONS = ("tasks_pkey", "idx_task_active", "idx_task_active_created_at")
+
+# LISTEN/NOTIFY channel signalled whenever goals or tasks change
+CHANGE_NOTIFY_CHANNEL = "dashboard_changes"
+
+# Statement-level triggers: one NOTIFY per write (payload is the table name),
+# and PostgreSQL folds duplicates within a transaction
+CHANGE_NOTIFY_DDL = [
+    f"""
+    CREATE OR REPLACE FUNCTION notify_dashboard_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{CHANGE_NOTIFY_CHANNEL}', TG_TABLE_NAME);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    *(
+        statement
+        for table in ("goals", "tasks")
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {table}_notify_change ON {table}",
+            f"""
+            CREATE TRIGGER {table}_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_dashboard_change()
+            """,
+        )
+    ),
+]
 
 
 class DatabaseManager:
     """Manages PostgreSQL database connections and operations."""
 
     def __init__(
-        self, database_url: str, pool_size: int = 10, max_overflow: int = 20
+        self,
+        database_url: str,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        application_name: str = "mcp-db-manager",
     ) -> None:
         """
         Initialize database manager.
@@ -148,15 +488,22 @@ class DatabaseManager:
             database_url: PostgreSQL connection string
             pool_size: Number of connections to keep in pool
             max_overflow: Maximum overflow connections
+            pool_timeout: Seconds to wait for a free pooled connection
+            application_name: Name shown for these connections in pg_stat_activity
         """
         self.database_url = database_url
         self.engine = create_engine(
             database_url,
             poolclass=QueuePool,
+            connect_args=postgres_connect_args(database_url, application_name),
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
             pool_pre_ping=True,  # Verify connections before use
             pool_recycle=3600,  # Recycle connections after 1 hour
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+            query_cache_size=QUERY_CACHE_SIZE,
             echo=False,  # Set to True for SQL logging
         )
         self.SessionLocal = sessionmaker(
@@ -164,14 +511,37 @@ class DatabaseManager:
             autoflush=False,
             bind=self.engine,
         )
+        # Short-lived get_goal/get_task results, invalidated on writes made
+        # through this manager: {id: (expires_at, dict)}
+        self._goal_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._task_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
 
     def create_tables(self) -> None:
-        """Create all database tables."""
-        Base.metadata.create_all(bind=self.engine)
+        """Create all database tables (plus schema upgrades and notify triggers)."""
+        with self.engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                # Index builds and type changes may outlast statement_timeout
+                conn.execute(text("SET LOCAL statement_timeout = 0"))
+            Base.metadata.create_all(bind=conn)
+            if conn.dialect.name == "postgresql":
+                for statement in (
+                    *JSONB_UPGRADE_DDL,
+                    *TIMESTAMP_UPGRADE_DDL,
+                    *SUPERSEDED_INDEX_DDL,
+                ):
+                    conn.execute(text(statement))
+                # create_all skips indexes of tables that already exist
+                for table in Base.metadata.sorted_tables:
+                    for index in table.indexes:
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                for statement in CHANGE_NOTIFY_DDL:
+                    conn.execute(text(statement))
 
     def drop_tables(self) -> None:
         """Drop all database tables (USE WITH CAUTION)."""
         Base.metadata.drop_all(bind=self.engine)
+        self._invalidate(all_goals=True, all_tasks=True)
 
     @contextmanager
     def get_session(self):
@@ -180,7 +550,7 @@ class DatabaseManager:
 
         Usage:
             with db_manager.get_session() as session:
-                session.query(GoalModel).all()
+                session.scalars(select(GoalModel)).all()
         """
         session = self.SessionLocal()
         try:
@@ -207,49 +577,122 @@ class DatabaseManager:
         metadata: dict[str, Any],
     ) -> dict[str, Any]:
         """Create a new goal and return as dict."""
+        return self.bulk_create_goals(
+            [
+                {
+                    "id": goal_id,
+                    "description": description,
+                    "priority": priority,
+                    "repos": repos,
+                    "meta_data": metadata,
+                }
+            ]
+        )[0]
+
+    def bulk_create_goals(self, goals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Create many goals with a single multi-row INSERT ... RETURNING.
+
+        Args:
+            goals: Column values per goal (id, description, priority, repos,
+                meta_data); status defaults to "planned"
+
+        Returns:
+            Created goals as dicts, in input order
+        """
+        if not goals:
+            return []
+
+        rows = [
+            {
+                "status": "planned",
+                "repos": [],
+                "meta_data": {},
+                **goal,
+            }
+            for goal in goals
+        ]
         with self.get_session() as session:
-            goal = GoalModel(
-                id=goal_id,
-                description=description,
-                priority=priority,
-                status="planned",
-                repos=repos,
-                meta_data=metadata,
+            created = session.scalars(
+                insert(GoalModel).returning(GoalModel, sort_by_parameter_order=True),
+                rows,
             )
-            session.add(goal)
-            session.flush()
-            session.refresh(goal)
-            # Convert to dict while session is still active
-            return goal.to_dict()
+            # New goals have no tasks yet
+            return [goal.to_dict(task_ids=[]) for goal in created]
 
-    def get_goal(self, goal_id: str) -> Optional[GoalModel]:
-        """Get a goal by ID."""
+    def get_goal(self, goal_id: str, fresh: bool = False) -> Optional[dict[str, Any]]:
+        """
+        Get a goal by ID (served from the short TTL cache when fresh).
+
+        Pass fresh=True to skip the cache, e.g. before acting on the result.
+        """
+        if not fresh:
+            cached = self._cache_get(self._goal_cache, goal_id)
+            if cached is not None:
+                return cached
         with self.get_session() as session:
-            goal = session.query(GoalModel).filter(GoalModel.id == goal_id).first()
-            if goal:
-                # Detach from session to use outside context
-                session.expunge(goal)
-            return goal
+            row = session.execute(
+                select(*GOAL_COLUMNS).where(GoalModel.id == goal_id)
+            ).first()
+            if row is None:
+                self._invalidate(goal_ids=[goal_id])
+                return None
+            goal = _goal_to_dict(row, load_task_ids(session, [goal_id])[goal_id])
+        self._cache_put(self._goal_cache, goal_id, goal)
+        return goal
 
     def list_goals(
-        self, status: Optional[str] = None, priority: Optional[str] = None
-    ) -> list[GoalModel]:
-        """List goals with optional filters."""
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        owner: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> list[dict[str, Any]]:
+        """List goals with optional filters, newest first."""
+        query = _list_goals_query(
+            status, priority, owner, self.engine.dialect.name, limit, cursor
+        )
         with self.get_session() as session:
-            query = session.query(GoalModel)
+            rows = session.execute(query).all()
+            return _goal_dicts(rows, load_task_ids(session, [row.id for row in rows]))
 
-            if status:
-                query = query.filter(GoalModel.status == status)
-            if priority:
-                query = query.filter(GoalModel.priority == priority)
-
-            goals = query.order_by(GoalModel.created_at.desc()).all()
+    def list_goals_page(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        owner: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[PageCursor]]:
+        """One page of list_goals and the cursor of the next (None at the end)."""
+        query = _list_goals_query(
+            status,
+            priority,
+            owner,
+            self.engine.dialect.name,
+            _page_fetch_size(limit),
+            cursor,
+        )
+        with self.get_session() as session:
+            rows, next_cursor = _split_page(session.execute(query).all(), limit)
+            task_ids = load_task_ids(session, [row.id for row in rows])
+            return _goal_dicts(rows, task_ids), next_cursor
 
-            # Detach from session
-            for goal in goals:
-                session.expunge(goal)
+    def list_recent_goals(self, limit: int = 5) -> list[dict[str, Any]]:
+        """List the most recently updated goals."""
+        query = select(*GOAL_COLUMNS).order_by(GoalModel.updated_at.desc()).limit(limit)
+        with self.get_session() as session:
+            rows = session.execute(query).all()
+            return _goal_dicts(rows, load_task_ids(session, [row.id for row in rows]))
 
-            return goals
+    def count_goals_by_status(self) -> dict[str, int]:
+        """Count goals per status."""
+        with self.get_session() as session:
+            rows = session.execute(
+                select(GoalModel.status, func.count()).group_by(GoalModel.status)
+            )
+            return {status: count for status, count in rows}
 
     def update_goal(
         self,
@@ -259,41 +702,60 @@ class DatabaseManager:
         status: Optional[str] = None,
         repos: Optional[list[str]] = None,
         metadata: Optional[dict[str, Any]] = None,
-    ) -> Optional[GoalModel]:
-        """Update a goal."""
-        with self.get_session() as session:
-            goal = session.query(GoalModel).filter(GoalModel.id == goal_id).first()
-            if not goal:
-                return None
+    ) -> Optional[dict[str, Any]]:
+        """Update a goal with one UPDATE ... RETURNING and return it as a dict."""
+        changes: dict[str, Any] = {
+            name: value
+            for name, value in (
+                ("description", description),
+                ("priority", priority),
+                ("status", status),
+                ("repos", repos),
+            )
+            if value is not None
+        }
+        changes["updated_at"] = func.now()  # Bump even if nothing else changed
 
-            if description is not None:
-                goal.description = description
-            if priority is not None:
-                goal.priority = priority
-            if status is not None:
-                goal.status = status
-            if repos is not None:
-                goal.repos = repos
+        with self.get_session() as session:
             if metadata is not None:
-                if goal.meta_data:
-                    goal.meta_data.update(metadata)
-                else:
-                    goal.meta_data = metadata
+                merged = _merged_metadata(
+                    session, goal_id, metadata, self.engine.dialect.name
+                )
+                if merged is None:
+                    return None
+                changes["meta_data"] = merged
 
-            goal.updated_at = datetime.utcnow()
-            session.flush()
-            session.refresh(goal)
-            session.expunge(goal)
-            return goal
+            row = session.execute(
+                update(GoalModel)
+                .where(GoalModel.id == goal_id)
+                .values(changes)
+                .returning(*GOAL_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if row is None:
+                return None
+            result = _goal_to_dict(row, load_task_ids(session, [goal_id])[goal_id])
+        # Invalidate after commit so a concurrent read cannot re-cache old data
+        self._invalidate(goal_ids=[goal_id])
+        return result
 
     def delete_goal(self, goal_id: str) -> bool:
-        """Delete a goal and all its tasks (cascading)."""
+        """Delete a goal and all its tasks."""
+        return self.delete_goal_and_count(goal_id) is not None
+
+    def delete_goal_and_count(self, goal_id: str) -> Optional[int]:
+        """
+        Delete a goal and its tasks, returning how many tasks were removed.
+
+        Both deletes run in one transaction using RETURNING, so the caller
+        needs no separate existence check or task listing. Returns None if
+        the goal does not exist.
+        """
         with self.get_session() as session:
-            goal = session.query(GoalModel).filter(GoalModel.id == goal_id).first()
-            if not goal:
-                return False
-            session.delete(goal)
-            return True
+            deleted = _delete_goal_and_count(session, goal_id)
+        if deleted is not None:
+            self._invalidate(goal_ids=[goal_id], all_tasks=bool(deleted))
+        return deleted
 
     # Task Operations
     def create_task(
@@ -310,58 +772,185 @@ class DatabaseManager:
         assigned_tools: Optional[list[str]] = None,
     ) -> dict[str, Any]:
         """Create a new task and return as dict."""
+        return self.bulk_create_tasks(
+            [
+                {
+                    "id": task_id,
+                    "goal_id": goal_id,
+                    "description": description,
+                    "type": task_type,
+                    "priority": priority,
+                    "dependencies": dependencies,
+                    "repo": repo,
+                    "jira_ticket": jira_ticket,
+                    "estimated_effort": estimated_effort,
+                    "assigned_tools": assigned_tools or [],
+                }
+            ]
+        )[0]
+
+    def bulk_create_tasks(self, tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Create many tasks with a single multi-row INSERT ... RETURNING.
+
+        Args:
+            tasks: Column values per task (id, goal_id, description, type,
+                priority, dependencies, repo, jira_ticket, estimated_effort,
+                assigned_tools); status defaults to "pending"
+
+        Returns:
+            Created tasks as dicts, in input order
+        """
+        if not tasks:
+            return []
+
+        rows = [
+            {
+                "status": "pending",
+                "dependencies": [],
+                "repo": None,
+                "jira_ticket": None,
+                "estimated_effort": None,
+                "assigned_tools": [],
+                **task,
+            }
+            for task in tasks
+        ]
         with self.get_session() as session:
-            task = TaskModel(
-                id=task_id,
-                goal_id=goal_id,
-                description=description,
-                type=task_type,
-                status="pending",
-                priority=priority,
-                dependencies=dependencies,
-                repo=repo,
-                jira_ticket=jira_ticket,
-                estimated_effort=estimated_effort,
-                assigned_tools=assigned_tools or [],
+            created = session.scalars(
+                insert(TaskModel).returning(TaskModel, sort_by_parameter_order=True),
+                rows,
             )
-            session.add(task)
-            session.flush()
-            session.refresh(task)
-            # Convert to dict while session is still active
-            return task.to_dict()
+            result = [task.to_dict() for task in created]
+        # Parent goals' task lists changed
+        self._invalidate(goal_ids={row["goal_id"] for row in rows})
+        return result
 
-    def get_task(self, task_id: str) -> Optional[TaskModel]:
-        """Get a task by ID."""
+    def list_dependent_task_ids(self, task_id: str) -> list[str]:
+        """IDs of tasks whose dependencies include task_id."""
+        with self.get_session() as session:
+            if self.engine.dialect.name == "postgresql":
+                # JSONB @> containment, served by idx_task_dependencies_gin
+                query = select(TaskModel.id).where(
+                    type_coerce(TaskModel.dependencies, JSONB).contains([task_id])
+                )
+                return list(session.scalars(query))
+            rows = session.execute(select(TaskModel.id, TaskModel.dependencies))
+            return [row.id for row in rows if task_id in (row.dependencies or [])]
+
+    def existing_task_ids(self, task_ids: list[str]) -> set[str]:
+        """Return which of the given task IDs exist, in one query."""
+        if not task_ids:
+            return set()
+        with self.get_session() as session:
+            return set(
+                session.scalars(select(TaskModel.id).where(TaskModel.id.in_(task_ids)))
+            )
+
+    def get_task(self, task_id: str, fresh: bool = False) -> Optional[dict[str, Any]]:
+        """
+        Get a task by ID (served from the short TTL cache when fresh).
+
+        Pass fresh=True to skip the cache, e.g. before acting on the result.
+        """
+        if not fresh:
+            cached = self._cache_get(self._task_cache, task_id)
+            if cached is not None:
+                return cached
         with self.get_session() as session:
-            task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
-            if task:
-                session.expunge(task)
-            return task
+            row = session.execute(
+                select(*TASK_COLUMNS).where(TaskModel.id == task_id)
+            ).first()
+        if row is None:
+            self._invalidate(task_ids=[task_id])
+            return None
+        task = _task_to_dict(row)
+        self._cache_put(self._task_cache, task_id, task)
+        return task
 
     def list_tasks(
         self,
         goal_id: Optional[str] = None,
         status: Optional[str] = None,
         priority: Optional[str] = None,
-    ) -> list[TaskModel]:
-        """List tasks with optional filters."""
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> list[dict[str, Any]]:
+        """List tasks with optional filters, newest first."""
+        query, params = _list_tasks_query(goal_id, status, priority, limit, cursor)
+        with self.get_session() as session:
+            return [_task_to_dict(row) for row in session.execute(query, params)]
+
+    def list_tasks_page(
+        self,
+        goal_id: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[PageCursor]]:
+        """One page of list_tasks and the cursor of the next (None at the end)."""
+        query, params = _list_tasks_query(
+            goal_id, status, priority, _page_fetch_size(limit), cursor
+        )
         with self.get_session() as session:
-            query = session.query(TaskModel)
+            rows, next_cursor = _split_page(session.execute(query, params).all(), limit)
+            return [_task_to_dict(row) for row in rows], next_cursor
 
-            if goal_id:
-                query = query.filter(TaskModel.goal_id == goal_id)
-            if status:
-                query = query.filter(TaskModel.status == status)
-            if priority:
-                query = query.filter(TaskModel.priority == priority)
+    def list_active_tasks(self, limit: int = 10) -> list[dict[str, Any]]:
+        """List the newest pending or in-progress tasks."""
+        with self.get_session() as session:
+            rows = session.execute(_active_tasks_query(limit))
+            return [_task_to_dict(row) for row in rows]
 
-            tasks = query.order_by(TaskModel.created_at.desc()).all()
+    def count_tasks_by_status(self) -> dict[str, int]:
+        """Count tasks per status."""
+        with self.get_session() as session:
+            rows = session.execute(
+                select(TaskModel.status, func.count()).group_by(TaskModel.status)
+            )
+            return {status: count for status, count in rows}
+
+    def claim_next_tasks(
+        self, limit: int = 1, goal_id: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Atomically move up to ``limit`` ready pending tasks to in_progress.
 
-            # Detach from session
-            for task in tasks:
-                session.expunge(task)
+        A task is ready once all its dependencies are completed. The claim is
+        one UPDATE over a FOR UPDATE SKIP LOCKED subquery (PostgreSQL), so
+        concurrent workers take different tasks instead of queueing on a row.
+        """
+        if limit < 1:
+            return []
+        with self.get_session() as session:
+            pending = session.execute(_pending_dependencies_query(goal_id)).all()
+            dependency_ids = {dep_id for _, deps in pending for dep_id in deps or ()}
+            completed = (
+                set(
+                    session.scalars(
+                        select(TaskModel.id).where(
+                            TaskModel.id.in_(dependency_ids),
+                            TaskModel.status == "completed",
+                        )
+                    )
+                )
+                if dependency_ids
+                else set()
+            )
+            ready_ids = [
+                task_id for task_id, deps in pending if completed.issuperset(deps or ())
+            ]
+            if not ready_ids:
+                return []
 
-            return tasks
+            rows = session.execute(_claim_tasks_query(ready_ids, limit)).all()
+            claimed = [_task_to_dict(row) for row in rows]
+        self._invalidate(task_ids=[task["id"] for task in claimed])
+        # RETURNING order is unspecified; hand tasks back in queue order
+        rank = {task_id: position for position, task_id in enumerate(ready_ids)}
+        claimed.sort(key=lambda task: rank[task["id"]])
+        return claimed
 
     def update_task(
         self,
@@ -369,44 +958,128 @@ class DatabaseManager:
         status: Optional[str] = None,
         result: Optional[Any] = None,
         completed_at: Optional[datetime] = None,
-    ) -> Optional[TaskModel]:
-        """Update a task."""
+    ) -> Optional[dict[str, Any]]:
+        """Update a task with one UPDATE ... RETURNING and return it as a dict."""
+        changes: dict[str, Any] = {
+            name: value
+            for name, value in (
+                ("status", status),
+                ("result", result),
+                ("completed_at", completed_at),
+            )
+            if value is not None
+        }
+        changes["updated_at"] = func.now()  # Bump even if nothing else changed
+
         with self.get_session() as session:
-            task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
-            if not task:
+            row = session.execute(
+                update(TaskModel)
+                .where(TaskModel.id == task_id)
+                .values(changes)
+                .returning(*TASK_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if row is None:
                 return None
-
-            if status is not None:
-                task.status = status
-            if result is not None:
-                task.result = result
-            if completed_at is not None:
-                task.completed_at = completed_at
-
-            task.updated_at = datetime.utcnow()
-            session.flush()
-            session.refresh(task)
-            session.expunge(task)
-            return task
+            task = _task_to_dict(row)
+        self._invalidate(task_ids=[task_id])
+        return task
 
     def delete_task(self, task_id: str) -> bool:
-        """Delete a task."""
+        """Delete a task with a single DELETE statement."""
+        return self.bulk_delete_tasks([task_id]) > 0
+
+    def bulk_delete_tasks(self, task_ids: list[str]) -> int:
+        """Delete many tasks in one statement, returning how many existed."""
+        if not task_ids:
+            return 0
         with self.get_session() as session:
-            task = session.query(TaskModel).filter(TaskModel.id == task_id).first()
-            if not task:
-                return False
-            session.delete(task)
-            return True
+            deleted = session.execute(_delete_tasks_query(task_ids)).rowcount
+        # Parent goals are unknown here, so drop every cached goal task list
+        self._invalidate(task_ids=task_ids, all_goals=bool(deleted))
+        return deleted
 
     def get_task_count(self) -> int:
-        """Get total number of tasks."""
+        """Get the exact number of tasks (COUNT(*) scan)."""
         with self.get_session() as session:
-            return session.query(TaskModel).count()
+            return session.scalar(select(func.count()).select_from(TaskModel))
 
     def get_goal_count(self) -> int:
-        """Get total number of goals."""
+        """Get the exact number of goals (COUNT(*) scan)."""
         with self.get_session() as session:
-            return session.query(GoalModel).count()
+            return session.scalar(select(func.count()).select_from(GoalModel))
+
+    def get_task_count_estimate(self) -> int:
+        """Approximate number of tasks; see _estimate_row_count."""
+        with self.get_session() as session:
+            return _estimate_row_count(session, TaskModel)
+
+    def get_goal_count_estimate(self) -> int:
+        """Approximate number of goals; see _estimate_row_count."""
+        with self.get_session() as session:
+            return _estimate_row_count(session, GoalModel)
+
+    # Entity cache
+    def _cache_get(self, cache: dict[str, tuple[float, Any]], key: str) -> Any:
+        """Return a private copy of a fresh cached dict, else None."""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del cache[key]
+                return None
+            return copy.deepcopy(value)
+
+    def _cache_put(
+        self, cache: dict[str, tuple[float, Any]], key: str, value: Any
+    ) -> None:
+        """Cache a copy so later changes by the caller cannot leak in."""
+        with self._cache_lock:
+            cache[key] = (time.monotonic() + ENTITY_CACHE_TTL, copy.deepcopy(value))
+
+    def _invalidate(
+        self,
+        goal_ids: Iterable[str] = (),
+        task_ids: Iterable[str] = (),
+        all_goals: bool = False,
+        all_tasks: bool = False,
+    ) -> None:
+        """Drop cached goals/tasks touched by a write."""
+        with self._cache_lock:
+            if all_goals:
+                self._goal_cache.clear()
+            for goal_id in goal_ids:
+                self._goal_cache.pop(goal_id, None)
+            if all_tasks:
+                self._task_cache.clear()
+            for task_id in task_ids:
+                self._task_cache.pop(task_id, None)
+
+    def prewarm(self, relations: Iterable[str] = PREWARM_RELATIONS) -> int:
+        """
+        Read relations into PostgreSQL's buffer cache with pg_prewarm.
+
+        Spares the first queries after a (re)start from paging these indexes
+        in from disk. Installs the extension if needed, which requires CREATE
+        privilege on the database. Missing relations are skipped; returns the
+        number of blocks loaded (0 on other dialects).
+        """
+        if self.engine.dialect.name != "postgresql":
+            return 0
+        query = text(
+            "SELECT pg_prewarm(oid) FROM (SELECT to_regclass(:relation) AS oid) r "
+            "WHERE oid IS NOT NULL"
+        )
+        with self.engine.begin() as conn:
+            # Reading a large index may outlast statement_timeout
+            conn.execute(text("SET LOCAL statement_timeout = 0"))
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_prewarm"))
+            return sum(
+                conn.scalar(query, {"relation": relation}) or 0
+                for relation in relations
+            )
 
     def health_check(self) -> bool:
         """Check database connection health."""
@@ -416,3 +1089,576 @@ class DatabaseManager:
             return True
         except SQLAlchemyError:
             return False
+
+
+def _estimate_row_count(session: Session, model: type[Base]) -> int:
+    """
+    Row count for stats displays without a COUNT(*) table scan.
+
+    On PostgreSQL this reads the planner estimate (pg_class.reltuples), kept
+    current by autovacuum/ANALYZE. Tables that were never analyzed report -1,
+    and other dialects have no such catalog, so both fall back to COUNT(*).
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        estimate = session.scalar(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table_name)"
+            ),
+            {"table_name": model.__tablename__},
+        )
+        if estimate is not None and estimate >= 0:
+            return estimate
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def _before_cursor(model: Any, created_at: Any, row_id: Any) -> Any:
+    """Keyset condition: rows after the cursor in (created_at, id) DESC order."""
+    return tuple_(model.created_at, model.id) < tuple_(created_at, row_id)
+
+
+def _page_fetch_size(limit: int) -> int:
+    """Rows to fetch for a page of ``limit``: one extra tells if more remain."""
+    if limit < 1:
+        raise ValueError(f"Page limit must be positive, got {limit}")
+    return limit + 1
+
+
+def _split_page(rows: list[Any], limit: int) -> tuple[list[Any], Optional[PageCursor]]:
+    """Trim an over-fetched page to ``limit`` rows and derive the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], (last.created_at, last.id)
+
+
+def encode_cursor(cursor: Optional[PageCursor]) -> Optional[str]:
+    """Render a page cursor as an opaque string for API clients."""
+    if cursor is None:
+        return None
+    created_at, row_id = cursor
+    return f"{created_at.isoformat()}|{row_id}"
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[PageCursor]:
+    """Parse a string from encode_cursor; raises ValueError if malformed."""
+    if not cursor:
+        return None
+    created_at, _, row_id = cursor.partition("|")
+    if not row_id:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return datetime.fromisoformat(created_at), row_id
+
+
+def _list_goals_query(
+    status: Optional[str],
+    priority: Optional[str],
+    owner: Optional[str],
+    dialect_name: str,
+    limit: Optional[int],
+    cursor: Optional[PageCursor],
+) -> Select:
+    """The list_goals SELECT, newest first, optionally one keyset page."""
+    query = select(*GOAL_COLUMNS)
+    if status:
+        query = query.where(GoalModel.status == status)
+    if priority:
+        query = query.where(GoalModel.priority == priority)
+    if owner:
+        query = query.where(_goal_owner_matches(owner, dialect_name))
+    if cursor is not None:
+        query = query.where(_before_cursor(GoalModel, *cursor))
+    query = query.order_by(GoalModel.created_at.desc(), GoalModel.id.desc())
+    return query if limit is None else query.limit(limit)
+
+
+@lru_cache(maxsize=32)
+def _list_tasks_statement(
+    has_goal: bool,
+    has_status: bool,
+    has_priority: bool,
+    has_cursor: bool,
+    has_limit: bool,
+) -> Select:
+    """
+    Build the list_tasks SELECT for one combination of filters, once.
+
+    Filter, cursor and limit values are bound parameters, so there are only
+    32 statement shapes; reusing them skips rebuilding the Select and its
+    cache key on every call while the engine's compiled cache keeps the SQL.
+    """
+    query = select(*TASK_COLUMNS)
+    if has_goal:
+        query = query.where(TaskModel.goal_id == bindparam("goal_id"))
+    if has_status:
+        query = query.where(TaskModel.status == bindparam("status"))
+    if has_priority:
+        query = query.where(TaskModel.priority == bindparam("priority"))
+    if has_cursor:
+        query = query.where(
+            _before_cursor(
+                TaskModel,
+                bindparam("cursor_created_at", type_=TaskModel.created_at.type),
+                bindparam("cursor_id", type_=TaskModel.id.type),
+            )
+        )
+    query = query.order_by(TaskModel.created_at.desc(), TaskModel.id.desc())
+    return query.limit(bindparam("limit")) if has_limit else query
+
+
+def _list_tasks_query(
+    goal_id: Optional[str],
+    status: Optional[str],
+    priority: Optional[str],
+    limit: Optional[int] = None,
+    cursor: Optional[PageCursor] = None,
+) -> tuple[Select, dict[str, Any]]:
+    """Return the cached list_tasks statement and its parameters."""
+    filters = {"goal_id": goal_id, "status": status, "priority": priority}
+    params: dict[str, Any] = {name: value for name, value in filters.items() if value}
+    if cursor is not None:
+        params["cursor_created_at"], params["cursor_id"] = cursor
+    if limit is not None:
+        params["limit"] = limit
+    query = _list_tasks_statement(
+        bool(goal_id),
+        bool(status),
+        bool(priority),
+        cursor is not None,
+        limit is not None,
+    )
+    return query, params
+
+
+def _active_tasks_query(limit: int) -> Select:
+    """The newest pending or in-progress tasks."""
+    return (
+        select(*TASK_COLUMNS)
+        .where(TaskModel.status.in_(ACTIVE_TASK_STATUSES))
+        .order_by(TaskModel.created_at.desc())
+        .limit(limit)
+    )
+
+
+def _queue_order() -> tuple[Any, ...]:
+    """ORDER BY for the task queue: priority rank, then oldest first."""
+    return (
+        case(TASK_PRIORITY_RANK, value=TaskModel.priority, else_=1),
+        TaskModel.created_at,
+        TaskModel.id,
+    )
+
+
+def _pending_dependencies_query(goal_id: Optional[str]) -> Select:
+    """SELECT id, dependencies of pending tasks, in queue order."""
+    query = select(TaskModel.id, TaskModel.dependencies).where(
+        TaskModel.status == "pending"
+    )
+    if goal_id:
+        query = query.where(TaskModel.goal_id == goal_id)
+    return query.order_by(*_queue_order())
+
+
+def _claim_tasks_query(task_ids: list[str], limit: int) -> Any:
+    """
+    UPDATE tasks to in_progress for the first ``limit`` still-pending ids
+    that no other transaction holds, RETURNING the claimed rows.
+    """
+    claimable = (
+        select(TaskModel.id)
+        .where(TaskModel.id.in_(task_ids), TaskModel.status == "pending")
+        .order_by(*_queue_order())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .cte("claimable")
+    )
+    return (
+        update(TaskModel)
+        .where(TaskModel.id.in_(select(claimable.c.id)))
+        .values(status="in_progress", updated_at=func.now())
+        .returning(*TASK_COLUMNS)
+    )
+
+
+def _task_ids_query(goal_ids: list[str]) -> Select:
+    """SELECT goal_id, id FROM tasks for the given goals, in creation order."""
+    return (
+        select(TaskModel.goal_id, TaskModel.id)
+        .where(TaskModel.goal_id.in_(goal_ids))
+        .order_by(TaskModel.created_at, TaskModel.id)
+    )
+
+
+def _group_task_ids(goal_ids: list[str], rows: Any) -> dict[str, list[str]]:
+    task_ids: dict[str, list[str]] = {goal_id: [] for goal_id in goal_ids}
+    for goal_id, task_id in rows:
+        task_ids[goal_id].append(task_id)
+    return task_ids
+
+
+def load_task_ids(session: Session, goal_ids: list[str]) -> dict[str, list[str]]:
+    """
+    Task IDs per goal from one narrow query instead of loading the full task
+    rows through the relationship.
+    """
+    if not goal_ids:
+        return {}
+    return _group_task_ids(goal_ids, session.execute(_task_ids_query(goal_ids)))
+
+
+async def async_load_task_ids(
+    session: AsyncSession, goal_ids: list[str]
+) -> dict[str, list[str]]:
+    """Async counterpart of load_task_ids."""
+    if not goal_ids:
+        return {}
+    rows = await session.execute(_task_ids_query(goal_ids))
+    return _group_task_ids(goal_ids, rows)
+
+
+def _goal_dicts(rows: Any, task_ids: dict[str, list[str]]) -> list[dict[str, Any]]:
+    return [_goal_to_dict(row, task_ids[row.id]) for row in rows]
+
+
+def _merged_metadata(
+    session: Session, goal_id: str, metadata: dict[str, Any], dialect_name: str
+) -> Any:
+    """
+    Value for goals.metadata with ``metadata``'s keys merged over the stored ones.
+
+    PostgreSQL merges server-side with jsonb ``||`` inside the UPDATE. Other
+    dialects lack a shallow JSON merge, so the stored value is read and merged
+    here; None means the goal does not exist.
+    """
+    if dialect_name == "postgresql":
+        stored = func.coalesce(GoalModel.meta_data, literal({}, JSONB))
+        return stored.op("||", return_type=JSONB)(literal(metadata, JSONB))
+
+    stored = session.execute(
+        select(GoalModel.meta_data).where(GoalModel.id == goal_id)
+    ).first()
+    if stored is None:
+        return None
+    return {**(stored[0] or {}), **metadata}
+
+
+def _goal_owner_matches(owner: str, dialect_name: str) -> Any:
+    """Filter on metadata.owner; on PostgreSQL this is exactly the expression
+    of idx_goal_meta_owner (a literal key, no cast) so the planner can use it."""
+    if dialect_name == "postgresql":
+        extracted = GoalModel.meta_data.op("->>", return_type=String)(
+            literal_column("'owner'")
+        )
+        return extracted == owner
+    return GoalModel.meta_data["owner"].as_string() == owner
+
+
+def _delete_tasks_query(task_ids: list[str]) -> Any:
+    """DELETE FROM tasks WHERE id IN (...), bypassing the session."""
+    return (
+        delete(TaskModel)
+        .where(TaskModel.id.in_(task_ids))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _delete_goal_and_count(session: Session, goal_id: str) -> Optional[int]:
+    """
+    Delete a goal's tasks and then the goal, each with DELETE ... RETURNING.
+
+    Tasks are deleted explicitly first so the count is known even when the
+    database cascades the goal delete itself. If the goal row is missing the
+    transaction is rolled back and None is returned.
+    """
+    deleted_tasks = session.execute(
+        delete(TaskModel)
+        .where(TaskModel.goal_id == goal_id)
+        .returning(TaskModel.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+    deleted_goal = session.execute(
+        delete(GoalModel)
+        .where(GoalModel.id == goal_id)
+        .returning(GoalModel.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if deleted_goal is None:
+        session.rollback()
+        return None
+    return len(deleted_tasks)
+
+
+def postgres_connect_args(database_url: str, application_name: str) -> dict[str, Any]:
+    """
+    connect_args that apply POSTGRES_SESSION_SETTINGS in the connection
+    startup packet, so no SET round-trip is needed per connection.
+
+    asyncpg takes them as server_settings; libpq drivers (psycopg2, psycopg)
+    as ``-c`` flags in ``options``. Non-PostgreSQL URLs get no arguments.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return {}
+    if url.get_driver_name() == "asyncpg":
+        return {
+            "server_settings": {
+                "application_name": application_name,
+                **POSTGRES_SESSION_SETTINGS,
+            }
+        }
+    options = " ".join(
+        f"-c {name}={value}" for name, value in POSTGRES_SESSION_SETTINGS.items()
+    )
+    return {"application_name": application_name, "options": options}
+
+
+def to_async_url(database_url: str) -> tuple[str, dict[str, Any]]:
+    """
+    Convert a PostgreSQL URL to the asyncpg driver.
+
+    asyncpg takes the SSL mode as a connect argument rather than a
+    ``sslmode`` query parameter, so it is moved into the returned
+    connect_args. Non-PostgreSQL URLs are returned unchanged.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return database_url, {}
+
+    connect_args: dict[str, Any] = {}
+    ssl_mode = url.query.get("sslmode")
+    if ssl_mode:
+        connect_args["ssl"] = ssl_mode
+        url = url.difference_update_query(["sslmode"])
+
+    url = url.set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False), connect_args
+
+
+class AsyncDatabaseManager:
+    """Async (asyncpg) access to goals and tasks for event-loop callers."""
+
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 20,
+        max_overflow: int = 10,
+        pool_timeout: int = 30,
+        application_name: str = "mcp-dashboard",
+    ) -> None:
+        """
+        Initialize async database manager.
+
+        Args:
+            database_url: PostgreSQL connection string (any driver)
+            pool_size: Number of connections to keep in pool
+            max_overflow: Maximum overflow connections
+            pool_timeout: Seconds to wait for a free pooled connection
+            application_name: Name shown for these connections in pg_stat_activity
+        """
+        async_url, connect_args = to_async_url(database_url)
+        connect_args.update(postgres_connect_args(async_url, application_name))
+        self.database_url = async_url
+        self.engine = create_async_engine(
+            async_url,
+            poolclass=AsyncAdaptedQueuePool,  # Waiters queue on asyncio, not threads
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_pre_ping=True,  # Verify connections before use
+            pool_recycle=3600,  # Recycle connections after 1 hour
+            connect_args=connect_args,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+            query_cache_size=QUERY_CACHE_SIZE,
+            echo=False,
+        )
+        self.SessionLocal = async_sessionmaker(
+            bind=self.engine,
+            autoflush=False,
+            expire_on_commit=False,  # Keep loaded attributes usable after commit
+        )
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """Async context manager for database sessions."""
+        async with self.SessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except SQLAlchemyError:
+                await session.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Close database engine and cleanup resources."""
+        await self.engine.dispose()
+
+    async def listen(
+        self, channel: str, callback: Callable[..., Any]
+    ) -> Optional[AsyncConnection]:
+        """
+        Subscribe to a PostgreSQL NOTIFY channel on a dedicated connection.
+
+        The callback receives asyncpg's (connection, pid, channel, payload)
+        arguments. Returns the connection, which the caller must close to
+        stop listening, or None if the backend does not support LISTEN.
+        """
+        if self.engine.dialect.driver != "asyncpg":
+            return None
+        conn = await self.engine.connect()
+        try:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.add_listener(channel, callback)
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    # Goal Operations
+    async def get_goal(self, goal_id: str) -> Optional[dict[str, Any]]:
+        """Get a goal by ID."""
+        query = select(*GOAL_COLUMNS).where(GoalModel.id == goal_id)
+        async with self.get_session() as session:
+            row = (await session.execute(query)).first()
+            if row is None:
+                return None
+            task_ids = await async_load_task_ids(session, [goal_id])
+            return _goal_to_dict(row, task_ids[goal_id])
+
+    async def list_goals(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        owner: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> list[dict[str, Any]]:
+        """List goals with optional filters, newest first."""
+        query = _list_goals_query(
+            status, priority, owner, self.engine.dialect.name, limit, cursor
+        )
+        async with self.get_session() as session:
+            rows = (await session.execute(query)).all()
+            task_ids = await async_load_task_ids(session, [row.id for row in rows])
+            return _goal_dicts(rows, task_ids)
+
+    async def list_goals_page(
+        self,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        owner: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[PageCursor]]:
+        """One page of list_goals and the cursor of the next (None at the end)."""
+        query = _list_goals_query(
+            status,
+            priority,
+            owner,
+            self.engine.dialect.name,
+            _page_fetch_size(limit),
+            cursor,
+        )
+        async with self.get_session() as session:
+            rows, next_cursor = _split_page((await session.execute(query)).all(), limit)
+            task_ids = await async_load_task_ids(session, [row.id for row in rows])
+            return _goal_dicts(rows, task_ids), next_cursor
+
+    async def list_recent_goals(self, limit: int = 5) -> list[dict[str, Any]]:
+        """List the most recently updated goals."""
+        query = select(*GOAL_COLUMNS).order_by(GoalModel.updated_at.desc()).limit(limit)
+        async with self.get_session() as session:
+            rows = (await session.execute(query)).all()
+            task_ids = await async_load_task_ids(session, [row.id for row in rows])
+            return _goal_dicts(rows, task_ids)
+
+    async def count_goals_by_status(self) -> dict[str, int]:
+        """Count goals per status."""
+        query = select(GoalModel.status, func.count()).group_by(GoalModel.status)
+        async with self.get_session() as session:
+            rows = await session.execute(query)
+            return {status: count for status, count in rows}
+
+    async def delete_goal(self, goal_id: str) -> bool:
+        """Delete a goal and all its tasks."""
+        async with self.get_session() as session:
+            count = await session.run_sync(_delete_goal_and_count, goal_id)
+            return count is not None
+
+    async def delete_goal_and_count(self, goal_id: str) -> Optional[int]:
+        """Delete a goal and its tasks, returning the task count (None if missing)."""
+        async with self.get_session() as session:
+            return await session.run_sync(_delete_goal_and_count, goal_id)
+
+    # Task Operations
+    async def get_task(self, task_id: str) -> Optional[dict[str, Any]]:
+        """Get a task by ID."""
+        query = select(*TASK_COLUMNS).where(TaskModel.id == task_id)
+        async with self.get_session() as session:
+            row = (await session.execute(query)).first()
+        return _task_to_dict(row) if row is not None else None
+
+    async def list_tasks(
+        self,
+        goal_id: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[PageCursor] = None,
+    ) -> list[dict[str, Any]]:
+        """List tasks with optional filters, newest first."""
+        query, params = _list_tasks_query(goal_id, status, priority, limit, cursor)
+        async with self.get_session() as session:
+            rows = await session.execute(query, params)
+            return [_task_to_dict(row) for row in rows]
+
+    async def list_tasks_page(
+        self,
+        goal_id: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[PageCursor] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[PageCursor]]:
+        """One page of list_tasks and the cursor of the next (None at the end)."""
+        query, params = _list_tasks_query(
+            goal_id, status, priority, _page_fetch_size(limit), cursor
+        )
+        async with self.get_session() as session:
+            rows = (await session.execute(query, params)).all()
+            rows, next_cursor = _split_page(rows, limit)
+            return [_task_to_dict(row) for row in rows], next_cursor
+
+    async def list_active_tasks(self, limit: int = 10) -> list[dict[str, Any]]:
+        """List the newest pending or in-progress tasks."""
+        async with self.get_session() as session:
+            rows = await session.execute(_active_tasks_query(limit))
+            return [_task_to_dict(row) for row in rows]
+
+    async def count_tasks_by_status(self) -> dict[str, int]:
+        """Count tasks per status."""
+        query = select(TaskModel.status, func.count()).group_by(TaskModel.status)
+        async with self.get_session() as session:
+            rows = await session.execute(query)
+            return {status: count for status, count in rows}
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task with a single DELETE statement."""
+        return await self.bulk_delete_tasks([task_id]) > 0
+
+    async def bulk_delete_tasks(self, task_ids: list[str]) -> int:
+        """Delete many tasks in one statement, returning how many existed."""
+        if not task_ids:
+            return 0
+        async with self.get_session() as session:
+            result = await session.execute(_delete_tasks_query(task_ids))
+            return result.rowcount
+
+    async def health_check(self) -> bool:
+        """Check database connection health."""
+        try:
+            async with self.get_session() as session:
+                await session.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            return False
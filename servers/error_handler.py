@@ -4,10 +4,26 @@ Enhanced Error Handling Utilities for MCP Servers
 Provides better error handling, validation, and AI-agent friendly error messages
 """
 
+import heapq
 import json
 import logging
+import os
+import stat
+from collections.abc import Iterable
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+except ImportError:
+    process = None  # type: ignore[assignment]
 
 
 class MCPErrorHandler:
@@ -53,11 +69,12 @@ class MCPErrorHandler:
 
         # Try to read the file and find similar strings
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Find similar strings
-            similar_strings = self._find_similar_strings(content, old_string)
+            # Stream the file rather than holding its text and line list
+            with open(file_path, "rb") as f:
+                lines = (line.decode("utf-8", errors="replace") for line in f)
+                similar_strings = self._find_similar_strings(lines, old_string)
+                f.seek(0)
+                line_count = _count_newlines(f) + 1
 
             if similar_strings:
                 suggestions.append(
@@ -84,9 +101,8 @@ class MCPErrorHandler:
                 )
 
             # Provide context around the file
-            lines = content.split("\n")
             suggestions.append(
-                f"File has {len(lines)} lines. Use read_file to examine the content first."
+                f"File has {line_count} lines. Use read_file to examine the content first."
             )
 
         except Exception as e:
@@ -106,31 +122,53 @@ class MCPErrorHandler:
         }
 
     def _find_similar_strings(
-        self, content: str, target: str, threshold: float = 0.7
+        self, lines: Iterable[str], target: str, threshold: float = 0.7
     ) -> List[str]:
-        """Find strings similar to the target in the content."""
+        """Find lines similar to the target, consuming ``lines`` lazily."""
         if not target.strip():
             return []
 
-        lines = content.split("\n")
+        if process is not None:
+            # Word-set similarity scored in C++; keep only the best five
+            candidates = (
+                stripped for line in lines if len(stripped := line.strip()) >= 5
+            )
+            matches = process.extract_iter(
+                target,
+                candidates,
+                scorer=fuzz.token_set_ratio,
+                processor=default_process,
+                score_cutoff=threshold * 100,
+            )
+            best = heapq.nlargest(5, matches, key=itemgetter(1))
+            return [match for match, _score, _index in best]
+
         similar = []
 
-        # Simple similarity check based on common words
-        target_words = set(target.lower().split())
+        # Simple similarity check based on common words (Jaccard index)
+        target_words = frozenset(target.lower().split())
+        target_size = len(target_words)
+        # |A & B| / |A | B| >= threshold needs |B| within these bounds
+        min_words = threshold * target_size
+        max_words = target_size / threshold
 
         for line in lines:
-            if len(line.strip()) < 5:  # Skip very short lines
+            stripped = line.strip()
+            if len(stripped) < 5:  # Skip very short lines
                 continue
 
-            line_words = set(line.lower().split())
-            if target_words and line_words:
-                similarity = len(target_words.intersection(line_words)) / len(
-                    target_words.union(line_words)
-                )
-                if similarity >= threshold:
-                    similar.append(line.strip())
+            line_words = set(stripped.lower().split())
+            line_size = len(line_words)
+            if not min_words <= line_size <= max_words:
+                continue
 
-        return similar[:5]  # Return top 5 matches
+            common = len(target_words & line_words)
+            if common / (target_size + line_size - common) >= threshold:
+                similar.append(stripped)
+                if len(similar) == 5:  # Return top 5 matches
+                    break
+
+        return similar
 
     def handle_validation_error(
         self,
@@ -210,34 +248,39 @@ class MCPErrorHandler:
         """
         suggestions = []
         path = Path(file_path)
+        # One stat for the path (and at most one for its parent) answers
+        # every exists/is_file/is_dir question below
+        st = _stat(path)
+        exists, is_file, is_dir = _stat_flags(st)
 
         if operation == "read":
-            if not path.exists():
+            if not exists:
                 suggestions.append(f"File '{file_path}' does not exist")
-                if path.parent.exists():
+                if _stat(path.parent) is not None:
                     suggestions.append(
                         f"Use list_directory('{path.parent}') to see available files"
                     )
-            elif path.is_dir():
+            elif is_dir:
                 suggestions.append(
                     f"'{file_path}' is a directory, not a file. Use list_directory instead"
                 )
-            elif not path.is_file():
+            elif not is_file:
                 suggestions.append(f"'{file_path}' exists but is not a regular file")
 
         elif operation == "write":
-            if not path.parent.exists():
+            parent_st = _stat(path.parent)
+            if parent_st is None:
                 suggestions.append(f"Parent directory '{path.parent}' does not exist")
                 suggestions.append("Use create_dirs=True to create parent directories")
-            elif not path.parent.is_dir():
+            elif not stat.S_ISDIR(parent_st.st_mode):
                 suggestions.append(f"Parent path '{path.parent}' is not a directory")
-            elif not path.parent.exists():
+            elif not os.access(path.parent, os.W_OK):
                 suggestions.append("Check write permissions for the directory")
 
         elif operation == "delete":
-            if not path.exists():
+            if not exists:
                 suggestions.append(f"File '{file_path}' does not exist")
-            elif path.is_dir():
+            elif is_dir:
                 suggestions.append(
                     f"'{file_path}' is a directory. Use rmdir or remove files first"
                 )
@@ -247,9 +290,9 @@ class MCPErrorHandler:
             "type": "file_operation_error",
             "operation": operation,
             "file_path": file_path,
-            "file_exists": path.exists(),
-            "is_file": path.is_file() if path.exists() else False,
-            "is_directory": path.is_dir() if path.exists() else False,
+            "file_exists": exists,
+            "is_file": is_file,
+            "is_directory": is_dir,
             "suggestion": (
                 "; ".join(suggestions)
                 if suggestions
@@ -314,6 +357,26 @@ class MCPErrorHandler:
         return response
 
 
+def _stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """stat() a path (following symlinks), or None if it cannot be reached."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _stat_flags(st: Optional[os.stat_result]) -> tuple[bool, bool, bool]:
+    """(exists, is_file, is_dir) from one stat result."""
+    if st is None:
+        return False, False, False
+    return True, stat.S_ISREG(st.st_mode), stat.S_ISDIR(st.st_mode)
+
+
+def _count_newlines(f: BinaryIO, chunk_size: int = 1 << 20) -> int:
+    """Count b"\\n" in a binary file one fixed-size chunk at a time."""
+    return sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(chunk_size), b""))
+
+
 def safe_json_dumps(data: Any, indent: int = 2) -> str:
     """
     Safely convert data to JSON string with error handling.
@@ -326,6 +389,18 @@ def safe_json_dumps(data: Any, indent: int = 2) -> str:
         JSON string or error message
     """
     try:
+        # orjson only indents by two spaces; other widths use the stdlib
+        if orjson is not None and indent == 2:
+            try:
+                return orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME,  # str() them like before
+                    default=str,
+                ).decode("utf-8")
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; the stdlib handles those
         return json.dumps(data, indent=indent, default=str)
     except Exception as e:
         return json.dumps(
@@ -358,8 +433,9 @@ def validate_file_path(file_path: str, must_exist: bool = False) -> Dict[str, An
 
     try:
         path = Path(file_path).expanduser().resolve()
+        exists, is_file, is_dir = _stat_flags(_stat(path))
 
-        if must_exist and not path.exists():
+        if must_exist and not exists:
             return {
                 "valid": False,
                 "error": f"File does not exist: {file_path}",
@@ -370,9 +446,9 @@ def validate_file_path(file_path: str, must_exist: bool = False) -> Dict[str, An
         return {
             "valid": True,
             "resolved_path": str(path),
-            "exists": path.exists(),
-            "is_file": path.is_file() if path.exists() else False,
-            "is_directory": path.is_dir() if path.exists() else False,
+            "exists": exists,
+            "is_file": is_file,
+            "is_directory": is_dir,
         }
 
     except Exception as e:
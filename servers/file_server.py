@@ -7,15 +7,25 @@ Python >=3.10 compatible
 
 import fnmatch
 import hashlib
-import json
 import mimetypes
+import os
+import re
 import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None  # type: ignore[assignment]
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -37,6 +47,94 @@ load_env_file()
 mcp = FastMCP("File System Server")
 
 
+# Threads for search_files_system_wide, one allowed directory per task
+SEARCH_WORKERS = 8
+
+# Content hashes for read_file; sha256 runs on OpenSSL (SHA-NI where the CPU
+# has it) and blake3 (optional package) hashes with SIMD across threads
+_HASHERS: dict[str, Any] = {"sha256": hashlib.sha256, "md5": hashlib.md5}
+HASH_ALGORITHMS = ("sha256", "blake3", "md5")
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Upper bound on file bytes held by the read_file result cache
+READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _content_hash(data: bytes, algorithm: str) -> str:
+    """Hex digest of file bytes with one of HASH_ALGORITHMS."""
+    if algorithm == "blake3":
+        return blake3(data, max_threads=blake3.AUTO).hexdigest()
+    return _HASHERS[algorithm](data).hexdigest()
+
+
+def _decode_text(data: bytes, encoding: str) -> str:
+    """Decode like open(..., "r"), including universal newline translation."""
+    text = data.decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _encode_text(text: str, encoding: str) -> bytes:
+    """Encode like open(..., "w"), including newline translation."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode(encoding)
+
+
+def _entry_metadata(entry: os.DirEntry) -> dict[str, Any]:
+    """
+    Listing metadata for a scandir entry.
+
+    The file type comes from the directory read itself and the stat result is
+    cached on the entry, so this costs at most one stat(2) per entry.
+    """
+    stat = entry.stat()
+    return {
+        "name": entry.name,
+        "path": entry.path,
+        "type": "directory" if entry.is_dir() else "file",
+        "size": stat.st_size if entry.is_file() else None,
+        "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
+    }
+
+
+def _name_matcher(pattern: str) -> Callable[[str], Any]:
+    """
+    Return a predicate equivalent to fnmatch.fnmatch(name, pattern).
+
+    The pattern is translated once; a pattern without wildcards becomes a
+    plain string comparison.
+    """
+    if os.path.normcase("A") != "A":  # Case-insensitive platforms (Windows)
+        return re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+    if not any(char in pattern for char in "*?["):
+        return pattern.__eq__
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _walk_entries(dir_path: str) -> Iterator[os.DirEntry]:
+    """
+    Yield every entry below dir_path, like Path(dir_path).rglob("*").
+
+    Symlinked directories are listed but not descended into, and
+    subdirectories that cannot be read are skipped, as rglob does.
+    """
+    with os.scandir(dir_path) as it:
+        entries = list(it)
+    yield from entries
+    for entry in entries:
+        try:
+            descend = entry.is_dir() and not entry.is_symlink()
+        except OSError:
+            continue
+        if descend:
+            try:
+                yield from _walk_entries(entry.path)
+            except OSError:
+                continue
+
+
 class FileSystemClient:
     """File system client with security and error handling."""
 
@@ -50,6 +148,13 @@ class FileSystemClient:
         self.allowed_paths = allowed_paths or []
         self.logger = logger
 
+        # read_file results keyed by path, stat identity, encoding and hash
+        # algorithm; a changed file misses on its new mtime/size/ctime
+        self._read_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+        self._read_cache_bytes = 0
+        self._read_cache_max_bytes = READ_CACHE_MAX_BYTES
+        self._read_cache_lock = threading.Lock()
+
         # Default allowed paths for security - expanded to include common user directories
         if not self.allowed_paths:
             home_dir = str(Path.home())
@@ -84,6 +189,42 @@ class FileSystemClient:
         )
         self.logger.info(f"Restricted paths: {self.restricted_paths}")
 
+    def _check_path_prefixes(self, file_path: str, path_str: str) -> None:
+        """
+        Security checks on a resolved path: not under a restricted directory,
+        and under an allowed one when allowed_paths is set.
+
+        str.startswith takes a tuple of prefixes and tests them all in C; the
+        offending prefix is only looked up to build the error message.
+        """
+        restricted = tuple(self.restricted_paths)
+        if path_str.startswith(restricted):
+            restricted_path = next(p for p in restricted if path_str.startswith(p))
+            raise ValueError(
+                f"Access denied: '{file_path}' (resolved to '{path_str}') is in restricted directory '{restricted_path}'. "
+                f"This directory contains system files and cannot be accessed for security reasons."
+            )
+
+        if self.allowed_paths and not path_str.startswith(tuple(self.allowed_paths)):
+            raise ValueError(
+                f"Path '{file_path}' (resolved to '{path_str}') is not in allowed directories. "
+                f"Allowed directories: {self.allowed_paths}. "
+                f"Please use a path within these directories."
+            )
+
+    def _validate_entry(self, entry: os.DirEntry, parent_resolved: bool) -> None:
+        """
+        _validate_path for an entry met while walking a directory.
+
+        A non-symlink entry of a directory whose path is already fully
+        resolved resolves to its own path, so the per-component realpath()
+        lookups are skipped and only the prefix checks run.
+        """
+        if parent_resolved and not entry.is_symlink():
+            self._check_path_prefixes(entry.path, entry.path)
+        else:
+            self._validate_path(entry.path)
+
     def _validate_path(self, file_path: str, allow_write: bool = False) -> Path:
         """
         Validate and resolve file path with security checks.
@@ -106,26 +247,7 @@ class FileSystemClient:
             path = Path(file_path).expanduser().resolve()
             path_str = str(path)
 
-            # Security check: ensure path is not in restricted directories
-            for restricted_path in self.restricted_paths:
-                if path_str.startswith(restricted_path):
-                    raise ValueError(
-                        f"Access denied: '{file_path}' (resolved to '{path}') is in restricted directory '{restricted_path}'. "
-                        f"This directory contains system files and cannot be accessed for security reasons."
-                    )
-
-            # Security check: ensure path is within allowed directories
-            if self.allowed_paths:
-                is_allowed = any(
-                    path_str.startswith(allowed_path)
-                    for allowed_path in self.allowed_paths
-                )
-                if not is_allowed:
-                    raise ValueError(
-                        f"Path '{file_path}' (resolved to '{path}') is not in allowed directories. "
-                        f"Allowed directories: {self.allowed_paths}. "
-                        f"Please use a path within these directories."
-                    )
+            self._check_path_prefixes(file_path, path_str)
 
             # Additional write protection for system directories
             if allow_write:
@@ -147,18 +269,33 @@ class FileSystemClient:
                 raise
             raise ValueError(f"Invalid path '{file_path}': {e}")
 
-    def read_file(self, file_path: str, encoding: str = "utf-8") -> dict[str, Any]:
+    def read_file(
+        self,
+        file_path: str,
+        encoding: str = "utf-8",
+        hash_algo: str = DEFAULT_HASH_ALGORITHM,
+    ) -> dict[str, Any]:
         """
         Read file contents with metadata.
 
         Args:
             file_path: Path to file to read
             encoding: Text encoding (default: utf-8)
+            hash_algo: Content hash: sha256 (default), blake3 or md5
 
         Returns:
             Dictionary with file contents and metadata
         """
         try:
+            if hash_algo not in HASH_ALGORITHMS:
+                raise ValueError(
+                    f"Unsupported hash_algo '{hash_algo}'. Use one of: {', '.join(HASH_ALGORITHMS)}"
+                )
+            if hash_algo == "blake3" and blake3 is None:
+                raise ValueError(
+                    "hash_algo 'blake3' requires the blake3 package (pip install blake3)"
+                )
+
             path = self._validate_path(file_path)
 
             if not path.exists():
@@ -202,10 +339,32 @@ class FileSystemClient:
                     f"File '{file_path}' is too large ({stat.st_size} bytes). Maximum file size is 10MB."
                 )
 
-            # Read file contents
+            cache_key = (
+                str(path),
+                stat.st_ino,
+                stat.st_mtime_ns,
+                stat.st_ctime_ns,
+                stat.st_size,
+                encoding,
+                hash_algo,
+            )
+            with self._read_cache_lock:
+                cached = self._read_cache.get(cache_key)
+                if cached is not None:
+                    self._read_cache.move_to_end(cache_key)
+            if cached is not None:
+                return {
+                    "content": cached["content"],
+                    "metadata": dict(cached["metadata"]),
+                }
+
+            # Read the bytes once; both the hash and the text come from them
+            with open(path, "rb") as f:
+                data = f.read()
+            file_hash = _content_hash(data, hash_algo)
+
             try:
-                with open(path, "r", encoding=encoding) as f:
-                    content = f.read()
+                content = _decode_text(data, encoding)
             except UnicodeDecodeError as e:
                 raise ValueError(
                     f"Cannot read file '{file_path}' with encoding '{encoding}': {e}. Try using a different encoding like 'latin-1' or 'cp1252'."
@@ -214,11 +373,7 @@ class FileSystemClient:
             # Get file metadata
             mime_type, _ = mimetypes.guess_type(str(path))
 
-            # Calculate file hash
-            with open(path, "rb") as f:
-                file_hash = hashlib.md5(f.read()).hexdigest()
-
-            return {
+            result = {
                 "content": content,
                 "metadata": {
                     "path": str(path),
@@ -228,18 +383,35 @@ class FileSystemClient:
                     "mime_type": mime_type,
                     "encoding": encoding,
                     "hash": file_hash,
+                    "hash_algorithm": hash_algo,
                     "permissions": oct(stat.st_mode)[-3:],
                 },
             }
+            self._cache_read_result(cache_key, stat.st_size, result)
+            return {"content": content, "metadata": dict(result["metadata"])}
 
         except Exception as e:
             self.logger.error(f"Error reading file {file_path}: {e}")
             raise
 
+    def _cache_read_result(self, key: tuple, size: int, result: dict[str, Any]) -> None:
+        """Store a read_file result, evicting least recently used entries."""
+        if size > self._read_cache_max_bytes:
+            return
+        with self._read_cache_lock:
+            previous = self._read_cache.pop(key, None)
+            if previous is not None:
+                self._read_cache_bytes -= previous["metadata"]["size"]
+            self._read_cache[key] = result
+            self._read_cache_bytes += size
+            while self._read_cache_bytes > self._read_cache_max_bytes:
+                _, evicted = self._read_cache.popitem(last=False)
+                self._read_cache_bytes -= evicted["metadata"]["size"]
+
     def write_file(
         self,
         file_path: str,
-        content: str,
+        content: str | bytes | bytearray | memoryview,
         encoding: str = "utf-8",
         create_dirs: bool = True,
     ) -> dict[str, Any]:
@@ -248,8 +420,8 @@ class FileSystemClient:
 
         Args:
             file_path: Path to file to write
-            content: Content to write
-            encoding: Text encoding (default: utf-8)
+            content: Text to encode, or bytes-like content written as is
+            encoding: Text encoding (default: utf-8; ignored for bytes)
             create_dirs: Create parent directories if they don't exist
 
         Returns:
@@ -263,19 +435,22 @@ class FileSystemClient:
             if create_dirs:
                 path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
-            with open(path, "w", encoding=encoding) as f:
-                f.write(content)
-
-            # Get updated metadata
-            stat = path.stat()
+            # Encode once and hand the bytes to a single binary write rather
+            # than streaming through the text layer's incremental encoder
+            is_text = isinstance(content, str)
+            data = _encode_text(content, encoding) if is_text else content
+            with open(path, "wb") as f:
+                f.write(data)
+                f.flush()
+                # Get updated metadata from the open descriptor
+                stat = os.fstat(f.fileno())
 
             return {
                 "success": True,
                 "path": str(path),
                 "size": stat.st_size,
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "encoding": encoding,
+                "encoding": encoding if is_text else None,
             }
 
         except Exception as e:
@@ -308,8 +483,12 @@ class FileSystemClient:
             items = []
             errors = []
 
-            # Use rglob for recursive, iterdir for non-recursive
-            iterator = path.rglob("*") if recursive else path.iterdir()
+            # scandir entries carry their type and cache their stat result
+            if recursive:
+                iterator = _walk_entries(str(path))
+            else:
+                with os.scandir(path) as it:
+                    iterator = list(it)
 
             for item in iterator:
                 try:
@@ -317,28 +496,19 @@ class FileSystemClient:
                     if not include_hidden and item.name.startswith("."):
                         continue
 
-                    # Validate each path
+                    # Validate each path (the walk starts at a resolved path
+                    # and never descends through symlinks)
                     try:
-                        self._validate_path(str(item))
+                        self._validate_entry(item, parent_resolved=True)
                     except ValueError as e:
-                        self.logger.debug(f"Skipping {item}: {e}")
+                        self.logger.debug(f"Skipping {item.path}: {e}")
                         continue
 
-                    stat = item.stat()
-                    items.append(
-                        {
-                            "name": item.name,
-                            "path": str(item),
-                            "type": "directory" if item.is_dir() else "file",
-                            "size": stat.st_size if item.is_file() else None,
-                            "modified": datetime.fromtimestamp(
-                                stat.st_mtime
-                            ).isoformat(),
-                            "permissions": oct(stat.st_mode)[-3:],
-                        }
-                    )
+                    info = _entry_metadata(item)
+                    info["permissions"] = oct(item.stat().st_mode)[-3:]
+                    items.append(info)
                 except (PermissionError, OSError) as e:
-                    error_msg = f"Cannot access {item}: {e}"
+                    error_msg = f"Cannot access {item.path}: {e}"
                     self.logger.warning(error_msg)
                     errors.append(error_msg)
                     continue
@@ -425,17 +595,22 @@ class FileSystemClient:
             matches = []
             errors = []
             searched_dirs = []
+            match_name = _name_matcher(pattern)
 
-            def search_recursive(current_path: Path, current_depth: int = 0):
+            def search_recursive(
+                current_path: str, current_depth: int = 0, resolved: bool = True
+            ):
                 """Recursively search directories with depth limit."""
                 if current_depth >= max_depth:
                     self.logger.debug(f"Max depth reached at {current_path}")
                     return
 
-                searched_dirs.append(str(current_path))
+                searched_dirs.append(current_path)
 
                 try:
-                    for item in current_path.iterdir():
+                    with os.scandir(current_path) as it:
+                        entries = list(it)
+                    for item in entries:
                         try:
                             # Skip hidden files if not included
                             if not include_hidden and item.name.startswith("."):
@@ -443,36 +618,25 @@ class FileSystemClient:
 
                             # Validate path access
                             try:
-                                self._validate_path(str(item))
+                                self._validate_entry(item, resolved)
                             except ValueError as e:
-                                self.logger.debug(f"Skipping {item}: {e}")
+                                self.logger.debug(f"Skipping {item.path}: {e}")
                                 continue
 
                             # Check if item matches pattern
-                            if fnmatch.fnmatch(item.name, pattern):
-                                stat = item.stat()
-                                matches.append(
-                                    {
-                                        "name": item.name,
-                                        "path": str(item),
-                                        "type": (
-                                            "directory" if item.is_dir() else "file"
-                                        ),
-                                        "size": (
-                                            stat.st_size if item.is_file() else None
-                                        ),
-                                        "modified": datetime.fromtimestamp(
-                                            stat.st_mtime
-                                        ).isoformat(),
-                                    }
-                                )
+                            if match_name(item.name):
+                                matches.append(_entry_metadata(item))
 
                             # Recurse into subdirectories
                             if item.is_dir():
-                                search_recursive(item, current_depth + 1)
+                                search_recursive(
+                                    item.path,
+                                    current_depth + 1,
+                                    resolved and not item.is_symlink(),
+                                )
 
                         except (PermissionError, OSError) as e:
-                            error_msg = f"Cannot access {item}: {e}"
+                            error_msg = f"Cannot access {item.path}: {e}"
                             self.logger.debug(error_msg)
                             errors.append(error_msg)
                             continue
@@ -483,7 +647,7 @@ class FileSystemClient:
                     errors.append(error_msg)
 
             # Start recursive search
-            search_recursive(path)
+            search_recursive(str(path))
 
             return {
                 "directory": str(path),
@@ -499,6 +663,69 @@ class FileSystemClient:
             self.logger.error(f"Error searching files in {dir_path}: {e}")
             raise
 
+    def _search_tree(
+        self,
+        root: str,
+        match_name: Callable[[str], Any],
+        include_hidden: bool,
+        max_depth: int,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Depth-limited pattern search of one allowed directory.
+
+        Returns (matches, errors) and touches no shared state, so several
+        roots can be searched concurrently.
+        """
+        matches: list[dict[str, Any]] = []
+        errors: list[str] = []
+
+        def search_recursive(
+            current_path: str, current_depth: int = 0, resolved: bool = False
+        ):
+            """Recursively search with depth limit."""
+            if current_depth >= max_depth:
+                return
+
+            try:
+                with os.scandir(current_path) as it:
+                    entries = list(it)
+                for item in entries:
+                    try:
+                        # Skip hidden files if not included
+                        if not include_hidden and item.name.startswith("."):
+                            continue
+
+                        # Validate path
+                        try:
+                            self._validate_entry(item, resolved)
+                        except ValueError:
+                            continue
+
+                        # Check pattern match
+                        if match_name(item.name):
+                            matches.append(_entry_metadata(item))
+
+                        # Recurse into subdirectories
+                        if item.is_dir():
+                            search_recursive(
+                                item.path,
+                                current_depth + 1,
+                                resolved and not item.is_symlink(),
+                            )
+
+                    except (PermissionError, OSError) as e:
+                        self.logger.debug(f"Cannot access {item.path}: {e}")
+                        continue
+
+            except (PermissionError, OSError) as e:
+                error_msg = f"Cannot list {current_path}: {e}"
+                self.logger.debug(error_msg)
+                errors.append(error_msg)
+
+        # Allowed roots are configured strings, not necessarily resolved paths
+        search_recursive(root, resolved=os.path.realpath(root) == root)
+        return matches, errors
+
     def search_files_system_wide(
         self, pattern: str, include_hidden: bool = False, max_depth: int = 3
     ) -> dict[str, Any]:
@@ -528,70 +755,24 @@ class FileSystemClient:
 
                 searched_paths.append(str(path))
 
-                try:
-
-                    def search_recursive(current_path: Path, current_depth: int = 0):
-                        """Recursively search with depth limit."""
-                        if current_depth >= max_depth:
-                            return
-
-                        try:
-                            for item in current_path.iterdir():
-                                try:
-                                    # Skip hidden files if not included
-                                    if not include_hidden and item.name.startswith("."):
-                                        continue
-
-                                    # Validate path
-                                    try:
-                                        self._validate_path(str(item))
-                                    except ValueError:
-                                        continue
-
-                                    # Check pattern match
-                                    if fnmatch.fnmatch(item.name, pattern):
-                                        stat = item.stat()
-                                        matches.append(
-                                            {
-                                                "name": item.name,
-                                                "path": str(item),
-                                                "type": (
-                                                    "directory"
-                                                    if item.is_dir()
-                                                    else "file"
-                                                ),
-                                                "size": (
-                                                    stat.st_size
-                                                    if item.is_file()
-                                                    else None
-                                                ),
-                                                "modified": datetime.fromtimestamp(
-                                                    stat.st_mtime
-                                                ).isoformat(),
-                                            }
-                                        )
-
-                                    # Recurse into subdirectories
-                                    if item.is_dir():
-                                        search_recursive(item, current_depth + 1)
-
-                                except (PermissionError, OSError) as e:
-                                    self.logger.debug(f"Cannot access {item}: {e}")
-                                    continue
-
-                        except (PermissionError, OSError) as e:
-                            error_msg = f"Cannot list {current_path}: {e}"
-                            self.logger.debug(error_msg)
-                            errors.append(error_msg)
-
-                    # Start search for this allowed path
-                    search_recursive(path)
-
-                except (PermissionError, OSError) as e:
-                    error_msg = f"Permission denied accessing {path}: {e}"
-                    self.logger.warning(error_msg)
-                    errors.append(error_msg)
-                    continue
+            # Compile the pattern once rather than per entry (and per thread)
+            match_name = _name_matcher(pattern)
+
+            def search_root(root: str) -> tuple[list[dict[str, Any]], list[str]]:
+                return self._search_tree(root, match_name, include_hidden, max_depth)
+
+            # The walks are independent and spend their time in syscalls that
+            # release the GIL; map() keeps results in allowed_paths order
+            if searched_paths:
+                with ThreadPoolExecutor(
+                    max_workers=min(SEARCH_WORKERS, len(searched_paths)),
+                    thread_name_prefix="file-search",
+                ) as pool:
+                    for root_matches, root_errors in pool.map(
+                        search_root, searched_paths
+                    ):
+                        matches.extend(root_matches)
+                        errors.extend(root_errors)
 
             return {
                 "pattern": pattern,
@@ -613,13 +794,16 @@ error_handler = MCPErrorHandler(logger)
 
 
 @mcp.tool()
-def read_file(file_path: str, encoding: str = "utf-8") -> str:
+def read_file(
+    file_path: str, encoding: str = "utf-8", hash_algo: str = DEFAULT_HASH_ALGORITHM
+) -> str:
     """
     Read the contents of a file from the local file system.
 
     Args:
         file_path: Path to the file to read (supports relative paths and ~ for home directory)
         encoding: Text encoding (default: utf-8). Common encodings: utf-8, latin-1, cp1252, ascii
+        hash_algo: Algorithm for the metadata content hash: sha256 (default), blake3 (if installed) or md5
 
     Returns:
         JSON string with file contents and metadata. Includes helpful error messages if file is not found.
@@ -634,7 +818,7 @@ def read_file(file_path: str, encoding: str = "utf-8") -> str:
             return safe_json_dumps(error_response)
 
         validate_non_empty(file_path, "file_path")
-        result = file_client.read_file(file_path, encoding)
+        result = file_client.read_file(file_path, encoding, hash_algo)
         return safe_json_dumps(error_handler.create_success_response(result))
 
     except FileNotFoundError as e:
@@ -677,36 +861,33 @@ def write_file(
         validate_non_empty(file_path, "file_path")
         validate_non_empty(content, "content")
         result = file_client.write_file(file_path, content, encoding, create_dirs)
-        return json.dumps(result, indent=2)
+        return safe_json_dumps(result)
     except ValueError as e:
         logger.error(f"Validation error in write_file: {e}")
-        return json.dumps(
+        return safe_json_dumps(
             {
                 "error": str(e),
                 "type": "validation_error",
                 "suggestion": "Check the file path and ensure it's within allowed directories. Writing to system directories is not allowed.",
-            },
-            indent=2,
+            }
         )
     except PermissionError as e:
         logger.error(f"Permission error in write_file: {e}")
-        return json.dumps(
+        return safe_json_dumps(
             {
                 "error": str(e),
                 "type": "permission_error",
                 "suggestion": "Check file permissions or try writing to a different location.",
-            },
-            indent=2,
+            }
         )
     except Exception as e:
         logger.error(f"Unexpected error in write_file: {e}")
-        return json.dumps(
+        return safe_json_dumps(
             {
                 "error": str(e),
                 "type": "unexpected_error",
                 "suggestion": "Please check the file path and try again.",
-            },
-            indent=2,
+            }
         )
 
 
@@ -728,10 +909,10 @@ def list_directory(
     try:
         validate_non_empty(dir_path, "dir_path")
         result = file_client.list_directory(dir_path, include_hidden, recursive)
-        return json.dumps(result, indent=2)
+        return safe_json_dumps(result)
     except Exception as e:
         logger.error(f"Error in list_directory: {e}")
-        return json.dumps({"error": str(e)}, indent=2)
+        return safe_json_dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -748,10 +929,10 @@ def get_file_info(file_path: str) -> str:
     try:
         validate_non_empty(file_path, "file_path")
         result = file_client.get_file_info(file_path)
-        return json.dumps(result, indent=2)
+        return safe_json_dumps(result)
     except Exception as e:
         logger.error(f"Error in get_file_info: {e}")
-        return json.dumps({"error": str(e)}, indent=2)
+        return safe_json_dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -775,11 +956,11 @@ def search_files(
         validate_non_empty(pattern, "pattern")
 
         result = file_client.search_files(dir_path, pattern, include_hidden, max_depth)
-        return json.dumps(result, indent=2)
+        return safe_json_dumps(result)
 
     except Exception as e:
         logger.error(f"Error in search_files: {e}")
-        return json.dumps({"error": str(e)}, indent=2)
+        return safe_json_dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -802,10 +983,10 @@ def search_files_system_wide(
         result = file_client.search_files_system_wide(
             pattern, include_hidden, max_depth
         )
-        return json.dumps(result, indent=2)
+        return safe_json_dumps(result)
     except Exception as e:
         logger.error(f"Error in search_files_system_wide: {e}")
-        return json.dumps({"error": str(e)}, indent=2)
+        return safe_json_dumps({"error": str(e)})
 
 
 def main():
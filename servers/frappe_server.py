@@ -194,7 +194,7 @@ class FrappeClient(BaseClient):
 
 # Initialize client
 try:
-    config = FrappeConfig()
+    config = FrappeConfig.instance()
     validate_config(config, logger)
 
     log_server_startup(
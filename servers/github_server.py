@@ -664,7 +664,7 @@ class GitHubClient:
 
 # Initialize client
 try:
-    config = GitHubConfig()
+    config = GitHubConfig.instance()
     validate_config(config, logger)
 
     log_server_startup(
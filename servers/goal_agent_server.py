@@ -11,7 +11,7 @@ import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from functools import wraps
 from pathlib import Path
 from typing import Any, Callable
@@ -29,7 +29,12 @@ from servers.config import (
     load_env_file,
     validate_config,
 )
-from servers.database import DatabaseManager
+from servers.database import (
+    DEFAULT_PAGE_SIZE,
+    DatabaseManager,
+    decode_cursor,
+    encode_cursor,
+)
 from servers.logging_config import (
     log_server_shutdown,
     log_server_startup,
@@ -118,7 +123,7 @@ class CacheLayer:
                 from servers.config import RedisConfig
 
                 # Initialize Redis with configuration
-                redis_config = RedisConfig()
+                redis_config = RedisConfig.instance()
                 self.redis_client = redis.Redis(
                     host=redis_config.host,
                     port=redis_config.port,
@@ -272,11 +277,15 @@ class GoalAgent:
             tasks = self.db.list_tasks()
 
             if goals:
-                goal_numbers = [int(g.id.split("-")[1]) for g in goals if "-" in g.id]
+                goal_numbers = [
+                    int(g["id"].split("-")[1]) for g in goals if "-" in g["id"]
+                ]
                 self.goal_counter = max(goal_numbers) if goal_numbers else 0
 
             if tasks:
-                task_numbers = [int(t.id.split("-")[1]) for t in tasks if "-" in t.id]
+                task_numbers = [
+                    int(t["id"].split("-")[1]) for t in tasks if "-" in t["id"]
+                ]
                 self.task_counter = max(task_numbers) if task_numbers else 0
 
             logger.info(
@@ -348,17 +357,18 @@ class GoalAgent:
         self, goal_id: str, subtasks: list[dict[str, Any]]
     ) -> dict[str, Any]:
         """Break down a goal into executable subtasks and persist to database."""
-        goal = self.db.get_goal(goal_id)
+        goal = self.db.get_goal(goal_id, fresh=True)
         if not goal:
             raise ValueError(f"Goal {goal_id} not found")
 
         if not subtasks:
             raise ValueError("At least one subtask must be provided")
 
-        for subtask_def in subtasks:
-            if not subtask_def.get("description"):
-                raise ValueError("Each subtask must have a description")
+        if any(not subtask_def.get("description") for subtask_def in subtasks):
+            raise ValueError("Each subtask must have a description")
 
+        new_tasks = []
+        for subtask_def in subtasks:
             self.task_counter += 1
             task_id = f"TASK-{self.task_counter:04d}"
 
@@ -366,41 +376,49 @@ class GoalAgent:
             if priority not in ["high", "medium", "low"]:
                 priority = "medium"
 
-            # Create task in database
-            task = self.db.create_task(
-                task_id=task_id,
-                goal_id=goal_id,
-                description=subtask_def.get("description", "").strip(),
-                task_type=subtask_def.get("type", "general"),
-                priority=priority,
-                dependencies=subtask_def.get("dependencies", []),
-                repo=subtask_def.get("repo"),
-                jira_ticket=subtask_def.get("jira_ticket"),
-                estimated_effort=subtask_def.get("estimated_effort"),
-                assigned_tools=subtask_def.get("tools", []),
+            new_tasks.append(
+                {
+                    "id": task_id,
+                    "goal_id": goal_id,
+                    "description": subtask_def.get("description", "").strip(),
+                    "type": subtask_def.get("type", "general"),
+                    "priority": priority,
+                    "dependencies": subtask_def.get("dependencies", []),
+                    "repo": subtask_def.get("repo"),
+                    "jira_ticket": subtask_def.get("jira_ticket"),
+                    "estimated_effort": subtask_def.get("estimated_effort"),
+                    "assigned_tools": subtask_def.get("tools", []),
+                }
             )
 
-            # Validate dependencies
-            for dep_id in task.get("dependencies", []):
-                if not self.db.get_task(dep_id):
-                    logger.warning(f"Dependency {dep_id} not found for task {task_id}")
+        # Create all tasks in database in one round-trip
+        tasks = self.db.bulk_create_tasks(new_tasks)
+
+        # Validate dependencies with a single lookup
+        dep_ids = {dep_id for task in tasks for dep_id in task["dependencies"]}
+        known_ids = self.db.existing_task_ids(list(dep_ids))
+        for task in tasks:
+            for dep_id in task["dependencies"]:
+                if dep_id not in known_ids:
+                    logger.warning(
+                        f"Dependency {dep_id} not found for task {task['id']}"
+                    )
 
             # Cache task (already a dict from db)
             self._cache_task(task)
 
-            logger.debug(f"Created task: {task_id} for goal {goal_id}")
+            logger.debug(f"Created task: {task['id']} for goal {goal_id}")
 
         # Update goal status
         updated_goal = self.db.update_goal(goal_id, status="in_progress")
         if updated_goal:
-            goal_dict = updated_goal.to_dict()
-            self._cache_goal(goal_dict)
+            self._cache_goal(updated_goal)
 
         logger.info(f"Goal {goal_id} broken down into {len(subtasks)} tasks")
 
         # Refresh goal to get updated data
-        goal = self.db.get_goal(goal_id)
-        return goal.to_dict() if goal else {}
+        goal = self.db.get_goal(goal_id, fresh=True)
+        return goal or {}
 
     def get_goal(self, goal_id: str) -> dict[str, Any]:
         """Get goal with all task details (cache-first strategy)."""
@@ -425,11 +443,10 @@ class GoalAgent:
             if not goal:
                 raise ValueError(f"Goal {goal_id} not found")
 
-            result = goal.to_dict()
+            result = goal
 
             # Get all tasks for this goal
-            tasks = self.db.list_tasks(goal_id=goal_id)
-            result["task_details"] = [task.to_dict() for task in tasks]
+            result["task_details"] = self.db.list_tasks(goal_id=goal_id)
 
             # Cache for next time
             self._cache_goal(result)
@@ -445,9 +462,14 @@ class GoalAgent:
             return result
 
     def list_goals(
-        self, status: str | None = None, priority: str | None = None
-    ) -> list[dict[str, Any]]:
-        """List all goals with optional filters from database."""
+        self,
+        status: str | None = None,
+        priority: str | None = None,
+        owner: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """List one page of goals with optional filters, plus the next cursor."""
         with self.lock:
             if status and status not in [
                 "planned",
@@ -462,28 +484,33 @@ class GoalAgent:
                 logger.warning(f"Invalid priority filter: {priority}")
                 priority = None
 
-            goals = self.db.list_goals(status=status, priority=priority)
-            result = [goal.to_dict() for goal in goals]
+            result, next_cursor = self.db.list_goals_page(
+                status=status,
+                priority=priority,
+                owner=owner,
+                limit=limit,
+                cursor=decode_cursor(cursor),
+            )
 
             logger.debug(f"Listed {len(result)} goals from database")
-            return result
+            return result, encode_cursor(next_cursor)
 
     @with_lock
     def update_task_status(
         self, task_id: str, status: str, result: Any | None = None
     ) -> dict[str, Any]:
         """Update task status and result in database."""
-        task = self.db.get_task(task_id)
+        task = self.db.get_task(task_id, fresh=True)
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
         if status not in ["pending", "in_progress", "completed", "failed", "blocked"]:
             raise ValueError(f"Invalid status: {status}")
 
-        old_status = task.status
+        old_status = task["status"]
 
         # Update in database
-        completed_at = datetime.utcnow() if status == "completed" else None
+        completed_at = datetime.now(timezone.utc) if status == "completed" else None
         updated_task = self.db.update_task(
             task_id=task_id,
             status=status,
@@ -496,49 +523,43 @@ class GoalAgent:
 
         logger.info(f"Task {task_id} status: {old_status} -> {status}")
 
-        # Convert to dict and cache
-        task_dict = updated_task.to_dict()
-        self._cache_task(task_dict)
+        self._cache_task(updated_task)
 
         # Check if all tasks in goal are completed
-        goal_id = updated_task.goal_id
+        goal_id = updated_task["goal_id"]
         all_tasks = self.db.list_tasks(goal_id=goal_id)
 
-        if all_tasks and all(t.status == "completed" for t in all_tasks):
+        if all_tasks and all(t["status"] == "completed" for t in all_tasks):
             updated_goal = self.db.update_goal(goal_id, status="completed")
             if updated_goal:
                 logger.info(f"Goal {goal_id} completed")
-                goal_dict = updated_goal.to_dict()
-                self._cache_goal(goal_dict)
+                self._cache_goal(updated_goal)
 
-        return task_dict
+        return updated_task
 
     def get_next_tasks(self, goal_id: str | None = None) -> list[dict[str, Any]]:
         """Get next executable tasks from database."""
         with self.lock:
             if goal_id:
-                goal = self.db.get_goal(goal_id)
+                goal = self.db.get_goal(goal_id, fresh=True)
                 if not goal:
                     raise ValueError(f"Goal {goal_id} not found")
-                tasks_to_check = self.db.list_tasks(goal_id=goal_id)
+                tasks_to_check = self.db.list_tasks(goal_id=goal_id, status="pending")
             else:
-                tasks_to_check = self.db.list_tasks()
+                tasks_to_check = self.db.list_tasks(status="pending")
 
             executable_tasks = []
 
             for task in tasks_to_check:
-                if task.status != "pending":
-                    continue
-
                 # Check if all dependencies are completed
                 dependencies_met = all(
-                    (dep_task := self.db.get_task(dep_id))
-                    and dep_task.status == "completed"
-                    for dep_id in task.dependencies
+                    (dep_task := self.db.get_task(dep_id, fresh=True))
+                    and dep_task["status"] == "completed"
+                    for dep_id in task["dependencies"]
                 )
 
                 if dependencies_met:
-                    executable_tasks.append(task.to_dict())
+                    executable_tasks.append(task)
 
             # Sort by priority
             priority_order = {"high": 0, "medium": 1, "low": 2}
@@ -547,6 +568,21 @@ class GoalAgent:
             logger.debug(f"Found {len(executable_tasks)} executable tasks")
             return executable_tasks
 
+    def claim_next_tasks(
+        self, goal_id: str | None = None, limit: int = 1
+    ) -> list[dict[str, Any]]:
+        """Claim executable tasks for this worker, marking them in_progress."""
+        with self.lock:
+            if goal_id and not self.db.get_goal(goal_id, fresh=True):
+                raise ValueError(f"Goal {goal_id} not found")
+
+            claimed = self.db.claim_next_tasks(limit=limit, goal_id=goal_id)
+            for task in claimed:
+                self._cache_task(task)
+
+            logger.debug(f"Claimed {len(claimed)} tasks")
+            return claimed
+
     def get_task(self, task_id: str) -> dict[str, Any]:
         """Get task details (cache-first strategy)."""
         with self.lock:
@@ -570,7 +606,7 @@ class GoalAgent:
             if not task:
                 raise ValueError(f"Task {task_id} not found")
 
-            result = task.to_dict()
+            result = task
 
             # Cache for next time
             self._cache_task(result)
@@ -595,7 +631,7 @@ class GoalAgent:
             if not tasks:
                 return {
                     "goal_id": goal_id,
-                    "goal_description": goal.description,
+                    "goal_description": goal["description"],
                     "total_tasks": 0,
                     "total_phases": 0,
                     "execution_phases": [],
@@ -616,20 +652,20 @@ class GoalAgent:
                 for task in remaining_tasks[:]:
                     dependencies_met = all(
                         dep_id in completed_task_ids
-                        or dep_id not in [t.id for t in tasks]
-                        for dep_id in task.dependencies
+                        or dep_id not in [t["id"] for t in tasks]
+                        for dep_id in task["dependencies"]
                     )
 
                     if dependencies_met:
-                        phase_tasks.append(task.to_dict())
-                        completed_task_ids.add(task.id)
+                        phase_tasks.append(task)
+                        completed_task_ids.add(task["id"])
                         remaining_tasks.remove(task)
 
                 if not phase_tasks:
                     phases.append(
                         {
                             "phase": len(phases) + 1,
-                            "tasks": [t.to_dict() for t in remaining_tasks],
+                            "tasks": remaining_tasks,
                             "warning": "Circular dependencies detected",
                         }
                     )
@@ -647,7 +683,7 @@ class GoalAgent:
 
             plan = {
                 "goal_id": goal_id,
-                "goal_description": goal.description,
+                "goal_description": goal["description"],
                 "total_tasks": len(tasks),
                 "total_phases": len(phases),
                 "execution_phases": phases,
@@ -724,15 +760,14 @@ class GoalAgent:
     @with_lock
     def delete_task(self, task_id: str) -> dict[str, Any]:
         """Delete a task from database."""
-        task = self.db.get_task(task_id)
+        task = self.db.get_task(task_id, fresh=True)
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
-        goal_id = task.goal_id
+        goal_id = task["goal_id"]
 
         # Check if other tasks depend on this one
-        all_tasks = self.db.list_tasks()
-        dependent_tasks = [t.id for t in all_tasks if task_id in t.dependencies]
+        dependent_tasks = self.db.list_dependent_task_ids(task_id)
 
         if dependent_tasks:
             logger.warning(f"Task {task_id} has dependent tasks: {dependent_tasks}")
@@ -755,13 +790,13 @@ class GoalAgent:
     @with_lock
     def delete_goal(self, goal_id: str) -> dict[str, Any]:
         """Delete a goal and all tasks from database."""
-        goal = self.db.get_goal(goal_id)
+        goal = self.db.get_goal(goal_id, fresh=True)
         if not goal:
             raise ValueError(f"Goal {goal_id} not found")
 
         # Get task IDs before deletion
         tasks = self.db.list_tasks(goal_id=goal_id)
-        task_ids = [t.id for t in tasks]
+        task_ids = [t["id"] for t in tasks]
 
         # Delete from database (cascading will delete tasks automatically)
         self.db.delete_goal(goal_id)
@@ -794,7 +829,7 @@ class GoalAgent:
         metadata: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Update an existing goal in database."""
-        goal = self.db.get_goal(goal_id)
+        goal = self.db.get_goal(goal_id, fresh=True)
         if not goal:
             raise ValueError(f"Goal {goal_id} not found")
 
@@ -823,19 +858,17 @@ class GoalAgent:
         if not updated_goal:
             raise ValueError(f"Failed to update goal {goal_id}")
 
-        # Convert to dict and cache
-        goal_dict = updated_goal.to_dict()
-        self._cache_goal(goal_dict)
+        self._cache_goal(updated_goal)
 
         logger.info(f"Updated goal: {goal_id}")
-        return goal_dict
+        return updated_goal
 
     def get_stats(self) -> dict[str, Any]:
         """Get current statistics from database."""
         with self.lock:
             return {
-                "goals": self.db.get_goal_count(),
-                "tasks": self.db.get_task_count(),
+                "goals": self.db.get_goal_count_estimate(),
+                "tasks": self.db.get_task_count_estimate(),
                 "goal_counter": self.goal_counter,
                 "task_counter": self.task_counter,
                 "cache_enabled": self.cache.is_available(),
@@ -867,11 +900,11 @@ class GoalAgent:
 
 # Initialize database and agent
 try:
-    config = GoalAgentConfig()
+    config = GoalAgentConfig.instance()
     validate_config(config, logger)
 
     # Initialize PostgreSQL database
-    postgres_config = PostgresConfig()
+    postgres_config = PostgresConfig.instance()
     validate_config(postgres_config, logger)
 
     database_url = postgres_config.get_connection_string()
@@ -879,12 +912,21 @@ try:
         database_url=database_url,
         pool_size=postgres_config.pool_size,
         max_overflow=postgres_config.max_overflow,
+        pool_timeout=postgres_config.pool_timeout,
+        application_name="mcp-goal-agent",
     )
 
     # Create tables if they don't exist
     db_manager.create_tables()
     logger.info("Database tables initialized")
 
+    if postgres_config.prewarm:
+        try:
+            blocks = db_manager.prewarm()
+            logger.info(f"Prewarmed {blocks} index blocks into the buffer cache")
+        except Exception as e:
+            logger.warning(f"Index prewarm skipped: {e}")
+
     log_server_startup(
         logger,
         "Goal Agent Server",
@@ -970,12 +1012,24 @@ def get_goal(goal_id: str) -> str:
 
 @mcp.tool()
 @handle_errors(logger)
-def list_goals(status: str | None = None, priority: str | None = None) -> str:
-    """List all goals with optional filters."""
-    goals = agent.list_goals(status, priority)
+def list_goals(
+    status: str | None = None,
+    priority: str | None = None,
+    owner: str | None = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> str:
+    """
+    List goals newest first, one page at a time (owner matches metadata.owner).
+
+    Pass the returned next_cursor back as cursor to get the following page;
+    it is null on the last page.
+    """
+    goals, next_cursor = agent.list_goals(status, priority, owner, limit, cursor)
     result = {
         "goals": goals,
         "count": len(goals),
+        "next_cursor": next_cursor,
         "persistence": "PostgreSQL",
         "cache_enabled": agent.cache.is_available(),
     }
@@ -990,6 +1044,14 @@ def get_next_tasks(goal_id: str | None = None) -> str:
     return json.dumps(tasks, indent=2)
 
 
+@mcp.tool()
+@handle_errors(logger)
+def claim_next_tasks(goal_id: str | None = None, limit: int = 1) -> str:
+    """Claim up to `limit` executable tasks, moving them to in_progress."""
+    tasks = agent.claim_next_tasks(goal_id, limit)
+    return json.dumps(tasks, indent=2)
+
+
 @mcp.tool()
 @handle_errors(logger)
 def update_task_status(task_id: str, status: str, result: str | None = None) -> str:
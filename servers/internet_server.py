@@ -312,7 +312,7 @@ class InternetClient(BaseClient):
 
 # Initialize client
 try:
-    config = InternetConfig()
+    config = InternetConfig.instance()
     validate_config(config, logger)
 
     log_server_startup(
@@ -945,7 +945,7 @@ class JiraClient(BaseClient):
 
 # Initialize client
 try:
-    config = JiraConfig()
+    config = JiraConfig.instance()
     validate_config(config, logger)
 
     log_server_startup(
@@ -508,7 +508,7 @@ class RedisCacheClient:
 
 # Initialize client
 try:
-    config = RedisConfig()
+    config = RedisConfig.instance()
     validate_config(config, logger)
 
     log_server_startup(
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for BaseClient's httpx transport
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers import base_client
+from servers.base_client import BaseClient
+
+
+def make_client(handler, max_retries=3):
+    """A BaseClient on the httpx transport whose requests go to ``handler``."""
+
+    class MockTransportClient(BaseClient):
+        def _create_httpx_transport(self):
+            return httpx.MockTransport(handler)
+
+    return MockTransportClient(
+        "https://api.example.com", max_retries=max_retries, transport="httpx"
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    """Record retry delays instead of sleeping."""
+    delays = []
+    monkeypatch.setattr(base_client.time, "sleep", delays.append)
+    return delays
+
+
+def test_httpx_follows_redirects():
+    """Test that 3xx responses are followed like the requests transport does."""
+
+    def handler(request):
+        if request.url.path == "/old":
+            return httpx.Response(301, headers={"Location": "/new"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    with make_client(handler) as client:
+        assert client.get("/old").json() == {"path": "/new"}
+
+
+def test_httpx_error_status_raises_http_error():
+    """Test that 4xx responses raise requests' HTTPError with the parsed message."""
+
+    def handler(request):
+        return httpx.Response(404, json={"message": "Issue does not exist"})
+
+    with make_client(handler) as client:
+        with pytest.raises(requests.exceptions.HTTPError) as excinfo:
+            client.get("/issue/X-1")
+
+    assert str(excinfo.value) == "404 - Issue does not exist"
+    assert excinfo.value.response.status_code == 404
+
+
+def test_httpx_retries_retryable_statuses(no_backoff_sleep):
+    """Test that 429/5xx responses are retried with backoff, then raise."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        if len(calls) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"ok": True})
+
+    with make_client(handler) as client:
+        assert client.post("/search").json() == {"ok": True}
+    assert no_backoff_sleep == [2.0, 1.0]
+
+    with make_client(lambda request: httpx.Response(500), max_retries=2) as client:
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get("/flaky")
+    assert len(no_backoff_sleep) == 4
+
+
+def test_httpx_transport_errors_map_to_requests():
+    """Test that httpx timeouts and connection errors surface as requests ones."""
+
+    def timeout(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    def refused(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    with make_client(timeout) as client:
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get("/slow")
+    with make_client(refused) as client:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get("/down")
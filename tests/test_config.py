@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for MCP server configuration helpers
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.config import (
+    CacheServerConfig,
+    ConfigurationError,
+    InternetConfig,
+    JiraConfig,
+    is_valid_url,
+    validate_config,
+)
+
+
+def test_is_valid_url_accepts_http_hosts():
+    """Test that domains, localhost and IPs with optional ports are accepted."""
+    assert is_valid_url("https://example.atlassian.net")
+    assert is_valid_url("http://localhost:8001")
+    assert is_valid_url("http://192.168.1.10:8000/api?x=1")
+    assert is_valid_url("http://[::1]:8080/")
+
+
+def test_is_valid_url_rejects_malformed():
+    """Test that other schemes, missing hosts and bad ports are rejected."""
+    assert not is_valid_url("")
+    assert not is_valid_url("ftp://example.com")
+    assert not is_valid_url("https://")
+    assert not is_valid_url("http://example.com:notaport")
+    assert not is_valid_url("http://intranet")
+    assert not is_valid_url("http://example.com/a path")
+
+
+def test_required_fields_validation():
+    """Test that validate() reports the class-level required fields."""
+    is_valid, errors = InternetConfig(google_api_key="", search_engine_id="").validate()
+    assert not is_valid
+    assert errors == [
+        "Missing required field: google_api_key",
+        "Missing required field: search_engine_id",
+    ]
+
+    assert CacheServerConfig(url="", enabled=False).validate() == (True, [])
+    assert not CacheServerConfig(url="", enabled=True).validate()[0]
+
+
+def test_to_dict_returns_public_fields():
+    """Test that to_dict() serializes every dataclass field of the subclass."""
+    config = CacheServerConfig(url="http://localhost:8001", timeout=3, enabled=True)
+    assert config.to_dict() == {
+        "url": "http://localhost:8001",
+        "timeout": 3,
+        "enabled": True,
+    }
+    assert InternetConfig().to_dict().keys() == {
+        "google_api_key",
+        "search_engine_id",
+        "timeout",
+        "max_retries",
+    }
+
+
+def test_validate_config_raises_with_errors():
+    """Test that validate_config raises ConfigurationError listing each error."""
+    with pytest.raises(ConfigurationError) as exc_info:
+        validate_config(InternetConfig(google_api_key="", search_engine_id=""))
+
+    assert exc_info.value.errors == [
+        "Missing required field: google_api_key",
+        "Missing required field: search_engine_id",
+    ]
+    assert str(exc_info.value) == (
+        "Configuration validation failed:\n"
+        "  - Missing required field: google_api_key\n"
+        "  - Missing required field: search_engine_id"
+    )
+
+    assert str(ConfigurationError("custom message")) == "custom message"
+
+
+def test_config_reads_environment(monkeypatch):
+    """Test that configs read env vars at construction and honour overrides."""
+    monkeypatch.setenv("CACHE_SERVER_URL", "http://cache.local:9000/")
+    monkeypatch.setenv("CACHE_SERVER_TIMEOUT", "12")
+    monkeypatch.setenv("CACHE_ENABLED", "no")
+
+    config = CacheServerConfig()
+    assert config.url == "http://cache.local:9000"
+    assert config.timeout == 12
+    assert config.enabled is False
+
+    config = CacheServerConfig(timeout=1, enabled=True)
+    assert config.timeout == 1
+    assert config.enabled is True
+
+
+def test_env_fields_are_read_on_first_access(monkeypatch):
+    """Test that unvalidated fields read their env var lazily, then keep it."""
+    monkeypatch.setenv("CACHE_SERVER_TIMEOUT", "7")
+    config = CacheServerConfig()
+    monkeypatch.setenv("CACHE_SERVER_TIMEOUT", "9")
+    assert config.timeout == 9
+
+    monkeypatch.setenv("CACHE_SERVER_TIMEOUT", "11")
+    assert config.timeout == 9
+    assert config.to_dict()["timeout"] == 9
+
+
+def test_bool_env_vars_only_accept_true(monkeypatch):
+    """Test that boolean env vars are enabled by "true" (any case) only."""
+    for value, expected in [
+        ("true", True),
+        ("TRUE", True),
+        ("1", False),
+        ("on", False),
+    ]:
+        monkeypatch.setenv("CACHE_ENABLED", value)
+        assert CacheServerConfig().enabled is expected
+
+
+def test_jira_config_requires_https():
+    """Test that JiraConfig validates the base URL and requires HTTPS."""
+    config = JiraConfig(base_url="https://team.atlassian.net/", email="a@b.co")
+    assert config.base_url == "https://team.atlassian.net"
+
+    with pytest.raises(ValueError, match="must use HTTPS"):
+        JiraConfig(base_url="http://team.atlassian.net")
+    with pytest.raises(ValueError, match="Invalid JIRA_BASE_URL"):
+        JiraConfig(base_url="https://")
+    with pytest.raises(ValueError, match="Invalid JIRA_EMAIL"):
+        JiraConfig(base_url="https://team.atlassian.net", email="nobody")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the goal/task database layer (run against SQLite)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, update
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.database import (
+    DatabaseManager,
+    GoalModel,
+    TaskModel,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A DatabaseManager on a fresh SQLite file with one goal."""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'goals.db'}")
+    manager.create_tables()
+    manager.create_goal("G1", "Ship it", "medium", [], {})
+    yield manager
+    manager.close()
+
+
+def test_task_pages_follow_cursor(db):
+    """Test that keyset pages cover every task once, even with tied timestamps."""
+    for i in range(5):
+        db.create_task(f"T{i}", "G1", f"Task {i}", "code", "medium", [])
+    with db.get_session() as session:
+        # One statement, so every row gets the same server-side now()
+        session.execute(update(TaskModel).values(created_at=func.now()))
+
+    seen = []
+    cursor = None
+    for _ in range(5):  # Bounded, so a cursor that repeats a page fails fast
+        rows, next_cursor = db.list_tasks_page(limit=2, cursor=cursor)
+        seen.extend(row["id"] for row in rows)
+        if next_cursor is None:
+            break
+        # Round-trip through the opaque string the API hands out
+        cursor = decode_cursor(encode_cursor(next_cursor))
+        assert cursor == next_cursor
+
+    assert seen == ["T4", "T3", "T2", "T1", "T0"]
+    assert seen == [task["id"] for task in db.list_tasks()]
+
+
+def test_goal_pages_follow_cursor(db):
+    """Test that goal pages end with a None cursor and skip no rows."""
+    db.create_goal("G2", "Second", "low", [], {})
+    with db.get_session() as session:
+        session.execute(update(GoalModel).values(created_at=func.now()))
+
+    first, cursor = db.list_goals_page(limit=1)
+    second, last = db.list_goals_page(limit=1, cursor=cursor)
+
+    assert [goal["id"] for goal in first + second] == ["G2", "G1"]
+    assert last is None
+
+
+def test_page_limit_must_be_positive(db):
+    """Test that a non-positive page size is rejected."""
+    with pytest.raises(ValueError):
+        db.list_tasks_page(limit=0)
+
+
+def test_claim_next_tasks_marks_tasks_in_progress(db):
+    """Test that claimed tasks come back in queue order and leave the queue."""
+    db.create_task("T1", "G1", "Low", "code", "low", [])
+    db.create_task("T2", "G1", "High", "code", "high", [])
+
+    claimed = db.claim_next_tasks()
+
+    assert [task["id"] for task in claimed] == ["T2"]
+    assert claimed[0]["status"] == "in_progress"
+    assert db.get_task("T2")["status"] == "in_progress"
+    assert db.get_task("T1")["status"] == "pending"
+
+
+def test_claim_next_tasks_respects_limit_and_dependencies(db):
+    """Test that at most ``limit`` ready tasks are claimed."""
+    db.create_task("T1", "G1", "First", "code", "medium", [])
+    db.create_task("T2", "G1", "Blocked", "code", "high", ["T1"])
+    db.create_task("T3", "G1", "Second", "code", "medium", [])
+    db.create_task("T4", "G1", "Third", "code", "medium", [])
+
+    claimed = db.claim_next_tasks(limit=2)
+    assert [task["id"] for task in claimed] == ["T1", "T3"]
+
+    # T2 still waits on T1, so only T4 is left to claim
+    assert [task["id"] for task in db.claim_next_tasks(limit=5)] == ["T4"]
+
+
+def test_claim_next_tasks_empty_queue(db):
+    """Test that claiming from an empty or exhausted queue returns no tasks."""
+    assert db.claim_next_tasks() == []
+
+    db.create_task("T1", "G1", "Only", "code", "medium", [])
+    assert len(db.claim_next_tasks(goal_id="G1")) == 1
+    assert db.claim_next_tasks(goal_id="G1") == []
+
+
+def test_fresh_reads_skip_entity_cache(db, tmp_path):
+    """Test that fresh=True sees writes made through another manager."""
+    db.create_task("T1", "G1", "Task", "code", "medium", [])
+    assert db.get_task("T1")["status"] == "pending"
+
+    other = DatabaseManager(f"sqlite:///{tmp_path / 'goals.db'}")
+    other.update_task("T1", status="completed")
+    assert db.get_task("T1", fresh=True)["status"] == "completed"
+
+    other.delete_goal("G1")
+    other.close()
+    assert db.get_goal("G1", fresh=True) is None
+    assert db.get_task("T1", fresh=True) is None
+    # The cached copies are dropped along with the rows
+    assert db.get_goal("G1") is None
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the file system server client
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from servers.file_server import FileSystemClient
+
+
+@pytest.fixture
+def client(tmp_path):
+    """A client restricted to a temporary directory."""
+    return FileSystemClient(allowed_paths=[str(tmp_path)])
+
+
+def test_read_file_sees_write_file_changes(client, tmp_path):
+    """Test that a cached read is not served after write_file changes the file."""
+    path = tmp_path / "notes.txt"
+    client.write_file(str(path), "first")
+    assert client.read_file(str(path))["content"] == "first"
+
+    client.write_file(str(path), "second version")
+    assert client.read_file(str(path))["content"] == "second version"
+
+
+def test_read_file_sees_same_size_external_edit(client, tmp_path):
+    """Test that an external edit keeping the size still invalidates the cache."""
+    path = tmp_path / "config.ini"
+    path.write_text("a=1")
+    stat = path.stat()
+    assert client.read_file(str(path))["content"] == "a=1"
+
+    path.write_text("a=2")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert client.read_file(str(path))["content"] == "a=2"
+
+
+def test_read_file_cache_hits_return_copies(client, tmp_path):
+    """Test that mutating a returned result does not affect later reads."""
+    path = tmp_path / "data.txt"
+    path.write_text("data")
+
+    result = client.read_file(str(path))
+    result["metadata"]["size"] = -1
+    assert client.read_file(str(path))["metadata"]["size"] == 4
+
+
+def test_read_file_cache_size_bound(client, tmp_path):
+    """Test that cached bytes stay within the limit, evicting the oldest."""
+    client._read_cache_max_bytes = 10
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (tmp_path / name).write_text("x" * 4)
+        client.read_file(str(tmp_path / name))
+
+    assert client._read_cache_bytes == 8
+    assert [key[0] for key in client._read_cache] == [
+        str((tmp_path / "b.txt").resolve()),
+        str((tmp_path / "c.txt").resolve()),
+    ]
+
+    # Files larger than the whole cache are read but never stored
+    (tmp_path / "big.txt").write_text("x" * 11)
+    assert client.read_file(str(tmp_path / "big.txt"))["content"] == "x" * 11
+    assert client._read_cache_bytes == 8